@@ -0,0 +1,143 @@
+"""Allocation benchmark for the model-output-to-wire audio path.
+
+Follows one chunk from a model output tensor through host conversion,
+encoding and ``AudioChunk`` serialization. Each step is measured on its
+own with ``tracemalloc``, so the report counts the buffer allocations per
+chunk and the bytes they add up to. The same chunk also goes through the
+previous copy-per-step path, for comparison. Memory that protobuf
+allocates inside its C runtime is not visible to ``tracemalloc``.
+
+Usage:
+    python -m benchmarks.bench_audio_path --seconds 10 --channels 2 --max-allocations 2
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import torch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src", "grpc_generated"))
+
+from src.audio_buffer import as_float32, byte_view, to_host
+from src.audio_codec import AudioEncoding, _to_pcm16
+
+# Steps allocating less than this fraction of the payload are bookkeeping
+_MIN_BUFFER_FRACTION = 0.01
+
+
+def _message(data: bytes):
+    from src.grpc_generated import worker_pb2
+    
+    return worker_pb2.AudioChunk(audio_data=data, sample_rate=32000)
+
+
+def _serialize(message) -> bytes:
+    return message.SerializeToString()
+
+
+def _steps(encoding: AudioEncoding) -> list:
+    """The current path, one step per potential allocation."""
+    if encoding == AudioEncoding.FLOAT32:
+        encode = [as_float32, lambda a: bytes(byte_view(a))]
+    else:
+        encode = [_to_pcm16, lambda a: bytes(byte_view(a))]
+    return [to_host, *encode, _message, _serialize]
+
+
+def _legacy_steps(encoding: AudioEncoding) -> list:
+    """The path before the zero-copy buffer helpers."""
+    if encoding == AudioEncoding.FLOAT32:
+        encode = [lambda a: a.astype(np.float32), lambda a: a.tobytes()]
+    else:
+        encode = [
+            lambda a: np.clip(a, -1.0, 1.0),
+            lambda a: a * 32767,
+            lambda a: a.astype(np.int16),
+            lambda a: a.tobytes(),
+        ]
+    return [lambda t: t.cpu().numpy(), *encode, _message, _serialize]
+
+
+def _run(steps: list, wav: torch.Tensor):
+    value = wav
+    for step in steps:
+        value = step(value)
+    return value
+
+
+def _measure(steps: list, wav: torch.Tensor, iterations: int) -> dict:
+    payload = len(_run(steps, wav))  # also warms staging buffers and imports
+    
+    tracemalloc.start()
+    per_step = np.zeros((iterations, len(steps)))
+    for i in range(iterations):
+        value = wav
+        for j, step in enumerate(steps):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            value = step(value)
+            per_step[i, j] = tracemalloc.get_traced_memory()[1] - before
+        del value
+    tracemalloc.stop()
+    
+    started = time.perf_counter()
+    for _ in range(iterations):
+        _run(steps, wav)
+    elapsed = time.perf_counter() - started
+    
+    step_bytes = np.median(per_step, axis=0)
+    return {
+        "allocations_per_chunk": int((step_bytes >= _MIN_BUFFER_FRACTION * payload).sum()),
+        "allocated_bytes_per_chunk": float(step_bytes.sum()),
+        "payload_bytes": payload,
+        "us_per_chunk": elapsed / iterations * 1e6,
+    }
+
+
+def run_benchmark(
+    seconds: float = 10.0,
+    channels: int = 2,
+    sample_rate: int = 32000,
+    iterations: int = 20,
+) -> dict:
+    wav = torch.rand(channels, int(seconds * sample_rate)) * 2 - 1
+    
+    results = {"chunk_seconds": seconds, "channels": channels, "encodings": {}}
+    for encoding in (AudioEncoding.FLOAT32, AudioEncoding.PCM16):
+        current = _measure(_steps(encoding), wav, iterations)
+        legacy = _measure(_legacy_steps(encoding), wav, iterations)
+        results["encodings"][encoding.name.lower()] = {
+            **current,
+            **{f"legacy_{k}": v for k, v in legacy.items() if k != "payload_bytes"},
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MusicForge audio path allocation benchmark")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Audio seconds per chunk")
+    parser.add_argument("--channels", type=int, default=2)
+    parser.add_argument("--sample-rate", type=int, default=32000)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--max-allocations", type=int, default=None,
+                        help="Exit non-zero if any encoding allocates more buffers per chunk")
+    parser.add_argument("--out", default=None, help="Optional JSON output path")
+    args = parser.parse_args()
+    
+    results = run_benchmark(args.seconds, args.channels, args.sample_rate, args.iterations)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+    print(json.dumps(results, indent=2))
+    
+    worst = max(r["allocations_per_chunk"] for r in results["encodings"].values())
+    if args.max_allocations is not None and worst > args.max_allocations:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
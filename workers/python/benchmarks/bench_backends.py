@@ -0,0 +1,220 @@
+"""Speed and quality of the CPU inference backends.
+
+Runs the same input through each ``MUSICFORGE_INFERENCE_BACKEND`` and
+reports the real-time factor (audio seconds per compute second, as the
+``musicforge_realtime_factor`` metric; higher is faster) next to how far
+the output drifts from eager fp32:
+
+- ``musicgen``: teacher-forced next-token logits on codes from a fixed
+  generation, as top-1 agreement and mean KL divergence from eager.
+- ``demucs``: signal-to-noise ratio of each backend's stems against the
+  eager stems, in dB.
+- ``tiny``: a small randomly initialised transformer decoder with the
+  same comparison as ``musicgen``, for exercising the harness without
+  model downloads.
+
+The first call of each backend is reported separately, as ``compiled``
+spends it tracing and compiling.
+
+Usage:
+    python -m benchmarks.bench_backends --model musicgen --seconds 8 --out backends.json
+"""
+import argparse
+import copy
+import json
+import time
+from typing import Any, Callable, NamedTuple
+
+import torch
+from torch import nn
+
+from src.components.backends import apply_backend, inference_context, resolve_backend
+from src.config import InferenceBackend
+
+DEVICE = "cpu"
+
+
+class Case(NamedTuple):
+    """A model to compare, and how to drive it."""
+    module: nn.Module                      # eager reference, copied per backend
+    audio_seconds: float
+    render: Callable[[nn.Module], Any]     # the timed workload
+    outputs: Callable[[nn.Module], torch.Tensor]  # compared against eager
+    compare: Callable[[torch.Tensor, torch.Tensor], dict]
+
+
+def logits_drift(reference: torch.Tensor, candidate: torch.Tensor) -> dict:
+    reference, candidate = reference.float(), candidate.float()
+    agreement = (reference.argmax(-1) == candidate.argmax(-1)).float().mean()
+    kl = torch.nn.functional.kl_div(
+        candidate.log_softmax(-1), reference.log_softmax(-1), log_target=True, reduction="none"
+    ).sum(-1).mean()
+    return {"top1_agreement": float(agreement), "kl_divergence": float(kl)}
+
+
+def snr_db(reference: torch.Tensor, candidate: torch.Tensor) -> dict:
+    reference, candidate = reference.float(), candidate.float()
+    noise = (reference - candidate).pow(2).sum().clamp_min(1e-20)
+    return {"snr_db": float(10 * torch.log10(reference.pow(2).sum() / noise))}
+
+
+class TinyBlock(nn.Module):
+    """Pre-norm causal self-attention and feed-forward block."""
+    
+    def __init__(self, dim: int):
+        super().__init__()
+        self.norm1 = nn.LayerNorm(dim)
+        self.attn = nn.MultiheadAttention(dim, num_heads=4, batch_first=True)
+        self.norm2 = nn.LayerNorm(dim)
+        self.mlp = nn.Sequential(nn.Linear(dim, 4 * dim), nn.GELU(), nn.Linear(4 * dim, dim))
+    
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        mask = nn.Transformer.generate_square_subsequent_mask(x.shape[1])
+        h = self.norm1(x)
+        x = x + self.attn(h, h, h, attn_mask=mask, need_weights=False)[0]
+        return x + self.mlp(self.norm2(x))
+
+
+class TinyDecoder(nn.Module):
+    """Token decoder shaped like a (very) small MusicGen language model."""
+    
+    frame_rate = 50
+    
+    def __init__(self, vocab: int = 256, dim: int = 128, layers: int = 2):
+        super().__init__()
+        self.embed = nn.Embedding(vocab, dim)
+        self.blocks = nn.Sequential(*[TinyBlock(dim) for _ in range(layers)])
+        self.head = nn.Linear(dim, vocab)
+    
+    def forward(self, tokens: torch.Tensor) -> torch.Tensor:
+        return self.head(self.blocks(self.embed(tokens)))
+
+
+def tiny_case(seconds: float) -> Case:
+    torch.manual_seed(0)
+    model = TinyDecoder().eval()
+    tokens = torch.randint(0, 256, (1, int(seconds * TinyDecoder.frame_rate)))
+    return Case(model, seconds, lambda m: m(tokens), lambda m: m(tokens), logits_drift)
+
+
+def musicgen_case(seconds: float, size: str = "small") -> Case:
+    from audiocraft.models import MusicGen
+    
+    model = MusicGen.get_pretrained(f"facebook/musicgen-{size}", device=DEVICE)
+    model.set_generation_params(duration=seconds, use_sampling=False)
+    descriptions = ["lofi hip hop beat with mellow piano"]
+    
+    with torch.no_grad():
+        attributes, _ = model._prepare_tokens_and_attributes(descriptions, None)
+        codes, _ = model.compression_model.encode(model.generate(descriptions))
+    
+    def swapped(lm: nn.Module, fn: Callable):
+        original, model.lm = model.lm, lm
+        try:
+            return fn()
+        finally:
+            model.lm = original
+    
+    def render(lm: nn.Module):
+        return swapped(lm, lambda: model.generate(descriptions))
+    
+    def outputs(lm: nn.Module) -> torch.Tensor:
+        return lm.compute_predictions(codes, copy.deepcopy(attributes)).logits
+    
+    return Case(model.lm, seconds, render, outputs, logits_drift)
+
+
+def demucs_case(seconds: float) -> Case:
+    from demucs.apply import BagOfModels, apply_model
+    from demucs.pretrained import get_model
+    
+    model = get_model("htdemucs")
+    if isinstance(model, BagOfModels):
+        model = model.models[0]
+    model.eval()
+    
+    torch.manual_seed(0)
+    mix = 0.1 * torch.randn(1, model.audio_channels, int(seconds * model.samplerate))
+    
+    def separate(m: nn.Module) -> torch.Tensor:
+        return apply_model(m, mix, device=DEVICE, progress=False)
+    
+    return Case(model, seconds, separate, separate, snr_db)
+
+
+CASES = {"tiny": tiny_case, "musicgen": musicgen_case, "demucs": demucs_case}
+
+
+def _measure(case: Case, backend: InferenceBackend, iterations: int) -> tuple[dict, torch.Tensor]:
+    module = copy.deepcopy(case.module)
+    apply_backend(module, backend)
+    
+    with torch.no_grad(), inference_context(backend, DEVICE):
+        started = time.perf_counter()
+        case.render(module)
+        first_call = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        for _ in range(iterations):
+            case.render(module)
+        elapsed = (time.perf_counter() - started) / iterations
+        
+        outputs = case.outputs(module)
+    
+    return {
+        "first_call_seconds": first_call,
+        "seconds_per_run": elapsed,
+        "realtime_factor": case.audio_seconds / elapsed,
+    }, outputs
+
+
+def run_benchmark(
+    model: str = "tiny",
+    seconds: float = 8.0,
+    iterations: int = 3,
+    backends: list[InferenceBackend] | None = None,
+) -> dict:
+    case = CASES[model](seconds)
+    backends = backends or list(InferenceBackend)
+    
+    results = {"model": model, "audio_seconds": seconds, "threads": torch.get_num_threads(), "backends": {}}
+    reference = None
+    for requested in [InferenceBackend.EAGER, *[b for b in backends if b != InferenceBackend.EAGER]]:
+        backend = resolve_backend(requested, DEVICE)
+        if backend != requested:
+            results["backends"][requested.value] = {"skipped": "unsupported on this CPU"}
+            continue
+        
+        timings, outputs = _measure(case, backend, iterations)
+        if reference is None:
+            reference = outputs
+        if requested in backends:
+            results["backends"][requested.value] = {**timings, **case.compare(reference, outputs)}
+    
+    eager = results["backends"].get(InferenceBackend.EAGER.value)
+    for stats in results["backends"].values():
+        if eager and "realtime_factor" in stats:
+            stats["speedup_vs_eager"] = stats["realtime_factor"] / eager["realtime_factor"]
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MusicForge inference backend benchmark")
+    parser.add_argument("--model", choices=sorted(CASES), default="tiny")
+    parser.add_argument("--seconds", type=float, default=8.0, help="Audio seconds per run")
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--backends", nargs="+", default=None,
+                        choices=[b.value for b in InferenceBackend])
+    parser.add_argument("--out", default=None, help="Optional JSON output path")
+    args = parser.parse_args()
+    
+    backends = [InferenceBackend(b) for b in args.backends] if args.backends else None
+    results = run_benchmark(args.model, args.seconds, args.iterations, backends)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
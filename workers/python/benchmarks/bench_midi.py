@@ -0,0 +1,56 @@
+"""Micro-benchmark for the theory MIDI writer.
+
+Times ``render_progression`` over the default song structure and reports
+microseconds per bar; ``GenerateTheory`` calls it on the request path.
+
+Usage:
+    python -m benchmarks.bench_midi --bars 64 --iterations 2000 --max-us-per-bar 100
+"""
+import argparse
+import json
+import sys
+import time
+
+from src.components.midi_writer import render_progression
+from src.components.theory_engine import TheoryEngine
+
+
+def run_benchmark(bars: int = 64, iterations: int = 1000, tempo_bpm: int = 120) -> dict:
+    engine = TheoryEngine()
+    chords = ["C", "Am7", "Fmaj7", "G7"]
+    sections = engine.generate_sections(duration_bars=bars)
+    rendered_bars = sum(s["duration_bars"] for s in sections)
+    
+    render_progression(chords, sections, tempo_bpm)  # warm the event caches
+    started = time.perf_counter()
+    for _ in range(iterations):
+        data = render_progression(chords, sections, tempo_bpm)
+    elapsed = time.perf_counter() - started
+    
+    per_render = elapsed / iterations
+    return {
+        "bars": rendered_bars,
+        "bytes": len(data),
+        "us_per_render": per_render * 1e6,
+        "us_per_bar": per_render * 1e6 / rendered_bars,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MusicForge MIDI writer benchmark")
+    parser.add_argument("--bars", type=int, default=64, help="Song length passed to generate_sections")
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--tempo", type=int, default=120)
+    parser.add_argument("--max-us-per-bar", type=float, default=None,
+                        help="Exit non-zero if rendering is slower than this")
+    args = parser.parse_args()
+    
+    results = run_benchmark(args.bars, args.iterations, args.tempo)
+    print(json.dumps(results, indent=2))
+    
+    if args.max_us_per_bar is not None and results["us_per_bar"] > args.max_us_per_bar:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
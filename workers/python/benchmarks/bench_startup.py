@@ -0,0 +1,126 @@
+"""Cold-start benchmark for the worker process.
+
+Measures, in fresh interpreters, how long ``import src.server`` takes and
+which heavy frameworks it pulls in, then how long a real worker process
+takes to answer its first ``HealthCheck`` and to report ``ready``.
+
+Usage:
+    python -m benchmarks.bench_startup --runs 5 --max-import-ms 1500 \\
+        --out bench_startup.json
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import grpc
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src", "grpc_generated"))
+
+WORKER_ROOT = os.path.join(os.path.dirname(__file__), "..")
+HEAVY_MODULES = ("torch", "music21", "audiocraft", "bark", "demucs")
+
+_IMPORT_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import src.server
+elapsed = time.perf_counter() - started
+print(json.dumps({"seconds": elapsed,
+                  "heavy": [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+
+def measure_import(runs: int = 3) -> dict:
+    """Time ``import src.server`` in ``runs`` fresh interpreters."""
+    samples = []
+    heavy: set[str] = set()
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", _IMPORT_PROBE],
+            cwd=WORKER_ROOT, check=True, capture_output=True, text=True,
+        )
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        samples.append(result["seconds"])
+        heavy.update(result["heavy"])
+    
+    return {
+        "import_seconds": {"min": min(samples), "median": statistics.median(samples)},
+        "heavy_modules_imported": sorted(heavy),
+    }
+
+
+def measure_time_to_health(timeout: float = 120.0) -> dict:
+    """Start a worker process and time its first HealthCheck and readiness."""
+    from google.protobuf import empty_pb2
+    
+    from src.grpc_generated import worker_pb2_grpc
+    
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "src.server", "--port", str(port)],
+        cwd=WORKER_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    first_health = None
+    ready = None
+    try:
+        while ready is None and time.perf_counter() - started < timeout:
+            # A fresh channel per poll, so gRPC's reconnect backoff doesn't
+            # overstate how long the worker took to bind.
+            with grpc.insecure_channel(f"127.0.0.1:{port}") as channel:
+                try:
+                    response = worker_pb2_grpc.MusicWorkerStub(channel).HealthCheck(
+                        empty_pb2.Empty(), timeout=1.0
+                    )
+                except grpc.RpcError:
+                    time.sleep(0.05)
+                    continue
+            now = time.perf_counter() - started
+            if first_health is None:
+                first_health = now
+            if response.readiness == "ready":
+                ready = now
+            else:
+                time.sleep(0.05)
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+    
+    return {"time_to_first_health_seconds": first_health, "time_to_ready_seconds": ready}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MusicForge worker cold-start benchmark")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters for the import timing")
+    parser.add_argument("--skip-process", action="store_true",
+                        help="Only measure import time, do not start a worker")
+    parser.add_argument("--max-import-ms", type=float, default=None,
+                        help="Exit non-zero if the median import time exceeds this")
+    parser.add_argument("--out", default="bench_startup.json", help="JSON output path")
+    args = parser.parse_args()
+    
+    results = measure_import(args.runs)
+    if not args.skip_process:
+        results.update(measure_time_to_health())
+    
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(json.dumps(results, indent=2))
+    
+    too_slow = (
+        args.max_import_ms is not None
+        and results["import_seconds"]["median"] * 1000 > args.max_import_ms
+    )
+    if too_slow or results["heavy_modules_imported"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
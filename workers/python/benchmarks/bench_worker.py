@@ -0,0 +1,211 @@
+"""End-to-end serving benchmark over a real local gRPC channel.
+
+Drives ``MusicWorkerServicer`` with stub models at a configurable cost and
+reports throughput, latency percentiles, time to first chunk, peak RSS and
+bytes on the wire.
+
+Usage:
+    python -m benchmarks.bench_worker --rpc audio --requests 32 --concurrency 8 \\
+        --out bench_results.json
+"""
+import argparse
+import asyncio
+import functools
+import json
+import os
+import resource
+import sys
+import time
+from dataclasses import asdict, dataclass
+
+import grpc
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src", "grpc_generated"))
+
+from benchmarks.stubs import StubBarkWrapper, StubDemucsWrapper, StubMusicGenWrapper, stub_models
+from src.process_pool import WorkerPool
+from src.server import MusicWorkerServicer
+
+RPCS = ("audio", "vocals", "stems", "arrangement", "theory")
+
+# Pop song layout for ``arrangement``, in bars; the tempo stretches it to duration_seconds
+SONG_SECTIONS = [("intro", 4), ("verse", 8), ("chorus", 8), ("verse", 8), ("chorus", 8), ("outro", 4)]
+ENCODINGS = {"float32": 0, "pcm16": 1, "flac": 2}
+
+
+@dataclass
+class BenchmarkConfig:
+    rpc: str = "audio"
+    requests: int = 16
+    concurrency: int = 4
+    duration_seconds: int = 20
+    cost: float = 0.01
+    encoding: str = "float32"
+    unique_prompts: bool = True
+    worker_processes: int = 0
+
+
+def _percentiles(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {"p50": float(p50), "p95": float(p95), "p99": float(p99)}
+
+
+def _build_call(stub, worker_pb2, config: BenchmarkConfig):
+    """Return a coroutine factory that issues one request and yields response messages."""
+    encoding = ENCODINGS[config.encoding]
+    track = np.sin(np.linspace(0, 2000, 44100 * config.duration_seconds, dtype=np.float32))
+    track_bytes = track.tobytes()
+    
+    def call(index: int):
+        suffix = f" #{index}" if config.unique_prompts else ""
+        if config.rpc == "audio":
+            return stub.SynthesizeAudio(worker_pb2.AudioRequest(
+                prompt=f"warm analog synth pad{suffix}",
+                duration_seconds=config.duration_seconds,
+                genre="ambient",
+                energy_level=0.4,
+                encoding=encoding,
+            ))
+        if config.rpc == "vocals":
+            lyric = "We are running through the night, chasing every light. " * max(
+                1, config.duration_seconds // 4
+            )
+            return stub.SynthesizeVocals(worker_pb2.VocalRequest(
+                lyrics=lyric + suffix, voice_type="female", encoding=encoding,
+            ))
+        if config.rpc == "arrangement":
+            bars = sum(b for _, b in SONG_SECTIONS)
+            sections, start = [], 0
+            for name, length in SONG_SECTIONS:
+                sections.append(worker_pb2.Section(
+                    name=name, start_bar=start, duration_bars=length, energy_level=0.5, elements=["synth"],
+                ))
+                start += length
+            return stub.RenderArrangement(worker_pb2.ArrangementRequest(
+                prompt=f"upbeat synth pop{suffix}",
+                genre="pop",
+                tempo_bpm=max(1, round(bars * 4 * 60 / config.duration_seconds)),
+                sections=sections,
+                encoding=encoding,
+            ))
+        if config.rpc == "stems":
+            return stub.SeparateStemsStream(worker_pb2.StemRequest(
+                audio_data=track_bytes, sample_rate=44100, channels=1, encoding=encoding,
+            ))
+        return stub.GenerateTheory(worker_pb2.TheoryRequest(
+            genre="pop", key="C major", tempo_bpm=120,
+        ))
+    
+    return call
+
+
+async def run_benchmark(config: BenchmarkConfig) -> dict:
+    """Serve stub models on a local port and drive them with concurrent clients."""
+    from src.grpc_generated import worker_pb2, worker_pb2_grpc
+    
+    pool = None
+    if config.worker_processes:
+        pool = WorkerPool(config.worker_processes, functools.partial(stub_models, config.cost))
+        pool.start()
+    servicer = MusicWorkerServicer(
+        musicgen=StubMusicGenWrapper(config.cost),
+        bark=StubBarkWrapper(config.cost),
+        demucs=StubDemucsWrapper(config.cost),
+        pool=pool,
+    )
+    options = [
+        ("grpc.max_send_message_length", 256 * 1024 * 1024),
+        ("grpc.max_receive_message_length", 256 * 1024 * 1024),
+    ]
+    server = grpc.aio.server(options=options)
+    worker_pb2_grpc.add_MusicWorkerServicer_to_server(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    if pool is not None:
+        # Keep worker start-up out of the measured latencies.
+        await pool.preload(["musicgen", "bark", "demucs"])
+    
+    latencies: list[float] = []
+    first_chunks: list[float] = []
+    wire_bytes = 0
+    semaphore = asyncio.Semaphore(config.concurrency)
+    
+    try:
+        async with grpc.aio.insecure_channel(f"127.0.0.1:{port}", options=options) as channel:
+            call = _build_call(worker_pb2_grpc.MusicWorkerStub(channel), worker_pb2, config)
+            
+            async def one(index: int) -> None:
+                nonlocal wire_bytes
+                async with semaphore:
+                    started = time.perf_counter()
+                    response = call(index)
+                    if config.rpc == "theory":
+                        message = await response
+                        wire_bytes += message.ByteSize()
+                        first_chunks.append(time.perf_counter() - started)
+                    else:
+                        first = True
+                        async for message in response:
+                            if first:
+                                first_chunks.append(time.perf_counter() - started)
+                                first = False
+                            wire_bytes += message.ByteSize()
+                    latencies.append(time.perf_counter() - started)
+            
+            wall_started = time.perf_counter()
+            await asyncio.gather(*[one(i) for i in range(config.requests)])
+            wall = time.perf_counter() - wall_started
+    finally:
+        await server.stop(None)
+        servicer.shutdown()
+    
+    return {
+        "config": asdict(config),
+        "wall_seconds": wall,
+        "throughput_rps": config.requests / wall,
+        "latency_seconds": _percentiles(latencies),
+        "time_to_first_chunk_seconds": _percentiles(first_chunks),
+        "bytes_on_wire": wire_bytes,
+        "bytes_per_request": wire_bytes / config.requests,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MusicForge worker serving benchmark")
+    parser.add_argument("--rpc", choices=RPCS, default="audio")
+    parser.add_argument("--requests", type=int, default=16)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--duration", type=int, default=20, help="Audio seconds per request")
+    parser.add_argument("--cost", type=float, default=0.01,
+                        help="Stub model seconds per generated audio second")
+    parser.add_argument("--encoding", choices=list(ENCODINGS), default="float32")
+    parser.add_argument("--repeat-prompts", action="store_true",
+                        help="Send identical requests (exercises caching)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Run models in this many worker processes")
+    parser.add_argument("--out", default="bench_results.json", help="JSON output path")
+    args = parser.parse_args()
+    
+    config = BenchmarkConfig(
+        rpc=args.rpc,
+        requests=args.requests,
+        concurrency=args.concurrency,
+        duration_seconds=args.duration,
+        cost=args.cost,
+        encoding=args.encoding,
+        unique_prompts=not args.repeat_prompts,
+        worker_processes=args.workers,
+    )
+    results = asyncio.run(run_benchmark(config))
+    
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Deterministic CPU stand-ins for MusicGen, Bark and Demucs.
+
+Each stub keeps the real wrapper's serving logic (windowing, batching,
+segmenting) and only replaces the model call with a sleep proportional to
+the audio produced, so the serving path can be measured without a GPU.
+"""
+import hashlib
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import torch
+
+from src.cancellation import CancelToken, check
+from src.components.bark import BarkWrapper
+from src.components.demucs import DemucsWrapper
+from src.components.musicgen import MusicGenWrapper
+
+STUB_BYTES = 64 * 1024**2
+
+
+def _tone(seed: str, samples: int, sample_rate: int, channels: int = 1) -> np.ndarray:
+    """Deterministic test tone derived from a seed string."""
+    freq = 110 + int(hashlib.sha1(seed.encode()).hexdigest()[:4], 16) % 660
+    t = np.arange(samples, dtype=np.float32) / sample_rate
+    tone = 0.2 * np.sin(2 * np.pi * freq * t, dtype=np.float32)
+    return np.repeat(tone[np.newaxis, :], channels, axis=0)
+
+
+class StubMusicGenModel:
+    """Mimics the audiocraft MusicGen generation API."""
+    
+    sample_rate = 32000
+    frame_rate = 50  # decoding steps per second of audio
+    
+    def __init__(self, cost: float):
+        self._cost = cost
+        self._duration = 0
+        self._progress_callback = None
+    
+    def set_generation_params(self, duration=None, **kwargs):
+        if duration is not None:
+            self._duration = duration
+    
+    def set_custom_progress_callback(self, callback):
+        self._progress_callback = callback
+    
+    def generate(self, descriptions, progress=False):
+        return self._render(descriptions, self._duration, progress)
+    
+    def generate_continuation(self, prompt, prompt_sample_rate, descriptions, progress=False):
+        new_seconds = self._duration - prompt.shape[-1] / prompt_sample_rate
+        return torch.cat([prompt, self._render(descriptions, new_seconds, progress)], dim=-1)
+    
+    def _render(self, descriptions, seconds, progress=False):
+        # Batching amortizes most of the cost, like a real decoder
+        steps = max(1, int(seconds * self.frame_rate))
+        step_cost = self._cost * seconds * (1 + 0.1 * (len(descriptions) - 1)) / steps
+        for step in range(steps):
+            time.sleep(step_cost)
+            if progress and self._progress_callback is not None:
+                self._progress_callback(step + 1, steps)
+        samples = int(seconds * self.sample_rate)
+        return torch.from_numpy(np.stack([
+            _tone(d, samples, self.sample_rate) for d in descriptions
+        ]))
+
+
+class StubMusicGenWrapper(MusicGenWrapper):
+    """MusicGenWrapper backed by :class:`StubMusicGenModel`."""
+    
+    def __init__(self, cost: float = 0.01):
+        super().__init__()
+        self._cost = cost
+    
+    def load(self) -> None:
+        self._model = StubMusicGenModel(self._cost)
+        self._model.set_custom_progress_callback(self._on_step)
+        self._loaded = True
+    
+    def unload(self) -> None:
+        self._model = None
+        self._loaded = False
+    
+    def resident_bytes(self) -> int:
+        return STUB_BYTES
+
+
+class StubBarkWrapper(BarkWrapper):
+    """BarkWrapper whose segments are tones sized like spoken text."""
+    
+    CHARS_PER_SECOND = 15
+    sample_rate = 24000
+    
+    def __init__(self, cost: float = 0.01):
+        super().__init__()
+        self._cost = cost
+    
+    def load(self) -> None:
+        self._loaded = True
+    
+    def unload(self) -> None:
+        self._loaded = False
+    
+    def resident_bytes(self) -> int:
+        return STUB_BYTES
+    
+    def _generate_segment(
+        self,
+        sentence: str,
+        voice_preset: str,
+        seed: int | None = None,
+        cancel: CancelToken | None = None,
+    ) -> np.ndarray:
+        seconds = max(1.0, len(sentence) / self.CHARS_PER_SECOND)
+        time.sleep(self._cost * seconds)
+        check(cancel)
+        return _tone(sentence + voice_preset, int(seconds * self.sample_rate), self.sample_rate)[0]
+
+
+class StubDemucsWrapper(DemucsWrapper):
+    """DemucsWrapper whose stems are scaled copies of the input."""
+    
+    def __init__(self, cost: float = 0.01):
+        super().__init__()
+        self._cost = cost
+    
+    def load(self) -> None:
+        self._model = SimpleNamespace(
+            samplerate=44100, audio_channels=2, sources=["drums", "bass", "vocals", "other"]
+        )
+        self._loaded = True
+    
+    def unload(self) -> None:
+        self._model = None
+        self._loaded = False
+    
+    def resident_bytes(self) -> int:
+        return STUB_BYTES
+    
+    def _separate_segment(self, audio: np.ndarray, sample_rate: int) -> dict[str, np.ndarray]:
+        time.sleep(self._cost * audio.shape[-1] / sample_rate)
+        stereo = np.broadcast_to(audio[:1], (2, audio.shape[-1])) if audio.shape[0] == 1 else audio
+        return {
+            name: (stereo * (i + 1) / 4).astype(np.float32)
+            for i, name in enumerate(self._model.sources)
+        }
+
+
+def stub_models(cost: float = 0.01) -> dict:
+    """Model factory for worker pool processes (see ``src.process_pool``)."""
+    return {
+        "musicgen": StubMusicGenWrapper(cost),
+        "bark": StubBarkWrapper(cost),
+        "demucs": StubDemucsWrapper(cost),
+    }
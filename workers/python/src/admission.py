@@ -0,0 +1,241 @@
+"""Admission control in front of the model wrappers.
+
+Each model has a concurrency limit and a bounded wait queue per priority
+class. Interactive requests are always admitted before batch ones. The
+controller learns each model's service time per unit of work (e.g. per
+second of audio), so it can estimate queue wait and reject requests that
+cannot meet their deadline before any compute is spent.
+"""
+import asyncio
+import time
+from collections import deque
+from enum import IntEnum
+from typing import AsyncIterator
+
+import grpc
+
+from src.metrics import ADMISSION_REJECTIONS, STAGE_SECONDS
+
+# Weight of the newest observation in the service-time estimate
+_RATE_SMOOTHING = 0.3
+
+
+class Priority(IntEnum):
+    """Mirrors the ``Priority`` proto enum."""
+    
+    INTERACTIVE = 0
+    BATCH = 1
+
+
+class AdmissionRejectedError(Exception):
+    """A request was turned away without running."""
+    
+    code = grpc.StatusCode.RESOURCE_EXHAUSTED
+
+
+class QueueFullError(AdmissionRejectedError):
+    """The model's wait queue for this priority is full."""
+
+
+class DeadlineError(AdmissionRejectedError):
+    """The request cannot finish before its deadline."""
+    
+    code = grpc.StatusCode.DEADLINE_EXCEEDED
+
+
+class Ticket:
+    """A request's place in a model queue, and later its running slot."""
+    
+    def __init__(self, queue: "_ModelQueue", priority: Priority, cost: float):
+        self._queue = queue
+        self.priority = priority
+        self.cost = cost
+        self.enqueued = time.monotonic()
+        self.started = 0.0
+        self.admitted = False
+        self.released = False
+    
+    def position(self) -> int:
+        """1-based place in the queue, or 0 once admitted."""
+        if self.admitted:
+            return 0
+        return len(self._queue.ahead_of(self)) + 1
+    
+    def estimated_wait(self) -> float:
+        """Seconds until this ticket is likely to be admitted."""
+        return 0.0 if self.admitted else self._queue.estimated_wait(self._queue.ahead_of(self))
+    
+    async def wait(self, timeout: float | None = None) -> AsyncIterator[tuple[int, float]]:
+        """Wait for a slot, yielding (position, estimated wait) whenever it moves.
+        
+        Raises:
+            DeadlineError: If ``timeout`` passes before the ticket is admitted
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        last = None
+        
+        while not self.admitted:
+            # Taken before yielding, so changes made while the caller holds
+            # the update are not missed.
+            changed = self._queue.changed
+            position = self.position()
+            if position != last:
+                last = position
+                yield position, self.estimated_wait()
+            
+            remaining = None if deadline is None else deadline - loop.time()
+            try:
+                await asyncio.wait_for(changed.wait(), remaining)
+            except TimeoutError:
+                if self.admitted:
+                    break
+                self.release()
+                ADMISSION_REJECTIONS.inc(model=self._queue.model, reason="deadline")
+                raise DeadlineError(f"Deadline passed while queued for {self._queue.model}")
+    
+    def release(self) -> None:
+        """Leave the queue, or free the running slot."""
+        if not self.released:
+            self.released = True
+            self._queue.release(self)
+
+
+class _ModelQueue:
+    """Slots, waiting tickets and service-time estimate for one model."""
+    
+    def __init__(self, model: str, limit: int, queue_size: int):
+        self.model = model
+        self.limit = limit
+        self.queue_size = queue_size
+        self.running: set[Ticket] = set()
+        self.waiting = {priority: deque() for priority in Priority}
+        self.seconds_per_cost: float | None = None
+        self.changed = asyncio.Event()
+    
+    def ahead_of(self, ticket: Ticket) -> list[Ticket]:
+        ahead = []
+        for priority in Priority:
+            for other in self.waiting[priority]:
+                if other is ticket:
+                    return ahead
+                ahead.append(other)
+        return ahead
+    
+    def estimated_wait(self, ahead: list[Ticket]) -> float:
+        if self.seconds_per_cost is None or not self.limit:
+            return 0.0
+        now = time.monotonic()
+        running = sum(
+            max(0.0, t.cost * self.seconds_per_cost - (now - t.started)) for t in self.running
+        )
+        queued = sum(t.cost for t in ahead) * self.seconds_per_cost
+        if len(self.running) < self.limit and not ahead:
+            return 0.0
+        return (running + queued) / self.limit
+    
+    def enqueue(self, ticket: Ticket) -> None:
+        self.waiting[ticket.priority].append(ticket)
+        self._dispatch()
+    
+    def release(self, ticket: Ticket) -> None:
+        if ticket.admitted:
+            self.running.discard(ticket)
+            if ticket.cost > 0:
+                observed = (time.monotonic() - ticket.started) / ticket.cost
+                if self.seconds_per_cost is None:
+                    self.seconds_per_cost = observed
+                else:
+                    self.seconds_per_cost += _RATE_SMOOTHING * (observed - self.seconds_per_cost)
+        else:
+            try:
+                self.waiting[ticket.priority].remove(ticket)
+            except ValueError:
+                pass
+        self._dispatch()
+        self._notify()
+    
+    def _dispatch(self) -> None:
+        admitted = False
+        for priority in Priority:
+            queue = self.waiting[priority]
+            while queue and (not self.limit or len(self.running) < self.limit):
+                ticket = queue.popleft()
+                ticket.admitted = True
+                ticket.started = time.monotonic()
+                self.running.add(ticket)
+                STAGE_SECONDS.observe(ticket.started - ticket.enqueued, stage="queue_wait", model=self.model)
+                admitted = True
+        if admitted:
+            self._notify()
+    
+    def _notify(self) -> None:
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+
+class AdmissionController:
+    """Per-model concurrency limits with bounded, prioritized wait queues.
+    
+    A limit of 0 admits everything immediately. Must be used from a single
+    event loop.
+    """
+    
+    def __init__(self, limits: dict[str, int], queue_size: int = 16):
+        self._limits = limits
+        self._queue_size = queue_size
+        self._queues: dict[str, _ModelQueue] = {}
+    
+    def _queue(self, model: str) -> _ModelQueue:
+        queue = self._queues.get(model)
+        if queue is None:
+            queue = _ModelQueue(model, self._limits.get(model, 0), self._queue_size)
+            self._queues[model] = queue
+        return queue
+    
+    def admit(
+        self,
+        model: str,
+        priority: Priority = Priority.INTERACTIVE,
+        cost: float = 1.0,
+        time_remaining: float | None = None,
+    ) -> Ticket:
+        """Queue a request for a model slot.
+        
+        Args:
+            cost: Work units (e.g. seconds of audio) used to estimate wait
+            time_remaining: Seconds left before the caller's deadline
+        
+        Raises:
+            QueueFullError: If the queue for this priority is full
+            DeadlineError: If the estimated wait plus run time exceeds the deadline
+        """
+        queue = self._queue(model)
+        ticket = Ticket(queue, priority, cost)
+        busy = queue.limit and len(queue.running) >= queue.limit
+        
+        if busy and len(queue.waiting[priority]) >= queue.queue_size:
+            ADMISSION_REJECTIONS.inc(model=model, reason="queue_full")
+            raise QueueFullError(f"{model} queue is full")
+        
+        if time_remaining is not None and queue.seconds_per_cost is not None:
+            ahead = [t for p in Priority if p <= priority for t in queue.waiting[p]]
+            expected = queue.estimated_wait(ahead) if busy else 0.0
+            expected += cost * queue.seconds_per_cost
+            if expected > time_remaining:
+                ADMISSION_REJECTIONS.inc(model=model, reason="deadline")
+                raise DeadlineError(
+                    f"{model} needs ~{expected:.1f}s but only {time_remaining:.1f}s remain"
+                )
+        
+        queue.enqueue(ticket)
+        return ticket
+    
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {
+            model: {
+                "running": len(q.running),
+                "waiting": sum(len(w) for w in q.waiting.values()),
+            }
+            for model, q in self._queues.items()
+        }
@@ -0,0 +1,165 @@
+"""Planning and stitching for whole-song arrangement renders.
+
+A song is a list of sections (intro, verse, chorus, ...) as produced by
+``TheoryEngine.generate_sections``. Sections that sound the same, such as
+repeated choruses, are rendered once. Renders are joined end to end on
+bar boundaries: each section runs for exactly its bars, and its render's
+tail past the boundary is crossfaded into the start of the next section.
+"""
+import asyncio
+from typing import AsyncIterator, Hashable, NamedTuple
+
+import numpy as np
+
+DEFAULT_TEMPO_BPM = 120
+DEFAULT_BEATS_PER_BAR = 4
+
+
+class SectionPlan(NamedTuple):
+    """One section of the song, in playing order."""
+    name: str
+    bars: int
+    energy_level: float
+    elements: tuple[str, ...]
+    
+    @property
+    def render_key(self) -> Hashable:
+        """Sections with equal keys share one render; the length is trimmed per section."""
+        return (self.name.strip().lower(), self.elements, round(self.energy_level, 2))
+    
+    def prompt(self, base_prompt: str) -> str:
+        parts = [base_prompt, f"{self.name} section"]
+        if self.elements:
+            parts.append("featuring " + ", ".join(self.elements))
+        return ", ".join(p for p in parts if p)
+
+
+def plan_sections(sections) -> list[SectionPlan]:
+    """Section plans in playing order from ``Section`` messages or dicts."""
+    def field(section, name):
+        return section[name] if isinstance(section, dict) else getattr(section, name)
+    
+    ordered = sorted(sections, key=lambda s: field(s, "start_bar"))
+    return [
+        SectionPlan(
+            name=field(s, "name"),
+            bars=max(1, field(s, "duration_bars")),
+            energy_level=field(s, "energy_level"),
+            elements=tuple(field(s, "elements")),
+        )
+        for s in ordered
+    ]
+
+
+def bar_seconds(tempo_bpm: int, beats_per_bar: int) -> float:
+    return (beats_per_bar or DEFAULT_BEATS_PER_BAR) * 60 / (tempo_bpm or DEFAULT_TEMPO_BPM)
+
+
+class SectionRender:
+    """Chunks of one section's render, replayable by every section using it.
+    
+    The producer appends chunks as they are generated; readers iterate
+    from the start and wait for chunks that have not arrived yet.
+    """
+    
+    def __init__(self):
+        self.chunks: list[np.ndarray] = []
+        self.sample_rate = 0
+        self._done = False
+        self._error: BaseException | None = None
+        self._changed = asyncio.Event()
+    
+    def append(self, audio: np.ndarray, sample_rate: int) -> None:
+        self.chunks.append(audio)
+        self.sample_rate = sample_rate
+        self._wake()
+    
+    def finish(self, error: BaseException | None = None) -> None:
+        self._done = True
+        self._error = error
+        self._wake()
+    
+    def _wake(self) -> None:
+        # Readers wait on the event that was current when they ran out
+        self._changed.set()
+        self._changed = asyncio.Event()
+    
+    async def replay(self) -> AsyncIterator[np.ndarray]:
+        i = 0
+        while True:
+            while i < len(self.chunks):
+                yield self.chunks[i]
+                i += 1
+            if self._done:
+                if self._error is not None:
+                    raise self._error
+                return
+            await self._changed.wait()
+
+
+class Stitcher:
+    """Joins sections on bar boundaries with equal-power crossfades.
+    
+    Each section emits exactly its own length of its render, with the
+    first ``fade_seconds`` crossfaded against the previous section's tail.
+    The render's next ``fade_seconds`` past the boundary become this
+    section's tail, and anything later is dropped. Renders that stop
+    short are padded with silence, so later sections still start on
+    their bar.
+    """
+    
+    def __init__(self, fade_seconds: float):
+        self.fade_seconds = fade_seconds
+        self.sample_rate = 0
+        self.fade = 0
+        self._held: np.ndarray | None = None
+        self._tail: list[np.ndarray] = []
+        self._length = 0
+        self._position = 0
+    
+    async def section(self, render: SectionRender, seconds: float) -> AsyncIterator[np.ndarray]:
+        """Emit one section's audio from its render as the render arrives."""
+        channels = None
+        async for audio in render.replay():
+            if channels is None:
+                channels = audio.shape[0]
+                self._start(render.sample_rate, round(seconds * render.sample_rate))
+            out = self._push(audio)
+            if out.shape[-1]:
+                yield out
+        
+        missing = self._length + self.fade - self._position
+        if channels is not None and missing > 0:
+            out = self._push(np.zeros((channels, missing), dtype=np.float32))
+            if out.shape[-1]:
+                yield out
+    
+    def _start(self, sample_rate: int, length: int) -> None:
+        if not self.sample_rate:
+            self.sample_rate = sample_rate
+            self.fade = round(self.fade_seconds * sample_rate)
+            angles = np.linspace(0.0, np.pi / 2, self.fade, dtype=np.float32)
+            self._fade_out, self._fade_in = np.cos(angles), np.sin(angles)
+        self._held = np.concatenate(self._tail, axis=-1) if self._tail else None
+        self._tail = []
+        self._length = length
+        self._position = 0
+    
+    def _push(self, audio: np.ndarray) -> np.ndarray:
+        start, end = self._position, self._position + audio.shape[-1]
+        self._position = end
+        
+        tail_from, tail_to = max(start, self._length), min(end, self._length + self.fade)
+        if tail_to > tail_from:
+            self._tail.append(audio[..., tail_from - start:tail_to - start])
+        
+        out = audio[..., :max(0, min(end, self._length) - start)]
+        if self._held is not None and start < self.fade and out.shape[-1]:
+            # Samples [start, stop) overlap the previous section's tail
+            stop = min(self.fade, start + out.shape[-1])
+            out = out.copy()
+            out[..., :stop - start] = (
+                self._held[..., start:stop] * self._fade_out[start:stop]
+                + out[..., :stop - start] * self._fade_in[start:stop]
+            )
+        return out
@@ -0,0 +1,297 @@
+"""Memory-mapped audio artifacts shared with co-located clients.
+
+When the API and the worker share a volume, results can be written to
+files there and referenced by handle instead of being copied through
+gRPC. Samples are stored interleaved, as (samples, channels) frames,
+in one of three layouts: headerless raw, a NumPy ``.npy`` array or a WAV
+file. Artifacts are reference counted and expire ``ttl_seconds`` after
+they were finished or last retained, whichever is later.
+"""
+import mmap
+import os
+import struct
+import threading
+import time
+import uuid
+from enum import IntEnum
+
+import numpy as np
+import structlog
+
+from src.audio_buffer import STAGING, as_float32
+from src.audio_codec import AudioEncoding
+
+logger = structlog.get_logger()
+
+_NPY_HEADER = 128
+_WAV_HEADER = 44
+_WAV_FORMAT = struct.Struct("<4sI4s4sIHHIIHH4sI")
+_WAV_FLOAT, _WAV_PCM = 3, 1
+
+# Files grow by at least this much when a stream outruns the mapping
+_MIN_GROWTH = 1 << 20
+
+
+class ArtifactFormat(IntEnum):
+    """Artifact layouts (mirrors ``ArtifactFormat`` in worker.proto)."""
+    NONE = 0   # no artifact; audio is sent inline
+    RAW = 1
+    NPY = 2
+    WAV = 3
+
+
+_EXTENSIONS = {ArtifactFormat.RAW: ".raw", ArtifactFormat.NPY: ".npy", ArtifactFormat.WAV: ".wav"}
+_HEADERS = {ArtifactFormat.RAW: 0, ArtifactFormat.NPY: _NPY_HEADER, ArtifactFormat.WAV: _WAV_HEADER}
+
+
+def sample_dtype(encoding: int) -> np.dtype:
+    """Sample type stored for a request's encoding; FLAC requests store 16-bit PCM."""
+    return np.dtype("<f4" if encoding == AudioEncoding.FLOAT32 else "<i2")
+
+
+def stored_encoding(encoding: int) -> AudioEncoding:
+    """Encoding of the samples an artifact holds for a request's encoding."""
+    return AudioEncoding.FLOAT32 if encoding == AudioEncoding.FLOAT32 else AudioEncoding.PCM16
+
+
+class ArtifactWriter:
+    """Appends audio to one artifact file through a memory map.
+    
+    The file is created on the first write, when the channel count is
+    known, and grows by doubling. ``write`` returns where that audio's
+    samples landed, so every streamed chunk can point at its own region;
+    ``.npy`` and WAV headers are filled in by ``finish``.
+    """
+    
+    def __init__(
+        self,
+        store: "ArtifactStore",
+        artifact_id: str,
+        path: str,
+        format: ArtifactFormat,
+        dtype: np.dtype,
+        sample_rate: int,
+        name: str = "",
+    ):
+        self.id = artifact_id
+        self.path = path
+        self.format = format
+        self.dtype = dtype
+        self.sample_rate = sample_rate
+        self.name = name
+        self.channels = 0
+        self.finished = False
+        self._store = store
+        self._fd: int | None = None
+        self._map: mmap.mmap | None = None
+        self._capacity = 0
+        self._end = _HEADERS[format]
+    
+    def write(self, audio: np.ndarray, final: bool = False) -> tuple[int, int]:
+        """Append (channels, samples) or (samples,) audio; returns (byte offset, byte length)."""
+        audio = as_float32(audio)
+        frames = audio.T if audio.ndim == 2 else audio[:, None]
+        if self._fd is None:
+            self._open(frames.shape[1])
+        elif frames.shape[1] != self.channels:
+            raise ValueError(f"Artifact has {self.channels} channels, got {frames.shape[1]}")
+        
+        offset = self._end
+        length = frames.size * self.dtype.itemsize
+        if length:
+            self._reserve(offset + length)
+            out = np.ndarray(frames.shape, dtype=self.dtype, buffer=self._map, offset=offset)
+            if self.dtype.kind == "f":
+                np.copyto(out, frames)
+            else:
+                scaled = STAGING.get("artifact_scaled", frames.shape, np.float32)
+                np.clip(frames, -1.0, 1.0, out=scaled)
+                np.multiply(scaled, 32767, out=out, casting="unsafe")
+            del out
+            self._end += length
+        
+        if final:
+            self.finish()
+        return offset, length
+    
+    def finish(self) -> None:
+        """Write the header and trim the file to its contents."""
+        if self.finished:
+            return
+        if self._fd is None:
+            self._open(1)
+        header = self._header()
+        if header:
+            self._reserve(len(header))
+            self._map[:len(header)] = header
+        self._close(self._end)
+        self.finished = True
+        self._store._touch(self.id)
+    
+    def abort(self) -> None:
+        """Drop a partly written artifact."""
+        if self.finished:
+            return
+        self.finished = True
+        if self._fd is not None:
+            self._close(0)
+        self._store._remove(self.id)
+    
+    def _open(self, channels: int) -> None:
+        self.channels = channels
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+    
+    def _reserve(self, size: int) -> None:
+        if size <= self._capacity:
+            return
+        capacity = max(size, 2 * self._capacity, _MIN_GROWTH)
+        if self._map is not None:
+            self._map.close()
+        os.ftruncate(self._fd, capacity)
+        self._map = mmap.mmap(self._fd, capacity)
+        self._capacity = capacity
+    
+    def _close(self, size: int) -> None:
+        if self._map is not None:
+            self._map.flush()
+            self._map.close()
+            self._map = None
+        os.ftruncate(self._fd, size)
+        os.close(self._fd)
+        self._fd = None
+    
+    def _header(self) -> bytes:
+        data = self._end - _HEADERS[self.format]
+        if self.format == ArtifactFormat.NPY:
+            frames = data // (self.dtype.itemsize * self.channels)
+            fields = repr({"descr": self.dtype.str, "fortran_order": False, "shape": (frames, self.channels)})
+            preamble = b"\x93NUMPY\x01\x00" + struct.pack("<H", _NPY_HEADER - 10)
+            return preamble + fields.encode("latin1").ljust(_NPY_HEADER - 11) + b"\n"
+        if self.format == ArtifactFormat.WAV:
+            block = self.dtype.itemsize * self.channels
+            tag = _WAV_FLOAT if self.dtype.kind == "f" else _WAV_PCM
+            return _WAV_FORMAT.pack(
+                b"RIFF", 36 + data, b"WAVE", b"fmt ", 16, tag, self.channels, self.sample_rate,
+                self.sample_rate * block, block, 8 * self.dtype.itemsize, b"data", data,
+            )
+        return b""
+
+
+class ArtifactStore:
+    """Reference-counted artifact files in one directory.
+    
+    Each artifact starts with one reference, held by whoever received its
+    handle. ``retain`` adds a reference and extends the lifetime;
+    ``release`` drops one and deletes the file at zero. Artifacts nobody
+    released are deleted once they expire; artifacts still being written
+    never expire. A store without a directory is disabled.
+    """
+    
+    def __init__(self, directory: str | None = None, ttl_seconds: float = 3600):
+        self.directory = os.path.abspath(directory) if directory else None
+        self._ttl = ttl_seconds
+        # artifact id -> (path, references, expiry time)
+        self._entries: dict[str, tuple[str, int, float]] = {}
+        # artifacts whose writer has not finished
+        self._writing: set[str] = set()
+        self._lock = threading.Lock()
+        self._last_collect = 0.0
+        
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            self._load_index()
+    
+    @property
+    def enabled(self) -> bool:
+        return self.directory is not None
+    
+    def _load_index(self) -> None:
+        """Adopt artifacts left by a previous run; their references were lost with it."""
+        for name in os.listdir(self.directory):
+            artifact_id, extension = os.path.splitext(name)
+            if extension in _EXTENSIONS.values():
+                path = os.path.join(self.directory, name)
+                self._entries[artifact_id] = (path, 1, os.stat(path).st_mtime + self._ttl)
+        removed = self.collect()
+        logger.info("Artifact store ready", artifacts=len(self._entries), expired=removed)
+    
+    def create(
+        self, format: ArtifactFormat, dtype: np.dtype, sample_rate: int, name: str = ""
+    ) -> ArtifactWriter:
+        """Start a new artifact holding one reference."""
+        format = ArtifactFormat(format)
+        if format == ArtifactFormat.NONE:
+            raise ValueError("No artifact format given")
+        
+        now = time.time()
+        if now - self._last_collect > min(60.0, self._ttl):
+            self.collect(now)
+        
+        artifact_id = uuid.uuid4().hex
+        path = os.path.join(self.directory, artifact_id + _EXTENSIONS[format])
+        with self._lock:
+            self._entries[artifact_id] = (path, 1, now + self._ttl)
+            self._writing.add(artifact_id)
+        return ArtifactWriter(self, artifact_id, path, format, dtype, sample_rate, name)
+    
+    def retain(self, artifact_id: str) -> tuple[int, float] | None:
+        """Add a reference; returns (references, expiry) or None for unknown artifacts."""
+        with self._lock:
+            entry = self._entries.get(artifact_id)
+            if entry is None:
+                return None
+            path, references, _ = entry
+            self._entries[artifact_id] = (path, references + 1, time.time() + self._ttl)
+            return references + 1, time.time() + self._ttl
+    
+    def release(self, artifact_id: str) -> tuple[int, float] | None:
+        """Drop a reference, deleting the file at zero; returns (references, expiry)."""
+        with self._lock:
+            entry = self._entries.get(artifact_id)
+            if entry is None:
+                return None
+            path, references, expires = entry
+            if references > 1:
+                self._entries[artifact_id] = (path, references - 1, expires)
+                return references - 1, expires
+        self._remove(artifact_id)
+        return 0, expires
+    
+    def collect(self, now: float | None = None) -> int:
+        """Delete expired artifacts, referenced or not; returns how many."""
+        now = now or time.time()
+        self._last_collect = now
+        with self._lock:
+            expired = [
+                key for key, (_, _, expires) in self._entries.items()
+                if expires <= now and key not in self._writing
+            ]
+        for artifact_id in expired:
+            self._remove(artifact_id)
+        return len(expired)
+    
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "artifacts": len(self._entries),
+                "references": sum(references for _, references, _ in self._entries.values()),
+            }
+    
+    def _touch(self, artifact_id: str) -> None:
+        # Lifetimes count from when the artifact is complete
+        with self._lock:
+            self._writing.discard(artifact_id)
+            entry = self._entries.get(artifact_id)
+            if entry is not None:
+                self._entries[artifact_id] = (entry[0], entry[1], max(entry[2], time.time() + self._ttl))
+    
+    def _remove(self, artifact_id: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(artifact_id, None)
+            self._writing.discard(artifact_id)
+        if entry is None:
+            return
+        try:
+            os.unlink(entry[0])
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,93 @@
+"""Copy-avoiding conversions between model tensors, numpy and wire bytes.
+
+Model outputs are float32 already, so the hot path only needs to move them
+to host memory and get at their bytes. These helpers return views wherever
+the layout allows, copy device tensors through PyTorch's cached pinned host
+memory, and keep per-thread scratch arrays for the conversions that do need
+somewhere to write (e.g. float32 to int16 PCM).
+"""
+import math
+import threading
+import warnings
+
+import numpy as np
+
+FLOAT32 = np.dtype("<f4")
+
+
+def as_float32(audio) -> np.ndarray:
+    """View ``audio`` as a C-contiguous little-endian float32 array.
+    
+    Copies only if the dtype or layout differs.
+    """
+    return np.ascontiguousarray(audio, dtype=FLOAT32)
+
+
+def byte_view(audio: np.ndarray) -> memoryview:
+    """Flat byte view of a contiguous array, without copying."""
+    return memoryview(np.ascontiguousarray(audio)).cast("B")
+
+
+def from_wire(data, channels: int = 1) -> np.ndarray:
+    """View planar float32 wire bytes as (channels, samples), or (samples,) for mono."""
+    audio = np.frombuffer(data, dtype=FLOAT32)
+    return audio.reshape(channels, -1) if channels > 1 else audio
+
+
+def to_host(tensor) -> np.ndarray:
+    """Model output tensor as a float32 numpy array in host memory.
+    
+    CPU tensors are viewed in place. Device tensors are copied once into
+    pinned host memory, which PyTorch's caching host allocator recycles
+    once the returned array is released.
+    """
+    import torch
+    
+    tensor = tensor.detach()
+    if tensor.dtype != torch.float32:
+        tensor = tensor.float()
+    if tensor.device.type == "cpu":
+        return tensor.numpy()
+    
+    host = torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=tensor.is_cuda)
+    host.copy_(tensor, non_blocking=tensor.is_cuda)
+    if tensor.is_cuda:
+        torch.cuda.current_stream(tensor.device).synchronize()
+    return host.numpy()
+
+
+def to_tensor(audio: np.ndarray):
+    """Float32 torch tensor sharing memory with ``audio`` where possible."""
+    import torch
+    
+    audio = np.asarray(audio, dtype=np.float32)
+    with warnings.catch_warnings():
+        # Arrays over request bytes are read-only; model inputs are never
+        # written in place, so sharing them is safe.
+        warnings.filterwarnings("ignore", message=".*not writable.*")
+        return torch.from_numpy(audio)
+
+
+class StagingBuffers:
+    """Per-thread scratch arrays reused across chunks.
+    
+    ``get`` returns a view into a buffer that only grows, so steady-state
+    encoding allocates nothing but its output. Views are only valid until
+    the same thread asks for the same name again.
+    """
+    
+    def __init__(self):
+        self._local = threading.local()
+    
+    def get(self, name: str, shape: tuple[int, ...], dtype) -> np.ndarray:
+        dtype = np.dtype(dtype)
+        buffers = self._local.__dict__.setdefault("buffers", {})
+        size = math.prod(shape)
+        buffer = buffers.get((name, dtype))
+        if buffer is None or buffer.size < size:
+            buffer = np.empty(size, dtype=dtype)
+            buffers[(name, dtype)] = buffer
+        return buffer[:size].reshape(shape)
+
+
+STAGING = StagingBuffers()
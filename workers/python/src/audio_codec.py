@@ -0,0 +1,87 @@
+"""Wire encodings for audio payloads."""
+import io
+from enum import IntEnum
+
+import numpy as np
+
+from src.audio_buffer import STAGING, as_float32, byte_view, from_wire
+from src.metrics import STAGE_SECONDS
+
+STEM_NAMES = ("drums", "bass", "vocals", "other")
+
+
+class AudioEncoding(IntEnum):
+    """Audio payload encodings (mirrors ``AudioEncoding`` in worker.proto)."""
+    FLOAT32 = 0   # raw little-endian float32, planar (channels, samples)
+    PCM16 = 1     # raw little-endian int16, planar (channels, samples)
+    FLAC = 2      # self-describing FLAC stream, 16-bit
+
+
+def encode_audio(audio: np.ndarray, sample_rate: int, encoding: int = AudioEncoding.FLOAT32) -> bytes:
+    """Encode a (channels, samples) or (samples,) float array for the wire."""
+    encoding = AudioEncoding(encoding)
+    
+    with STAGE_SECONDS.time(stage="serialization", encoding=encoding.name.lower()):
+        return _encode(audio, sample_rate, encoding)
+
+
+def _encode(audio: np.ndarray, sample_rate: int, encoding: AudioEncoding) -> bytes:
+    # The returned bytes are the only per-chunk allocation; everything
+    # before it is a view or a reused staging buffer.
+    if encoding == AudioEncoding.FLOAT32:
+        return bytes(byte_view(as_float32(audio)))
+    
+    pcm = _to_pcm16(audio)
+    if encoding == AudioEncoding.PCM16:
+        return bytes(byte_view(pcm))
+    
+    import soundfile as sf
+    
+    # soundfile expects interleaved (frames, channels)
+    if pcm.ndim == 2:
+        frames = STAGING.get("pcm16_frames", pcm.shape[::-1], pcm.dtype)
+        np.copyto(frames, pcm.T)
+    else:
+        frames = pcm
+    buffer = io.BytesIO()
+    sf.write(buffer, frames, sample_rate, format="FLAC", subtype="PCM_16")
+    return buffer.getvalue()
+
+
+def decode_audio(data: bytes, encoding: int = AudioEncoding.FLOAT32, channels: int = 1) -> np.ndarray:
+    """Decode a wire payload back into a float32 array shaped like the encoder input."""
+    encoding = AudioEncoding(encoding)
+    
+    if encoding == AudioEncoding.FLOAT32:
+        return from_wire(data, channels)
+    elif encoding == AudioEncoding.PCM16:
+        audio = np.divide(np.frombuffer(data, dtype="<i2"), 32767, dtype=np.float32)
+    else:
+        import soundfile as sf
+        
+        frames, _ = sf.read(io.BytesIO(data), dtype="float32", always_2d=True)
+        return frames.T if channels > 1 else frames[:, 0]
+    
+    return audio.reshape(channels, -1) if channels > 1 else audio
+
+
+def encode_stems(
+    stems: dict[str, np.ndarray],
+    sample_rate: int,
+    encoding: int = AudioEncoding.FLOAT32,
+) -> dict[str, bytes]:
+    """Encode every stem; missing stems become empty payloads."""
+    return {
+        name: encode_audio(stems[name], sample_rate, encoding) if name in stems else b""
+        for name in STEM_NAMES
+    }
+
+
+def _to_pcm16(audio: np.ndarray) -> np.ndarray:
+    """Scale to int16 in staging buffers; valid until this thread's next call."""
+    scaled = STAGING.get("pcm_scaled", audio.shape, np.float32)
+    np.clip(audio, -1.0, 1.0, out=scaled)
+    np.multiply(scaled, 32767, out=scaled)
+    pcm = STAGING.get("pcm16", audio.shape, "<i2")
+    np.copyto(pcm, scaled, casting="unsafe")
+    return pcm
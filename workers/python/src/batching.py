@@ -0,0 +1,139 @@
+"""Micro-batching scheduler for MusicGen prompts."""
+import asyncio
+from typing import AsyncIterator, Callable, Iterator
+
+import numpy as np
+import structlog
+
+from src.cancellation import CancelToken, RequestCancelledError
+from src.components.musicgen import GenerationRequest
+from src.config import get_settings
+from src.inference import InferenceExecutor
+
+logger = structlog.get_logger()
+
+_DONE = object()
+
+
+class _PendingItem:
+    """A queued request and the stream its results are fanned out to."""
+    
+    def __init__(self, request: GenerationRequest, cancel: CancelToken):
+        self.request = request
+        self.cancel = cancel
+        self.results: asyncio.Queue = asyncio.Queue()
+
+
+class MusicGenBatcher:
+    """Gathers concurrent MusicGen requests into batched forward passes.
+    
+    Requests arriving within ``window_ms`` of each other that share the same
+    duration are generated together; each caller still receives its own
+    stream of chunks. ``generate_batch`` has the signature of
+    ``MusicGenWrapper.generate_batch``; without an ``executor`` it must
+    instead return an async iterator (e.g. ``WorkerPool.stream``).
+    
+    A batch keeps running while any of its callers still wants it, and is
+    cancelled once every caller has cancelled or stopped reading.
+    """
+    
+    def __init__(
+        self,
+        generate_batch: Callable[[list[GenerationRequest], int], Iterator | AsyncIterator],
+        executor: InferenceExecutor | None,
+        window_ms: int = 25,
+        max_batch_size: int = 4,
+    ):
+        self._generate_batch = generate_batch
+        self._executor = executor
+        self._window = window_ms / 1000
+        self._max_batch_size = max(1, max_batch_size)
+        self._groups: dict[int, list[_PendingItem]] = {}
+        self._tasks: set[asyncio.Task] = set()
+    
+    async def generate(
+        self,
+        prompt: str,
+        duration_seconds: int = 30,
+        genre: str = "",
+        energy_level: float = 0.5,
+        cancel: CancelToken | None = None,
+    ) -> AsyncIterator[tuple[np.ndarray, int, float]]:
+        """Queue a request and stream its chunks once its batch runs."""
+        key = self._batch_key(duration_seconds)
+        item = _PendingItem(GenerationRequest(prompt, genre, energy_level), cancel or CancelToken())
+        
+        group = self._groups.setdefault(key, [])
+        group.append(item)
+        
+        if len(group) >= self._max_batch_size:
+            self._flush(key)
+        elif len(group) == 1:
+            asyncio.get_running_loop().call_later(self._window, self._flush, key)
+        
+        finished = False
+        try:
+            while True:
+                result = await item.results.get()
+                if result is _DONE:
+                    finished = True
+                    break
+                if isinstance(result, BaseException):
+                    raise result
+                yield result
+        finally:
+            if not finished:
+                # Not yet flushed: just leave the group
+                if item in self._groups.get(key, ()):
+                    self._groups[key].remove(item)
+                item.cancel.cancel()
+    
+    def _batch_key(self, duration_seconds: int) -> int:
+        """Group requests by the duration they will actually be generated at."""
+        settings = get_settings()
+        return max(1, min(duration_seconds, settings.max_duration_seconds))
+    
+    def _flush(self, key: int) -> None:
+        """Start a batch for everything currently queued under a key."""
+        items = self._groups.pop(key, None)
+        if not items:
+            return
+        
+        task = asyncio.ensure_future(self._run_batch(key, items))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _run_batch(self, duration: int, items: list[_PendingItem]) -> None:
+        """Run one batched generation and fan chunks back out to each caller."""
+        logger.info("Running MusicGen batch", batch_size=len(items), duration=duration)
+        
+        cancel = CancelToken()
+        
+        def abandoned() -> None:
+            if all(item.cancel.cancelled for item in items):
+                cancel.cancel()
+        
+        for item in items:
+            item.cancel.add_callback(abandoned)
+        
+        requests = [item.request for item in items]
+        if self._executor is None:
+            stream = self._generate_batch(requests, duration, cancel=cancel)
+        else:
+            stream = self._executor.iterate(
+                "musicgen", self._generate_batch, requests, duration, cancel=cancel
+            )
+        
+        try:
+            async for audio, sample_rate, progress in stream:
+                for i, item in enumerate(items):
+                    item.results.put_nowait((audio[i], sample_rate, progress))
+        except RequestCancelledError:
+            logger.info("MusicGen batch cancelled", batch_size=len(items))
+        except Exception as e:
+            logger.error("MusicGen batch failed", error=str(e))
+            for item in items:
+                item.results.put_nowait(e)
+        finally:
+            for item in items:
+                item.results.put_nowait(_DONE)
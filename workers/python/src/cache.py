@@ -0,0 +1,209 @@
+"""Disk-backed, content-addressed cache for heavy RPC results."""
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger()
+
+_LENGTH = struct.Struct("<I")
+
+
+def make_key(kind: str, params: dict[str, Any], payload: bytes | memoryview = b"") -> str:
+    """Hash a normalized request into a cache key.
+    
+    Args:
+        kind: Request type (e.g. "audio", "vocals", "stems")
+        params: Normalized request fields plus model identity and generation params
+        payload: Raw request bytes (e.g. audio to separate)
+    """
+    digest = hashlib.sha256()
+    digest.update(kind.encode())
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+    digest.update(payload)
+    return digest.hexdigest()
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so trivially different prompts share an entry."""
+    return " ".join(text.split())
+
+
+class CacheWriter:
+    """Streams serialized messages into a pending cache entry."""
+    
+    def __init__(self, cache: "ResultCache", key: str):
+        self._cache = cache
+        self._key = key
+        self._size = 0
+        self._file = None
+        
+        if cache.enabled:
+            fd, self._tmp_path = tempfile.mkstemp(dir=cache.directory, suffix=".tmp")
+            self._file = os.fdopen(fd, "wb")
+    
+    def append(self, message: bytes) -> None:
+        """Append one serialized response message."""
+        if self._file is None:
+            return
+        self._file.write(_LENGTH.pack(len(message)))
+        self._file.write(message)
+        self._size += _LENGTH.size + len(message)
+    
+    def commit(self) -> None:
+        """Publish the entry once the full response has been produced."""
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        self._cache._publish(self._key, self._tmp_path, self._size)
+    
+    def abort(self) -> None:
+        """Discard a partially written entry."""
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        os.unlink(self._tmp_path)
+
+
+class ResultCache:
+    """LRU cache of serialized response streams stored on disk.
+    
+    Entries are keyed by a hash of the normalized request, evicted least
+    recently used first once ``max_bytes`` is exceeded, and expire after
+    ``ttl_seconds``. A cache without a directory is disabled and never hits.
+    """
+    
+    def __init__(
+        self,
+        directory: str | None = None,
+        max_bytes: int = 2 * 1024**3,
+        ttl_seconds: float = 24 * 3600,
+    ):
+        self.directory = directory or None
+        self._max_bytes = max_bytes
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[str, tuple[int, float]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            self._load_index()
+    
+    @property
+    def enabled(self) -> bool:
+        return self.directory is not None
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.bin")
+    
+    def _load_index(self) -> None:
+        """Rebuild the LRU index from entries left by a previous run."""
+        entries = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.endswith(".tmp"):
+                os.unlink(path)
+            elif name.endswith(".bin"):
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, name[:-4], stat.st_size))
+        
+        for mtime, key, size in sorted(entries):
+            self._entries[key] = (size, mtime)
+            self._bytes += size
+        
+        self._evict()
+        logger.info("Result cache ready", entries=len(self._entries), bytes=self._bytes)
+    
+    def get(self, key: str) -> list[bytes] | None:
+        """Return the stored messages for a key, or None on a miss."""
+        if not self.enabled:
+            return None
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.time() - entry[1] > self._ttl:
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        
+        try:
+            with open(self._path(key), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            with self._lock:
+                self._remove(key)
+            return None
+        
+        messages = []
+        offset = 0
+        view = memoryview(data)
+        while offset < len(data):
+            (length,) = _LENGTH.unpack_from(data, offset)
+            offset += _LENGTH.size
+            messages.append(bytes(view[offset:offset + length]))
+            offset += length
+        return messages
+    
+    def writer(self, key: str) -> CacheWriter:
+        """Start writing a new entry for a key."""
+        return CacheWriter(self, key)
+    
+    def put(self, key: str, messages: list[bytes]) -> None:
+        """Store a complete list of messages under a key."""
+        writer = self.writer(key)
+        for message in messages:
+            writer.append(message)
+        writer.commit()
+    
+    def _publish(self, key: str, tmp_path: str, size: int) -> None:
+        os.replace(tmp_path, self._path(key))
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries[key][0]
+            self._entries[key] = (size, time.time())
+            self._entries.move_to_end(key)
+            self._bytes += size
+            self._evict()
+    
+    def _evict(self) -> None:
+        """Drop least recently used entries until under the size budget."""
+        while self._bytes > self._max_bytes and self._entries:
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.evictions += 1
+    
+    def _remove(self, key: str) -> None:
+        size, _ = self._entries.pop(key)
+        self._bytes -= size
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+    
+    def stats(self) -> dict[str, int]:
+        """Return cache counters."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "bytes": self._bytes,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+            }
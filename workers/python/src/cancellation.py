@@ -0,0 +1,48 @@
+"""Cooperative cancellation for model work running on other threads or processes."""
+import threading
+from typing import Callable
+
+
+class RequestCancelledError(Exception):
+    """Raised inside model code once its request has been cancelled."""
+
+
+class CancelToken:
+    """Thread-safe flag that model code polls between steps.
+    
+    Generators check it between windows, sentences or segments (and, where
+    the model allows, between decoding steps) and stop by raising
+    :class:`RequestCancelledError`. Callbacks run once, on the cancelling thread.
+    """
+    
+    def __init__(self):
+        self._event = threading.Event()
+        self._callbacks: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+    
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+    
+    def cancel(self) -> None:
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+    
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        """Call ``callback`` on cancellation, or right away if already cancelled."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+
+def check(cancel: CancelToken | None) -> None:
+    """Raise :class:`RequestCancelledError` if an optional token has been cancelled."""
+    if cancel is not None and cancel.cancelled:
+        raise RequestCancelledError()
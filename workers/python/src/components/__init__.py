@@ -1,6 +1,21 @@
-from src.components.musicgen import MusicGenWrapper
-from src.components.bark import BarkWrapper
-from src.components.demucs import DemucsWrapper
-from src.components.theory_engine import TheoryEngine
+import importlib
 
-__all__ = ["MusicGenWrapper", "BarkWrapper", "DemucsWrapper", "TheoryEngine"]
+# Wrappers are resolved on first attribute access so importing the package
+# stays cheap; heavy frameworks are only imported when a model is used.
+_EXPORTS = {
+    "MusicGenWrapper": "src.components.musicgen",
+    "GenerationRequest": "src.components.musicgen",
+    "BarkWrapper": "src.components.bark",
+    "DemucsWrapper": "src.components.demucs",
+    "TheoryEngine": "src.components.theory_engine",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
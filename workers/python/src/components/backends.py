@@ -0,0 +1,73 @@
+"""Inference backends applied to model modules at load time."""
+import contextlib
+import warnings
+
+import structlog
+
+from src.config import InferenceBackend
+
+logger = structlog.get_logger()
+
+
+def bf16_supported(device: str) -> bool:
+    """Whether bfloat16 matmuls run natively, rather than emulated, on ``device``."""
+    import torch
+    
+    if device == "cuda":
+        return torch.cuda.is_bf16_supported()
+    if device == "cpu":
+        native = (
+            getattr(torch.cpu, "_is_avx512_bf16_supported", None),
+            getattr(torch.cpu, "_is_amx_tile_supported", None),
+        )
+        return any(check is not None and check() for check in native)
+    return False
+
+
+def resolve_backend(backend: InferenceBackend, device: str) -> InferenceBackend:
+    """The backend that will actually be used on ``device``.
+    
+    Falls back to eager, with a warning, when the device cannot run the
+    requested backend (int8 dynamic quantization is CPU-only).
+    """
+    supported = {
+        InferenceBackend.EAGER: True,
+        InferenceBackend.INT8: device == "cpu",
+        InferenceBackend.BF16: bf16_supported(device),
+        InferenceBackend.COMPILED: device in ("cpu", "cuda"),
+    }[backend]
+    if not supported:
+        logger.warning("Inference backend unsupported on device, using eager",
+                       backend=backend.value, device=device)
+        return InferenceBackend.EAGER
+    return backend
+
+
+def apply_backend(module, backend: InferenceBackend) -> None:
+    """Prepare a loaded module in place for the given (resolved) backend.
+    
+    INT8 swaps ``nn.Linear`` layers for dynamically quantized ones;
+    COMPILED wraps ``forward`` with ``torch.compile``, falling back to
+    eager for graphs the compiler cannot handle. BF16 changes nothing here;
+    it is applied per call by :func:`inference_context`.
+    """
+    import torch
+    
+    if backend == InferenceBackend.INT8:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message=".*deprecated.*")
+            torch.ao.quantization.quantize_dynamic(
+                module, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+            )
+    elif backend == InferenceBackend.COMPILED:
+        torch._dynamo.config.suppress_errors = True
+        module.forward = torch.compile(module.forward, dynamic=True)
+
+
+def inference_context(backend: InferenceBackend, device: str):
+    """Context manager to run model calls under for the given backend."""
+    import torch
+    
+    if backend == InferenceBackend.BF16:
+        return torch.autocast(device_type=device, dtype=torch.bfloat16)
+    return contextlib.nullcontext()
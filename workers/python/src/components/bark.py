@@ -1,9 +1,14 @@
 """Bark wrapper for vocal/speech synthesis."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Generator
 import numpy as np
 import structlog
 
-from src.config import detect_device
+from src.cancellation import CancelToken, check
+from src.config import detect_device, get_settings
+from src.lru import LRUCache
+from src.metrics import STAGE_SECONDS
 
 logger = structlog.get_logger()
 
@@ -18,9 +23,22 @@ class BarkWrapper:
         "narrator": "v2/en_speaker_0",
     }
     
+    model_id = "suno/bark"
+    estimated_bytes = 5 * 1024**3
+    
     def __init__(self):
         self._loaded = False
         self._device = None
+        self._segment_pool = None
+        self._pool_lock = threading.Lock()
+        self._seed_lock = threading.Lock()
+        
+        # Prepared voice prompts and per-line tokens; repeated lines
+        # (choruses, hooks) skip the semantic and coarse stages.
+        token_entries = get_settings().bark_token_cache_size
+        self._prompt_cache = LRUCache("bark_voice_prompt", max_entries=len(self.VOICE_PRESETS) * 4)
+        self._semantic_cache = LRUCache("bark_semantic", max_entries=token_entries)
+        self._coarse_cache = LRUCache("bark_coarse", max_entries=token_entries)
     
     def load(self) -> None:
         """Load Bark model."""
@@ -42,51 +60,165 @@ class BarkWrapper:
         text: str,
         voice_type: str = "female",
         style: str = "",
+        seed: int | None = None,
+        cancel: CancelToken | None = None,
     ) -> Generator[tuple[np.ndarray, int, float], None, None]:
         """
         Synthesize vocals from text with streaming.
         
+        Args:
+            seed: Optional RNG seed; part of the token cache key
+            cancel: Checked between sentences and between Bark's stages
+        
+        Raises:
+            RequestCancelledError: If ``cancel`` is set before synthesis finishes
+        
         Yields:
             Tuple of (audio_chunk, sample_rate, progress)
         """
         if not self._loaded:
             self.load()
         
-        from bark import generate_audio, SAMPLE_RATE
-        
         voice_preset = self.VOICE_PRESETS.get(voice_type, self.VOICE_PRESETS["female"])
         
         # Split text into sentences for streaming
         sentences = self._split_sentences(text)
         total = len(sentences)
         
-        for i, sentence in enumerate(sentences):
-            if not sentence.strip():
-                continue
-            
-            logger.info("Synthesizing", sentence=sentence[:50], voice=voice_type)
-            
-            audio = generate_audio(
-                sentence,
-                history_prompt=voice_preset,
-            )
-            
-            progress = (i + 1) / total
-            yield audio, SAMPLE_RATE, progress
+        # Segments are generated concurrently on a shared pool but yielded
+        # in order, as soon as each one (and everything before it) is done.
+        pool = self._get_segment_pool()
+        pending = [
+            (i, pool.submit(self._synthesize_segment, sentence, voice_preset, voice_type, seed, cancel))
+            for i, sentence in enumerate(sentences)
+            if sentence.strip()
+        ]
+        
+        try:
+            for i, future in pending:
+                check(cancel)
+                audio = future.result()
+                progress = (i + 1) / total
+                yield audio, self.sample_rate, progress
+        finally:
+            for _, future in pending:
+                future.cancel()
         
         logger.info("Vocal synthesis complete")
     
+    def _get_segment_pool(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._segment_pool is None:
+                self._segment_pool = ThreadPoolExecutor(
+                    max_workers=get_settings().bark_parallel_segments,
+                    thread_name_prefix="bark-segment",
+                )
+            return self._segment_pool
+    
+    def _synthesize_segment(
+        self,
+        sentence: str,
+        voice_preset: str,
+        voice_type: str,
+        seed: int | None = None,
+        cancel: CancelToken | None = None,
+    ) -> np.ndarray:
+        check(cancel)
+        logger.info("Synthesizing", sentence=sentence[:50], voice=voice_type)
+        
+        with STAGE_SECONDS.time(stage="inference", model="bark"):
+            return self._generate_segment(sentence, voice_preset, seed, cancel)
+    
+    @property
+    def sample_rate(self) -> int:
+        from bark import SAMPLE_RATE
+        
+        return SAMPLE_RATE
+    
+    def _generate_segment(
+        self,
+        sentence: str,
+        voice_preset: str,
+        seed: int | None = None,
+        cancel: CancelToken | None = None,
+    ) -> np.ndarray:
+        """Run the Bark pipeline for one sentence segment.
+        
+        Mirrors ``bark.generate_audio`` stage by stage so the prepared
+        voice prompt and the semantic/coarse tokens can be reused, and so
+        a cancelled request stops at the next stage boundary.
+        """
+        from bark.generation import codec_decode, generate_coarse, generate_fine
+        
+        prompt = self._voice_prompt(voice_preset)
+        key = (sentence.strip(), voice_preset, seed)
+        
+        coarse = self._coarse_cache.get(key)
+        if coarse is None:
+            semantic = self._semantic_cache.get_or_compute(
+                key, lambda: self._sample(seed, self._text_to_semantic, sentence, prompt)
+            )
+            check(cancel)
+            coarse = self._sample(
+                seed, generate_coarse, semantic,
+                history_prompt=prompt, temp=0.7, silent=True, use_kv_caching=True,
+            )
+            self._coarse_cache.put(key, coarse)
+        
+        check(cancel)
+        fine = generate_fine(coarse, history_prompt=prompt, temp=0.5)
+        check(cancel)
+        return codec_decode(fine)
+    
+    @staticmethod
+    def _text_to_semantic(sentence: str, prompt: dict) -> np.ndarray:
+        from bark.generation import generate_text_semantic
+        
+        # bark.generation defaults use_kv_caching to False; generate_audio turns it on
+        return generate_text_semantic(
+            sentence, history_prompt=prompt, temp=0.7, silent=True, use_kv_caching=True
+        )
+    
+    def _sample(self, seed: int | None, fn, *args, **kwargs):
+        """Run a sampling stage, seeding the global RNGs when asked to."""
+        if seed is None:
+            return fn(*args, **kwargs)
+        
+        import torch
+        
+        # torch/numpy RNGs are process-global, so seeded stages run one at a time.
+        with self._seed_lock:
+            torch.manual_seed(seed)
+            np.random.seed(seed % 2**32)
+            return fn(*args, **kwargs)
+    
+    def _voice_prompt(self, voice_preset: str) -> dict:
+        """Load a voice preset's history prompt once."""
+        from bark.generation import _load_history_prompt
+        
+        return self._prompt_cache.get_or_compute(
+            voice_preset, lambda: _load_history_prompt(voice_preset)
+        )
+    
+    def cache_stats(self) -> dict[str, dict[str, int]]:
+        """Hit/miss counters for the prompt and token caches."""
+        return {
+            cache.name: cache.stats()
+            for cache in (self._prompt_cache, self._semantic_cache, self._coarse_cache)
+        }
+    
     def synthesize_full(
         self,
         text: str,
         voice_type: str = "female",
         style: str = "",
+        seed: int | None = None,
     ) -> tuple[np.ndarray, int]:
         """Synthesize complete vocals (non-streaming)."""
         from bark import SAMPLE_RATE
         
         chunks = []
-        for audio, sr, _ in self.synthesize(text, voice_type, style):
+        for audio, sr, _ in self.synthesize(text, voice_type, style, seed):
             chunks.append(audio)
         
         if not chunks:
@@ -118,11 +250,30 @@ class BarkWrapper:
         
         return merged
     
+    def resident_bytes(self) -> int:
+        """Bytes held by Bark's loaded sub-models."""
+        if not self._loaded:
+            return 0
+        
+        from bark.generation import models
+        
+        total = 0
+        for model in models.values():
+            if isinstance(model, dict):
+                model = model.get("model")
+            if model is not None and hasattr(model, "parameters"):
+                total += sum(p.numel() * p.element_size() for p in model.parameters())
+        return total
+    
     def unload(self) -> None:
         """Unload model to free memory."""
         import torch
+        from bark.generation import clean_models
         
+        clean_models()
         self._loaded = False
+        for cache in (self._prompt_cache, self._semantic_cache, self._coarse_cache):
+            cache.clear()
         
         if torch.cuda.is_available():
             torch.cuda.empty_cache()
@@ -0,0 +1,57 @@
+"""Per-description cache in front of MusicGen's T5 text conditioner."""
+from typing import Any
+
+import torch
+from torch import nn
+
+from src.lru import LRUCache
+
+
+def entry_bytes(entry: tuple[torch.Tensor, torch.Tensor]) -> int:
+    return sum(t.numel() * t.element_size() for t in entry)
+
+
+class CachedTextConditioner(nn.Module):
+    """Wraps audiocraft's T5 conditioner so repeated descriptions skip T5.
+    
+    ``ConditioningProvider`` calls ``tokenize`` and then ``forward`` on each
+    conditioner. Tokenizing is deferred to ``forward``, so only descriptions
+    missing from the cache are tokenized and encoded, together in one batch.
+    Entries hold a description's unpadded embeddings and mask; batches are
+    re-padded with zeros to the longest entry, as the tokenizer pads them.
+    """
+    
+    def __init__(self, conditioner: nn.Module, cache: LRUCache, model_id: str):
+        super().__init__()
+        self.conditioner = conditioner
+        self._cache = cache
+        self._model_id = model_id
+    
+    def tokenize(self, texts: list[str | None]) -> list[str | None]:
+        return list(texts)
+    
+    def forward(self, texts: list[str | None]) -> tuple[torch.Tensor, torch.Tensor]:
+        keys = [(self._model_id, text or "") for text in texts]
+        entries: dict[Any, tuple[torch.Tensor, torch.Tensor] | None] = {
+            key: self._cache.get(key) for key in dict.fromkeys(keys)
+        }
+        
+        missing = [key for key, entry in entries.items() if entry is None]
+        if missing:
+            embeds, mask = self.conditioner(self.conditioner.tokenize([text for _, text in missing]))
+            for i, key in enumerate(missing):
+                # Empty descriptions are a fully masked end-of-sequence token
+                length = max(1, int(mask[i].sum()))
+                entry = (embeds[i, :length].clone(), mask[i, :length].clone())
+                entries[key] = entry
+                self._cache.put(key, entry)
+        
+        rows = [entries[key] for key in keys]
+        length = max(row_embeds.shape[0] for row_embeds, _ in rows)
+        first_embeds, first_mask = rows[0]
+        embeds = first_embeds.new_zeros((len(rows), length, first_embeds.shape[-1]))
+        mask = first_mask.new_zeros((len(rows), length))
+        for i, (row_embeds, row_mask) in enumerate(rows):
+            embeds[i, :row_embeds.shape[0]] = row_embeds
+            mask[i, :row_mask.shape[0]] = row_mask
+        return embeds, mask
@@ -1,9 +1,14 @@
 """Demucs wrapper for audio stem separation."""
+from typing import Generator, Iterable
+
 import numpy as np
-import torch
 import structlog
 
-from src.config import detect_device
+from src.audio_buffer import to_host, to_tensor
+from src.cancellation import CancelToken, check
+from src.components.backends import apply_backend, inference_context, resolve_backend
+from src.config import detect_device, get_settings, InferenceBackend
+from src.metrics import STAGE_SECONDS
 
 logger = structlog.get_logger()
 
@@ -11,9 +16,18 @@ logger = structlog.get_logger()
 class DemucsWrapper:
     """Wrapper for Meta's Demucs stem separation model."""
     
+    # Streaming segment layout (whole seconds keep resampled lengths integral)
+    SEGMENT_SECONDS = 12   # audio separated per step
+    OVERLAP_SECONDS = 2    # overlap blended between consecutive segments
+    
+    # Use htdemucs for best quality
+    model_id = "htdemucs"
+    estimated_bytes = 300 * 1024**2
+    
     def __init__(self):
         self._model = None
         self._device = None
+        self._backend = InferenceBackend.EAGER
         self._loaded = False
     
     def load(self) -> None:
@@ -27,15 +41,16 @@ class DemucsWrapper:
         self._device = detect_device()
         logger.info("Loading Demucs", device=self._device)
         
-        # Use htdemucs for best quality
-        self._model = get_model("htdemucs")
+        self._model = get_model(self.model_id)
         if isinstance(self._model, BagOfModels):
             self._model = self._model.models[0]
         
         self._model.to(self._device)
         self._model.eval()
+        self._backend = resolve_backend(get_settings().inference_backend, self._device)
+        apply_backend(self._model, self._backend)
         self._loaded = True
-        logger.info("Demucs loaded successfully")
+        logger.info("Demucs loaded successfully", backend=self._backend.value)
     
     def separate(
         self,
@@ -51,16 +66,102 @@ class DemucsWrapper:
         if not self._loaded:
             self.load()
         
-        from demucs.audio import convert_audio
-        from demucs.apply import apply_model
-        
         logger.info("Separating stems", audio_shape=audio.shape)
         
-        # Convert to torch tensor
         if audio.ndim == 1:
             audio = audio[np.newaxis, :]  # Add channel dimension
         
-        wav = torch.from_numpy(audio).float()
+        result = self._separate_segment(audio, sample_rate)
+        
+        logger.info("Stem separation complete", stems=list(result.keys()))
+        return result
+    
+    def separate_stream(
+        self,
+        blocks: Iterable[np.ndarray],
+        sample_rate: int,
+        channels: int = 1,
+        total_samples: int | None = None,
+        cancel: CancelToken | None = None,
+    ) -> Generator[tuple[dict[str, np.ndarray], int, float], None, None]:
+        """
+        Separate a stream of audio blocks in fixed-length overlapping segments.
+        
+        Blocks hold channel-interleaved float32 samples. Only one segment of
+        input and one overlap of output are kept in memory, regardless of
+        track length. ``cancel`` is checked before each segment.
+        
+        Raises:
+            RequestCancelledError: If ``cancel`` is set before separation finishes
+        
+        Yields:
+            Tuple of (stems, sample_rate, progress) with non-overlapping
+            stem segments shaped (channels, samples)
+        """
+        if not self._loaded:
+            self.load()
+        
+        segment = self.SEGMENT_SECONDS * sample_rate
+        overlap = self.OVERLAP_SECONDS * sample_rate
+        hop = segment - overlap
+        model_rate = self._model.samplerate
+        model_overlap = self.OVERLAP_SECONDS * model_rate
+        
+        # Blocks are de-interleaved straight into one reused segment buffer
+        pending = np.empty((channels, segment), dtype=np.float32)
+        filled = 0
+        consumed = 0
+        held = None
+        
+        for block in blocks:
+            frames = np.asarray(block, dtype=np.float32).reshape(-1, channels).T
+            offset = 0
+            while offset < frames.shape[1]:
+                take = min(segment - filled, frames.shape[1] - offset)
+                pending[:, filled:filled + take] = frames[:, offset:offset + take]
+                filled += take
+                offset += take
+                if filled < segment:
+                    break
+                
+                check(cancel)
+                stems = self._separate_segment(pending, sample_rate)
+                pending[:, :overlap] = pending[:, hop:]
+                filled = overlap
+                consumed += hop
+                
+                stems = _blend(stems, held, model_overlap)
+                held = {name: stem[:, -model_overlap:] for name, stem in stems.items()}
+                
+                progress = consumed / total_samples if total_samples else 0.0
+                yield (
+                    {name: stem[:, :-model_overlap] for name, stem in stems.items()},
+                    model_rate,
+                    min(progress, 0.99),
+                )
+        
+        if held is None and filled == 0:
+            logger.warning("No audio received for stem separation")
+            return
+        
+        # Flush whatever is left after the last full segment
+        check(cancel)
+        if held is None or filled > overlap:
+            stems = _blend(self._separate_segment(pending[:, :filled], sample_rate), held, model_overlap)
+        else:
+            stems = held
+        
+        yield stems, model_rate, 1.0
+        logger.info("Streaming stem separation complete", samples=consumed + filled)
+    
+    def _separate_segment(self, audio: np.ndarray, sample_rate: int) -> dict[str, np.ndarray]:
+        """Run the model on one (channels, samples) block of audio."""
+        import torch
+        from demucs.audio import convert_audio
+        from demucs.apply import apply_model
+        
+        # Shares memory with the numpy input
+        wav = to_tensor(audio)
         if wav.dim() == 2:
             wav = wav.unsqueeze(0)  # Add batch dimension
         
@@ -69,20 +170,31 @@ class DemucsWrapper:
         wav = wav.to(self._device)
         
         # Apply model
-        with torch.no_grad():
+        with torch.no_grad(), STAGE_SECONDS.time(stage="inference", model="demucs"), \
+                inference_context(self._backend, self._device):
             sources = apply_model(self._model, wav, device=self._device, progress=False)
         
         # Extract stems
-        sources = sources[0].cpu().numpy()  # Remove batch dimension
+        with STAGE_SECONDS.time(stage="numpy_conversion", model="demucs"):
+            sources = to_host(sources[0])  # Remove batch dimension
         stem_names = self._model.sources
         
         result = {}
         for i, name in enumerate(stem_names):
             result[name] = sources[i]
         
-        logger.info("Stem separation complete", stems=list(result.keys()))
         return result
     
+    def resident_bytes(self) -> int:
+        """Bytes held by the loaded model's parameters and buffers."""
+        if self._model is None:
+            return 0
+        
+        return sum(
+            t.numel() * t.element_size()
+            for t in [*self._model.parameters(), *self._model.buffers()]
+        )
+    
     def unload(self) -> None:
         """Unload model to free memory."""
         if self._model is not None:
@@ -90,7 +202,24 @@ class DemucsWrapper:
             self._model = None
             self._loaded = False
             
+            import torch
+            
             if torch.cuda.is_available():
                 torch.cuda.empty_cache()
             
             logger.info("Demucs unloaded")
+
+
+def _blend(
+    stems: dict[str, np.ndarray],
+    held: dict[str, np.ndarray] | None,
+    overlap: int,
+) -> dict[str, np.ndarray]:
+    """Overlap-add a segment's head with the held tail of the previous segment."""
+    if held is None:
+        return stems
+    
+    fade_in = np.linspace(0.0, 1.0, overlap, dtype=np.float32)
+    for name, stem in stems.items():
+        stem[:, :overlap] = held[name] * (1.0 - fade_in) + stem[:, :overlap] * fade_in
+    return stems
@@ -0,0 +1,132 @@
+"""Minimal Standard MIDI File writer for chord sketches.
+
+Writes a format 0 file directly into a bytearray. Per-chord event blocks
+and delta-time encodings are memoized, so rendering a bar is a handful of
+``bytearray`` appends rather than a music21 stream export.
+"""
+import functools
+
+TICKS_PER_BEAT = 480
+BEATS_PER_BAR = 4
+CHORD_CHANNEL = 0
+BASS_CHANNEL = 1
+BASS_PROGRAM = 33  # General MIDI "Electric Bass (finger)"
+
+_PITCH_CLASSES = {"C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11}
+_QUALITIES = {
+    "": (0, 4, 7),
+    "m": (0, 3, 7),
+    "7": (0, 4, 7, 10),
+    "m7": (0, 3, 7, 10),
+    "maj7": (0, 4, 7, 11),
+    "mmaj7": (0, 3, 7, 11),
+}
+_END_OF_TRACK = b"\x00\xff\x2f\x00"
+
+
+@functools.lru_cache(maxsize=256)
+def chord_pitches(name: str) -> tuple[int, tuple[int, ...]]:
+    """Return (bass note, chord notes) as MIDI numbers for a name like "F#m7".
+    
+    Accepts ``#`` for sharps and either ``b`` or music21's ``-`` for flats.
+    """
+    if not name or name[0].upper() not in _PITCH_CLASSES:
+        raise ValueError(f"Unrecognised chord: {name!r}")
+    
+    pitch_class = _PITCH_CLASSES[name[0].upper()]
+    i = 1
+    while i < len(name) and name[i] in "#b-":
+        pitch_class += 1 if name[i] == "#" else -1
+        i += 1
+    pitch_class %= 12
+    
+    intervals = _QUALITIES.get(name[i:], _QUALITIES[""])
+    chord_root = 48 + pitch_class  # C3..B3
+    return 36 + pitch_class, tuple(chord_root + step for step in intervals)
+
+
+@functools.lru_cache(maxsize=1024)
+def _vlq(value: int) -> bytes:
+    """Encode a delta time as a MIDI variable-length quantity."""
+    out = bytearray([value & 0x7F])
+    value >>= 7
+    while value:
+        out.insert(0, (value & 0x7F) | 0x80)
+        value >>= 7
+    return bytes(out)
+
+
+@functools.lru_cache(maxsize=1024)
+def _chord_events(name: str, velocity: int) -> tuple[bytes, bytes]:
+    """Note-on and note-off blocks for one chord hit, without the leading delta.
+    
+    Events inside a block share a tick, so each after the first has delta 0.
+    Note-offs are written as note-ons with velocity 0.
+    """
+    bass, notes = chord_pitches(name)
+    voices = [(BASS_CHANNEL, bass)] + [(CHORD_CHANNEL, note) for note in notes]
+    
+    on = b"\x00".join(bytes((0x90 | ch, note, velocity)) for ch, note in voices)
+    off = b"\x00".join(bytes((0x90 | ch, note, 0)) for ch, note in voices)
+    return on, off
+
+
+def hits_per_bar(energy: float) -> int:
+    """Chord attacks per bar: sustained, half notes or quarter notes."""
+    if energy < 0.4:
+        return 1
+    if energy < 0.7:
+        return 2
+    return BEATS_PER_BAR
+
+
+def velocity_for(energy: float) -> int:
+    return int(40 + 80 * min(max(energy, 0.0), 1.0))
+
+
+def render_progression(
+    chords: list[str],
+    sections: list[dict],
+    tempo_bpm: int = 120,
+    ticks_per_beat: int = TICKS_PER_BEAT,
+) -> bytes:
+    """Render a looping chord progression across song sections as an SMF.
+    
+    Each bar plays the next chord of the progression. A section's energy
+    sets the velocity and how many times per bar the chord is struck.
+    
+    Returns:
+        Format 0 Standard MIDI File bytes, or ``b""`` if there is nothing to play
+    """
+    if not chords or not sections:
+        return b""
+    
+    tempo = 60_000_000 // (tempo_bpm if tempo_bpm > 0 else 120)
+    bar_ticks = ticks_per_beat * BEATS_PER_BAR
+    
+    track = bytearray()
+    track += b"\x00\xff\x51\x03" + tempo.to_bytes(3, "big")
+    track += b"\x00\xff\x58\x04\x04\x02\x18\x08"  # 4/4
+    track += bytes((0, 0xC0 | BASS_CHANNEL, BASS_PROGRAM))
+    
+    bar = 0
+    for section in sections:
+        energy = section["energy_level"]
+        velocity = velocity_for(energy)
+        hits = hits_per_bar(energy)
+        length = _vlq(bar_ticks // hits)
+        
+        for _ in range(section["duration_bars"]):
+            on, off = _chord_events(chords[bar % len(chords)], velocity)
+            for _ in range(hits):
+                track += b"\x00"
+                track += on
+                track += length
+                track += off
+            bar += 1
+    
+    track += _END_OF_TRACK
+    
+    header = b"MThd" + (6).to_bytes(4, "big") + (0).to_bytes(2, "big") \
+        + (1).to_bytes(2, "big") + ticks_per_beat.to_bytes(2, "big")
+    return header + b"MTrk" + len(track).to_bytes(4, "big") + bytes(track)
@@ -1,21 +1,69 @@
 """MusicGen wrapper for instrumental audio generation."""
-from typing import Generator
-import torch
+import threading
+from contextlib import contextmanager
+from typing import Generator, NamedTuple
 import numpy as np
 import structlog
 
-from src.config import get_settings, detect_device, MusicGenModelSize
+from src.audio_buffer import to_host
+from src.cancellation import CancelToken, check
+from src.components.backends import apply_backend, inference_context, resolve_backend
+from src.config import get_settings, detect_device, InferenceBackend, MusicGenModelSize
+from src.lru import LRUCache
+from src.metrics import STAGE_SECONDS
 
 logger = structlog.get_logger()
 
 
+class GenerationRequest(NamedTuple):
+    """A single prompt within a batched generation."""
+    prompt: str
+    genre: str = ""
+    energy_level: float = 0.5
+
+
 class MusicGenWrapper:
     """Wrapper for Meta's MusicGen model."""
     
+    # Streaming window layout
+    CHUNK_SECONDS = 10     # new audio generated per window
+    OVERLAP_SECONDS = 2    # tail of the previous window used as continuation prompt
+    
+    # Sampling parameters applied on load
+    GENERATION_PARAMS = {
+        "use_sampling": True,
+        "top_k": 250,
+        "top_p": 0.0,
+        "temperature": 1.0,
+    }
+    
+    # Rough resident footprint used for budgeting before the first load
+    _ESTIMATED_BYTES = {
+        MusicGenModelSize.SMALL: 2 * 1024**3,
+        MusicGenModelSize.MEDIUM: 7 * 1024**3,
+        MusicGenModelSize.LARGE: 14 * 1024**3,
+    }
+    
     def __init__(self):
         self._model = None
         self._device = None
+        self._backend = InferenceBackend.EAGER
         self._loaded = False
+        # Token of the generation running on each thread, polled per decoding step
+        self._step_state = threading.local()
+        # Generation params live on the shared model; each window sets them
+        # and generates under this lock so concurrent batches can't interleave
+        self._generate_lock = threading.Lock()
+        self._conditioning_cache = None
+    
+    @property
+    def model_id(self) -> str:
+        """Pretrained checkpoint name for the configured model size."""
+        return f"facebook/musicgen-{get_settings().musicgen_model_size.value}"
+    
+    @property
+    def estimated_bytes(self) -> int:
+        return self._ESTIMATED_BYTES[get_settings().musicgen_model_size]
     
     def load(self) -> None:
         """Load the MusicGen model."""
@@ -27,19 +75,51 @@ class MusicGenWrapper:
         settings = get_settings()
         self._device = detect_device()
         
-        model_name = f"facebook/musicgen-{settings.musicgen_model_size.value}"
+        model_name = self.model_id
         logger.info("Loading MusicGen", model=model_name, device=self._device)
         
         self._model = MusicGen.get_pretrained(model_name, device=self._device)
         self._model.set_generation_params(
             duration=min(30, settings.max_duration_seconds),
-            use_sampling=True,
-            top_k=250,
-            top_p=0.0,
-            temperature=1.0,
+            **self.GENERATION_PARAMS,
         )
+        self._model.set_custom_progress_callback(self._on_step)
+        self._cache_conditioning()
+        
+        # Only the language model; the EnCodec decoder stays in fp32 eager
+        self._backend = resolve_backend(settings.inference_backend, self._device)
+        apply_backend(self._model.lm, self._backend)
         self._loaded = True
-        logger.info("MusicGen loaded successfully")
+        logger.info("MusicGen loaded successfully", backend=self._backend.value)
+    
+    def _cache_conditioning(self) -> None:
+        """Put the text-conditioning cache in front of the model's T5 conditioner.
+        
+        Sections of one song repeat the same enhanced prompt, and the CFG
+        null condition is the same empty description every time.
+        """
+        from src.components.conditioning_cache import CachedTextConditioner, entry_bytes
+        
+        conditioners = self._model.lm.condition_provider.conditioners
+        if "description" not in conditioners:
+            return
+        
+        if self._conditioning_cache is None:
+            self._conditioning_cache = LRUCache(
+                "musicgen_conditioning",
+                max_entries=4096,
+                max_bytes=get_settings().musicgen_condition_cache_mb * 1024 * 1024,
+                size_of=entry_bytes,
+            )
+        conditioners["description"] = CachedTextConditioner(
+            conditioners["description"], self._conditioning_cache, self.model_id
+        )
+    
+    def cache_stats(self) -> dict[str, dict[str, int]]:
+        """Hit/miss counters and size of the text-conditioning cache."""
+        if self._conditioning_cache is None:
+            return {}
+        return {self._conditioning_cache.name: self._conditioning_cache.stats()}
     
     def generate(
         self,
@@ -47,6 +127,7 @@ class MusicGenWrapper:
         duration_seconds: int = 30,
         genre: str = "",
         energy_level: float = 0.5,
+        cancel: CancelToken | None = None,
     ) -> Generator[tuple[np.ndarray, int, float], None, None]:
         """
         Generate audio from a text prompt with streaming chunks.
@@ -54,32 +135,87 @@ class MusicGenWrapper:
         Yields:
             Tuple of (audio_chunk, sample_rate, progress)
         """
+        request = GenerationRequest(prompt, genre, energy_level)
+        for audio, sample_rate, progress in self.generate_batch([request], duration_seconds, cancel):
+            yield audio[0], sample_rate, progress
+    
+    def generate_batch(
+        self,
+        requests: list[GenerationRequest],
+        duration_seconds: int = 30,
+        cancel: CancelToken | None = None,
+    ) -> Generator[tuple[np.ndarray, int, float], None, None]:
+        """
+        Generate audio for several prompts of the same duration in one forward pass.
+        
+        Args:
+            cancel: Checked between windows and decoding steps
+        
+        Raises:
+            RequestCancelledError: If ``cancel`` is set before generation finishes
+        
+        Yields:
+            Tuple of (audio_batch, sample_rate, progress) where audio_batch
+            is shaped (batch, channels, samples)
+        """
+        import torch
+        
         if not self._loaded:
             self.load()
         
         settings = get_settings()
-        duration = min(duration_seconds, settings.max_duration_seconds)
+        duration = max(1, min(duration_seconds, settings.max_duration_seconds))
         
-        # Build enhanced prompt
-        enhanced_prompt = self._build_prompt(prompt, genre, energy_level)
-        logger.info("Generating audio", prompt=enhanced_prompt[:100], duration=duration)
+        # Build enhanced prompts
+        with STAGE_SECONDS.time(stage="prompt_build", model="musicgen"):
+            descriptions = [
+                self._build_prompt(r.prompt, r.genre, r.energy_level) for r in requests
+            ]
+        logger.info("Generating audio", prompt=descriptions[0][:100],
+                    batch_size=len(descriptions), duration=duration)
         
-        self._model.set_generation_params(duration=duration)
+        sample_rate = self._model.sample_rate
+        overlap = int(self.OVERLAP_SECONDS * sample_rate)
+        produced = 0
+        # (model output to continue from, decoded audio to blend) from the last window
+        held = None
         
-        # Generate in chunks for streaming
-        chunk_duration = 10  # seconds per chunk
-        total_chunks = max(1, duration // chunk_duration)
-        
-        for i in range(total_chunks):
-            with torch.no_grad():
-                # Generate chunk
-                wav = self._model.generate([enhanced_prompt], progress=False)
-                audio = wav[0].cpu().numpy()
-                
-                # Calculate progress
-                progress = (i + 1) / total_chunks
-                
-                yield audio, self._model.sample_rate, progress
+        # Each window only generates the next CHUNK_SECONDS of new audio,
+        # continuing from the tail of the previous window.
+        while produced < duration:
+            check(cancel)
+            window = min(self.CHUNK_SECONDS, duration - produced)
+            
+            # progress=True routes every decoding step through _on_step
+            with torch.no_grad(), STAGE_SECONDS.time(stage="inference", model="musicgen"), \
+                    self._cancel_scope(cancel), inference_context(self._backend, self._device), \
+                    self._generate_lock:
+                if held is None:
+                    self._model.set_generation_params(duration=window)
+                    wav = self._model.generate(descriptions, progress=True)
+                else:
+                    self._model.set_generation_params(duration=self.OVERLAP_SECONDS + window)
+                    wav = self._model.generate_continuation(
+                        held[0], sample_rate, descriptions, progress=True
+                    )
+            
+            with STAGE_SECONDS.time(stage="numpy_conversion", model="musicgen"):
+                audio = to_host(wav)
+            
+            if held is not None:
+                # The continuation re-decodes the prompt; blend it with the held tail
+                audio[..., :overlap] = _crossfade(held[1], audio[..., :overlap])
+            
+            produced += window
+            progress = produced / duration
+            
+            if produced >= duration:
+                yield audio, sample_rate, 1.0
+                break
+            
+            # Hold back the overlap so it can be blended with the next window
+            held = (wav[..., -overlap:], audio[..., -overlap:])
+            yield audio[..., :-overlap], sample_rate, progress
         
         logger.info("Audio generation complete", duration=duration)
     
@@ -103,6 +239,19 @@ class MusicGenWrapper:
         
         return np.concatenate(chunks, axis=-1), sample_rate
     
+    @contextmanager
+    def _cancel_scope(self, cancel: CancelToken | None):
+        """Expose ``cancel`` to the step callback for calls made on this thread."""
+        self._step_state.cancel = cancel
+        try:
+            yield
+        finally:
+            self._step_state.cancel = None
+    
+    def _on_step(self, generated_tokens: int, tokens_to_generate: int) -> None:
+        """Progress callback run by audiocraft after each decoding step."""
+        check(getattr(self._step_state, "cancel", None))
+    
     def _build_prompt(self, base_prompt: str, genre: str, energy_level: float) -> str:
         """Build enhanced prompt with genre and energy hints."""
         parts = [base_prompt]
@@ -118,14 +267,36 @@ class MusicGenWrapper:
         
         return ", ".join(parts)
     
+    def resident_bytes(self) -> int:
+        """Bytes held by the loaded model's parameters and buffers."""
+        if self._model is None:
+            return 0
+        
+        modules = [self._model.lm, self._model.compression_model]
+        return sum(
+            t.numel() * t.element_size()
+            for module in modules
+            for t in [*module.parameters(), *module.buffers()]
+        )
+    
     def unload(self) -> None:
         """Unload model to free memory."""
         if self._model is not None:
             del self._model
             self._model = None
             self._loaded = False
+            if self._conditioning_cache is not None:
+                self._conditioning_cache.clear()
+            
+            import torch
             
             if torch.cuda.is_available():
                 torch.cuda.empty_cache()
             
             logger.info("MusicGen unloaded")
+
+
+def _crossfade(tail: np.ndarray, head: np.ndarray) -> np.ndarray:
+    """Linearly crossfade two aligned, correlated regions of equal length."""
+    fade_in = np.linspace(0.0, 1.0, tail.shape[-1], dtype=np.float32)
+    return tail * (1.0 - fade_in) + head * fade_in
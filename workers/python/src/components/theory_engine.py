@@ -1,17 +1,37 @@
 """Music theory engine using music21."""
 import random
 import structlog
-from music21 import key, chord, interval, pitch, roman
+
+from src.components.midi_writer import render_progression
+from src.lru import LRUCache
 
 logger = structlog.get_logger()
 
 class TheoryEngine:
     """Generates musical structures and theory elements."""
     
+    # Define scale degree patterns for genres
+    PATTERNS = {
+        "electronic": ["i", "VI", "III", "VII"], # Axis progression variant
+        "pop": ["I", "V", "vi", "IV"], # Standard pop
+        "jazz": ["ii7", "V7", "Imaj7", "VI7"], # 2-5-1-6
+        "lofi": ["Imaj7", "vi7", "ii7", "V7"],
+        "classical": ["I", "IV", "V", "I"],
+        "rock": ["I", "IV", "I", "V"],
+        "cinematic": ["i", "VI", "iv", "V"],
+        "ambient": ["Imaj7", "IVmaj7", "I", "V"],
+    }
+    
+    ROOTS = ("C", "C#", "D", "Eb", "E", "F", "F#", "G", "Ab", "A", "Bb", "B")
+    MODES = ("major", "minor")
+    
     def __init__(self):
         """Initialize theory engine."""
-        pass
-        
+        # Progressions and section layouts are pure functions of their
+        # arguments, so each is built with music21 at most once.
+        self._progressions = LRUCache("theory_progression", max_entries=1024)
+        self._sections = LRUCache("theory_sections", max_entries=64)
+    
     def generate_progression(self, root: str, mode: str, genre: str = "electronic") -> list[str]:
         """Generate a chord progression based on key and genre.
         
@@ -23,26 +43,44 @@ class TheoryEngine:
         Returns:
             List of chord names (e.g., ["C", "Am", "F", "G"])
         """
-        # Normalize inputs
         mode = mode.lower()
+        style = genre.lower() if genre.lower() in self.PATTERNS else "pop"
+        
+        chords = self._progressions.get_or_compute(
+            (root, mode, style), lambda: self._build_progression(root, mode, style)
+        )
+        return list(chords)
+    
+    def generate_progressions(
+        self, keys: list[tuple[str, str]], genres: list[str]
+    ) -> list[tuple[str, str, str, list[str]]]:
+        """Generate progressions for every (key, genre) combination.
+        
+        Returns:
+            List of (root, mode, genre, chords) tuples, keys outermost
+        """
+        return [
+            (root, mode, genre, self.generate_progression(root, mode, genre))
+            for root, mode in keys
+            for genre in genres
+        ]
+    
+    def precompute(self) -> None:
+        """Build every progression for the standard roots, modes and genres."""
+        for root in self.ROOTS:
+            for mode in self.MODES:
+                for genre in self.PATTERNS:
+                    self.generate_progression(root, mode, genre)
+        logger.info("Precomputed progressions", count=len(self._progressions))
+    
+    def _build_progression(self, root: str, mode: str, style: str) -> tuple[str, ...]:
+        from music21 import key, roman
         
         # Create key object
         k = key.Key(root, mode)
         
-        # Define scale degree patterns for genres
-        patterns = {
-            "electronic": ["i", "VI", "III", "VII"], # Axis progression variant
-            "pop": ["I", "V", "vi", "IV"], # Standard pop
-            "jazz": ["ii7", "V7", "Imaj7", "VI7"], # 2-5-1-6
-            "lofi": ["Imaj7", "vi7", "ii7", "V7"],
-            "classical": ["I", "IV", "V", "I"],
-            "rock": ["I", "IV", "I", "V"],
-            "cinematic": ["i", "VI", "iv", "V"],
-            "ambient": ["Imaj7", "IVmaj7", "I", "V"],
-        }
-        
         # Select pattern
-        prog_degrees = patterns.get(genre.lower(), patterns["pop"])
+        prog_degrees = self.PATTERNS[style]
         
         # Adjust for minor key if mode is minor but pattern uses major notation largely
         # music21 handles this if we request roman numerals relative to key
@@ -78,14 +116,27 @@ class TheoryEngine:
             
             chords.append(chord_name)
             
-        logger.info("Generated progression", root=root, mode=mode, genre=genre, chords=chords)
-        return chords
+        logger.info("Generated progression", root=root, mode=mode, genre=style, chords=chords)
+        return tuple(chords)
 
+    def render_midi(self, chords: list[str], sections: list[dict], tempo_bpm: int = 120) -> bytes:
+        """Render the progression across the sections as a Standard MIDI File.
+        
+        Section energy maps to note velocity and chord density.
+        """
+        return render_progression(chords, sections, tempo_bpm)
+    
     def generate_sections(self, duration_bars: int = 64) -> list[dict]:
         """Generate song structure sections.
         
         Returns list of dicts with section info.
         """
+        sections = self._sections.get_or_compute(
+            duration_bars, lambda: self._build_sections(duration_bars)
+        )
+        return [dict(section, elements=list(section["elements"])) for section in sections]
+    
+    def _build_sections(self, duration_bars: int) -> list[dict]:
         # Simple structural template
         # 8 intro -> 16 verse -> 8 chorus -> 16 verse -> 8 chorus -> 8 bridge -> 8 chorus -> 8 outro = 72?
         # Adjust to fit duration
@@ -21,28 +21,99 @@ class MusicGenModelSize(str, Enum):
     LARGE = "large"      # ~3.3B params, best quality
 
 
+class InferenceBackend(str, Enum):
+    """How model weights and graphs are prepared for inference."""
+    EAGER = "eager"        # fp32 eager PyTorch
+    INT8 = "int8"          # dynamic int8 quantization of linear layers (CPU)
+    BF16 = "bf16"          # bfloat16 autocast where the device supports it
+    COMPILED = "compiled"  # torch.compile'd forward passes
+
+
 class Settings(BaseModel):
     """Worker configuration."""
     grpc_port: int = Field(default=50051, description="gRPC server port")
+    grpc_max_message_mb: int = Field(default=100, description="Max gRPC message size")
+    max_upload_mb: int = Field(default=512, description="Largest audio upload accepted by SeparateStemsUpload")
+    metrics_port: int = Field(default=0, description="HTTP port for /metrics (0 disables)")
     device: DeviceType = Field(default=DeviceType.AUTO, description="Compute device")
     musicgen_model_size: MusicGenModelSize = Field(
         default=MusicGenModelSize.SMALL,
         description="MusicGen model size"
     )
+    inference_backend: InferenceBackend = Field(
+        default=InferenceBackend.EAGER,
+        description="Inference backend for MusicGen and Demucs"
+    )
     max_duration_seconds: int = Field(default=300, description="Max generation duration")
     output_sample_rate: int = Field(default=44100, description="Output audio sample rate")
+    output_loudness_lufs: float = Field(default=-14.0, description="Integrated loudness audio and vocals are normalized to (0 disables)")
+    seam_crossfade_ms: int = Field(default=20, description="Equal-power crossfade between separately generated vocal segments")
+    musicgen_max_concurrent: int = Field(default=4, description="MusicGen requests admitted at once (0 = unlimited)")
+    bark_max_concurrent: int = Field(default=2, description="Bark requests admitted at once (0 = unlimited)")
+    demucs_max_concurrent: int = Field(default=1, description="Demucs requests admitted at once (0 = unlimited)")
+    admission_queue_size: int = Field(default=16, description="Waiting requests per model and priority before rejecting")
+    worker_processes: int = Field(default=0, description="Model worker processes (0 = run models in the serving process)")
+    inference_workers: int = Field(default=1, description="Inference threads per model")
+    model_memory_budget_mb: int = Field(
+        default=0, description="Memory budget for resident models (0 = unlimited)"
+    )
+    bark_parallel_segments: int = Field(default=2, description="Bark segments generated concurrently")
+    bark_token_cache_size: int = Field(default=256, description="Bark lines kept in the semantic/coarse token cache")
+    musicgen_condition_cache_mb: int = Field(
+        default=64, description="Memory for cached MusicGen text-conditioning embeddings (0 = unbounded)"
+    )
+    batch_window_ms: int = Field(default=25, description="MusicGen batching window")
+    max_batch_size: int = Field(default=4, description="Max prompts per MusicGen batch")
+    cache_dir: str = Field(default="", description="Result cache directory (empty disables)")
+    cache_max_mb: int = Field(default=2048, description="Result cache size budget")
+    cache_ttl_seconds: int = Field(default=86400, description="Result cache entry lifetime")
+    job_dir: str = Field(default="", description="Durable job store directory (empty disables jobs)")
+    job_max_running: int = Field(default=2, description="Jobs generating at once")
+    job_ttl_seconds: int = Field(default=7 * 24 * 3600, description="Finished job retention")
+    artifact_dir: str = Field(default="", description="Artifact store directory (empty disables artifacts)")
+    artifact_ttl_seconds: int = Field(default=3600, description="Artifact lifetime without a retain")
+    uds_path: str = Field(default="", description="Unix domain socket to also listen on (empty disables)")
     
     @classmethod
     def from_env(cls) -> "Settings":
         """Load settings from environment variables."""
         return cls(
             grpc_port=int(os.getenv("MUSICFORGE_GRPC_PORT", "50051")),
+            grpc_max_message_mb=int(os.getenv("MUSICFORGE_GRPC_MAX_MESSAGE_MB", "100")),
+            max_upload_mb=int(os.getenv("MUSICFORGE_MAX_UPLOAD_MB", "512")),
+            metrics_port=int(os.getenv("MUSICFORGE_METRICS_PORT", "0")),
             device=DeviceType(os.getenv("MUSICFORGE_DEVICE", "auto").lower()),
             musicgen_model_size=MusicGenModelSize(
                 os.getenv("MUSICFORGE_MUSICGEN_MODEL_SIZE", "small").lower()
             ),
+            inference_backend=InferenceBackend(
+                os.getenv("MUSICFORGE_INFERENCE_BACKEND", "eager").lower()
+            ),
             max_duration_seconds=int(os.getenv("MUSICFORGE_MAX_DURATION", "300")),
             output_sample_rate=int(os.getenv("MUSICFORGE_SAMPLE_RATE", "44100")),
+            output_loudness_lufs=float(os.getenv("MUSICFORGE_OUTPUT_LOUDNESS_LUFS", "-14")),
+            seam_crossfade_ms=int(os.getenv("MUSICFORGE_SEAM_CROSSFADE_MS", "20")),
+            musicgen_max_concurrent=int(os.getenv("MUSICFORGE_MUSICGEN_MAX_CONCURRENT", "4")),
+            bark_max_concurrent=int(os.getenv("MUSICFORGE_BARK_MAX_CONCURRENT", "2")),
+            demucs_max_concurrent=int(os.getenv("MUSICFORGE_DEMUCS_MAX_CONCURRENT", "1")),
+            admission_queue_size=int(os.getenv("MUSICFORGE_ADMISSION_QUEUE_SIZE", "16")),
+            worker_processes=int(os.getenv("MUSICFORGE_WORKER_PROCESSES", "0")),
+            inference_workers=int(os.getenv("MUSICFORGE_INFERENCE_WORKERS", "1")),
+            model_memory_budget_mb=int(os.getenv("MUSICFORGE_MODEL_MEMORY_MB", "0")),
+            bark_parallel_segments=int(os.getenv("MUSICFORGE_BARK_PARALLEL_SEGMENTS", "2")),
+            bark_token_cache_size=int(os.getenv("MUSICFORGE_BARK_TOKEN_CACHE", "256")),
+            musicgen_condition_cache_mb=int(os.getenv("MUSICFORGE_MUSICGEN_CONDITION_CACHE_MB", "64")),
+            batch_window_ms=int(os.getenv("MUSICFORGE_BATCH_WINDOW_MS", "25")),
+            max_batch_size=int(os.getenv("MUSICFORGE_MAX_BATCH_SIZE", "4")),
+            cache_dir=os.getenv("MUSICFORGE_CACHE_DIR", ""),
+            cache_max_mb=int(os.getenv("MUSICFORGE_CACHE_MAX_MB", "2048")),
+            cache_ttl_seconds=int(os.getenv("MUSICFORGE_CACHE_TTL", "86400")),
+            job_dir=os.getenv("MUSICFORGE_JOB_DIR", ""),
+            job_max_running=int(os.getenv("MUSICFORGE_JOB_MAX_RUNNING", "2")),
+            job_ttl_seconds=int(os.getenv("MUSICFORGE_JOB_TTL", "604800")),
+            artifact_dir=os.getenv("MUSICFORGE_ARTIFACT_DIR", ""),
+            artifact_ttl_seconds=int(os.getenv("MUSICFORGE_ARTIFACT_TTL", "3600")),
+            uds_path=os.getenv("MUSICFORGE_UDS_PATH", ""),
         )
 
 
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0cworker.proto\x12\x11musicforge.worker\"\x88\x01\n\rTheoryRequest\x12\r\n\x05genre\x18\x01 \x01(\t\x12\x0c\n\x04mood\x18\x02 \x01(\t\x12\x11\n\ttempo_bpm\x18\x03 \x01(\x05\x12\x0b\n\x03key\x18\x04 \x01(\t\x12\x0c\n\x04mode\x18\x05 \x01(\t\x12\x18\n\x10\x64uration_seconds\x18\x06 \x01(\x05\x12\x12\n\nstyle_tags\x18\x07 \x03(\t\"l\n\x0eTheoryResponse\x12\x19\n\x11\x63hord_progression\x18\x01 \x03(\t\x12,\n\x08sections\x18\x02 \x03(\x0b\x32\x1a.musicforge.worker.Section\x12\x11\n\tmidi_data\x18\x03 \x01(\x0c\"i\n\x07Section\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\tstart_bar\x18\x02 \x01(\x05\x12\x15\n\rduration_bars\x18\x03 \x01(\x05\x12\x14\n\x0c\x65nergy_level\x18\x04 \x01(\x02\x12\x10\n\x08\x65lements\x18\x05 \x03(\t\"\x8f\x01\n\x0c\x41udioRequest\x12\x0e\n\x06prompt\x18\x01 \x01(\t\x12\x18\n\x10\x64uration_seconds\x18\x02 \x01(\x05\x12\r\n\x05genre\x18\x03 \x01(\t\x12\x14\n\x0c\x65nergy_level\x18\x04 \x01(\x02\x12\x1a\n\x12\x63onditioning_audio\x18\x05 \x01(\x0c\x12\x14\n\x0csection_name\x18\x06 \x01(\t\"Y\n\nAudioChunk\x12\x12\n\naudio_data\x18\x01 \x01(\x0c\x12\x13\n\x0bsample_rate\x18\x02 \x01(\x05\x12\x10\n\x08is_final\x18\x03 \x01(\x08\x12\x10\n\x08progress\x18\x04 \x01(\x02\"]\n\x0cVocalRequest\x12\x0e\n\x06lyrics\x18\x01 \x01(\t\x12\x12\n\nvoice_type\x18\x02 \x01(\t\x12\r\n\x05style\x18\x03 \x01(\t\x12\x1a\n\x12target_duration_ms\x18\x04 \x01(\x05\"6\n\x0bStemRequest\x12\x12\n\naudio_data\x18\x01 \x01(\x0c\x12\x13\n\x0bsample_rate\x18\x02 \x01(\x05\"_\n\x0cStemResponse\x12\r\n\x05\x64rums\x18\x01 \x01(\x0c\x12\x0c\n\x04\x62\x61ss\x18\x02 \x01(\x0c\x12\x0e\n\x06vocals\x18\x03 \x01(\x0c\x12\r\n\x05other\x18\x04 \x01(\x0c\x12\x13\n\x0bsample_rate\x18\x05 \x01(\x05\"\x07\n\x05\x45mpty\"h\n\x0eHealthResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x15\n\rgpu_available\x18\x02 \x01(\x08\x12\x18\n\x10gpu_memory_bytes\x18\x03 \x01(\x03\x12\x15\n\rmodels_loaded\x18\x04 \x03(\t2\xad\x03\n\x0bMusicWorker\x12U\n\x0eGenerateTheory\x12 .musicforge.worker.TheoryRequest\x1a!.musicforge.worker.TheoryResponse\x12S\n\x0fSynthesizeAudio\x12\x1f.musicforge.worker.AudioRequest\x1a\x1d.musicforge.worker.AudioChunk0\x01\x12T\n\x10SynthesizeVocals\x12\x1f.musicforge.worker.VocalRequest\x1a\x1d.musicforge.worker.AudioChunk0\x01\x12P\n\rSeparateStems\x12\x1e.musicforge.worker.StemRequest\x1a\x1f.musicforge.worker.StemResponse\x12J\n\x0bHealthCheck\x12\x18.musicforge.worker.Empty\x1a!.musicforge.worker.HealthResponseB!\xaa\x02\x1eMusicForge.Infrastructure.Grpcb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0cworker.proto\x12\x11musicforge.worker\"\x88\x01\n\rTheoryRequest\x12\r\n\x05genre\x18\x01 \x01(\t\x12\x0c\n\x04mood\x18\x02 \x01(\t\x12\x11\n\ttempo_bpm\x18\x03 \x01(\x05\x12\x0b\n\x03key\x18\x04 \x01(\t\x12\x0c\n\x04mode\x18\x05 \x01(\t\x12\x18\n\x10\x64uration_seconds\x18\x06 \x01(\x05\x12\x12\n\nstyle_tags\x18\x07 \x03(\t\"l\n\x0eTheoryResponse\x12\x19\n\x11\x63hord_progression\x18\x01 \x03(\t\x12,\n\x08sections\x18\x02 \x03(\x0b\x32\x1a.musicforge.worker.Section\x12\x11\n\tmidi_data\x18\x03 \x01(\x0c\"3\n\x13ProgressionsRequest\x12\x0c\n\x04keys\x18\x01 \x03(\t\x12\x0e\n\x06genres\x18\x02 \x03(\t\"9\n\x0bProgression\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05genre\x18\x02 \x01(\t\x12\x0e\n\x06\x63hords\x18\x03 \x03(\t\"L\n\x14ProgressionsResponse\x12\x34\n\x0cprogressions\x18\x01 \x03(\x0b\x32\x1e.musicforge.worker.Progression\"i\n\x07Section\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\tstart_bar\x18\x02 \x01(\x05\x12\x15\n\rduration_bars\x18\x03 \x01(\x05\x12\x14\n\x0c\x65nergy_level\x18\x04 \x01(\x02\x12\x10\n\x08\x65lements\x18\x05 \x03(\t\"\xdc\x01\n\x0e\x41rtifactHandle\x12\x13\n\x0b\x61rtifact_id\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t\x12\x0e\n\x06offset\x18\x03 \x01(\x03\x12\x0e\n\x06length\x18\x04 \x01(\x03\x12\r\n\x05\x64type\x18\x05 \x01(\t\x12\x10\n\x08\x63hannels\x18\x06 \x01(\x05\x12\x13\n\x0bsample_rate\x18\x07 \x01(\x05\x12\x31\n\x06\x66ormat\x18\x08 \x01(\x0e\x32!.musicforge.worker.ArtifactFormat\x12\x0c\n\x04name\x18\t \x01(\t\x12\x10\n\x08\x63omplete\x18\n \x01(\x08\"&\n\x0f\x41rtifactRequest\x12\x13\n\x0b\x61rtifact_id\x18\x01 \x01(\t\"M\n\x0e\x41rtifactStatus\x12\x13\n\x0b\x61rtifact_id\x18\x01 \x01(\t\x12\x12\n\nreferences\x18\x02 \x01(\x05\x12\x12\n\nexpires_at\x18\x03 \x01(\x01\"\xae\x02\n\x0c\x41udioRequest\x12\x0e\n\x06prompt\x18\x01 \x01(\t\x12\x18\n\x10\x64uration_seconds\x18\x02 \x01(\x05\x12\r\n\x05genre\x18\x03 \x01(\t\x12\x14\n\x0c\x65nergy_level\x18\x04 \x01(\x02\x12\x1a\n\x12\x63onditioning_audio\x18\x05 \x01(\x0c\x12\x14\n\x0csection_name\x18\x06 \x01(\t\x12\x32\n\x08\x65ncoding\x18\x07 \x01(\x0e\x32 .musicforge.worker.AudioEncoding\x12-\n\x08priority\x18\x08 \x01(\x0e\x32\x1b.musicforge.worker.Priority\x12:\n\x0f\x61rtifact_format\x18\t \x01(\x0e\x32!.musicforge.worker.ArtifactFormat\"\x90\x02\n\nAudioChunk\x12\x12\n\naudio_data\x18\x01 \x01(\x0c\x12\x13\n\x0bsample_rate\x18\x02 \x01(\x05\x12\x10\n\x08is_final\x18\x03 \x01(\x08\x12\x10\n\x08progress\x18\x04 \x01(\x02\x12\x32\n\x08\x65ncoding\x18\x05 \x01(\x0e\x32 .musicforge.worker.AudioEncoding\x12\x16\n\x0equeue_position\x18\x06 \x01(\x05\x12\x1e\n\x16\x65stimated_wait_seconds\x18\x07 \x01(\x02\x12\x14\n\x0csection_name\x18\x08 \x01(\t\x12\x33\n\x08\x61rtifact\x18\t \x01(\x0b\x32!.musicforge.worker.ArtifactHandle\"\xaa\x02\n\x12\x41rrangementRequest\x12\x0e\n\x06prompt\x18\x01 \x01(\t\x12\r\n\x05genre\x18\x02 \x01(\t\x12\x11\n\ttempo_bpm\x18\x03 \x01(\x05\x12\x15\n\rbeats_per_bar\x18\x04 \x01(\x05\x12,\n\x08sections\x18\x05 \x03(\x0b\x32\x1a.musicforge.worker.Section\x12\x32\n\x08\x65ncoding\x18\x06 \x01(\x0e\x32 .musicforge.worker.AudioEncoding\x12-\n\x08priority\x18\x07 \x01(\x0e\x32\x1b.musicforge.worker.Priority\x12:\n\x0f\x61rtifact_format\x18\x08 \x01(\x0e\x32!.musicforge.worker.ArtifactFormat\"\xfc\x01\n\x0cVocalRequest\x12\x0e\n\x06lyrics\x18\x01 \x01(\t\x12\x12\n\nvoice_type\x18\x02 \x01(\t\x12\r\n\x05style\x18\x03 \x01(\t\x12\x1a\n\x12target_duration_ms\x18\x04 \x01(\x05\x12\x32\n\x08\x65ncoding\x18\x05 \x01(\x0e\x32 .musicforge.worker.AudioEncoding\x12-\n\x08priority\x18\x06 \x01(\x0e\x32\x1b.musicforge.worker.Priority\x12:\n\x0f\x61rtifact_format\x18\x07 \x01(\x0e\x32!.musicforge.worker.ArtifactFormat\"\xe7\x01\n\x0bStemRequest\x12\x12\n\naudio_data\x18\x01 \x01(\x0c\x12\x13\n\x0bsample_rate\x18\x02 \x01(\x05\x12\x10\n\x08\x63hannels\x18\x03 \x01(\x05\x12\x32\n\x08\x65ncoding\x18\x04 \x01(\x0e\x32 .musicforge.worker.AudioEncoding\x12-\n\x08priority\x18\x05 \x01(\x0e\x32\x1b.musicforge.worker.Priority\x12:\n\x0f\x61rtifact_format\x18\x06 \x01(\x0e\x32!.musicforge.worker.ArtifactFormat\"\xc9\x01\n\x0cStemResponse\x12\r\n\x05\x64rums\x18\x01 \x01(\x0c\x12\x0c\n\x04\x62\x61ss\x18\x02 \x01(\x0c\x12\x0e\n\x06vocals\x18\x03 \x01(\x0c\x12\r\n\x05other\x18\x04 \x01(\x0c\x12\x13\n\x0bsample_rate\x18\x05 \x01(\x05\x12\x32\n\x08\x65ncoding\x18\x06 \x01(\x0e\x32 .musicforge.worker.AudioEncoding\x12\x34\n\tartifacts\x18\x07 \x03(\x0b\x32!.musicforge.worker.ArtifactHandle\"\x80\x02\n\x0fStemUploadChunk\x12\x12\n\naudio_data\x18\x01 \x01(\x0c\x12\x13\n\x0bsample_rate\x18\x02 \x01(\x05\x12\x10\n\x08\x63hannels\x18\x03 \x01(\x05\x12\x13\n\x0btotal_bytes\x18\x04 \x01(\x03\x12\x32\n\x08\x65ncoding\x18\x05 \x01(\x0e\x32 .musicforge.worker.AudioEncoding\x12-\n\x08priority\x18\x06 \x01(\x0e\x32\x1b.musicforge.worker.Priority\x12:\n\x0f\x61rtifact_format\x18\x07 \x01(\x0e\x32!.musicforge.worker.ArtifactFormat\"\xa2\x02\n\tStemChunk\x12\r\n\x05\x64rums\x18\x01 \x01(\x0c\x12\x0c\n\x04\x62\x61ss\x18\x02 \x01(\x0c\x12\x0e\n\x06vocals\x18\x03 \x01(\x0c\x12\r\n\x05other\x18\x04 \x01(\x0c\x12\x13\n\x0bsample_rate\x18\x05 \x01(\x05\x12\x10\n\x08is_final\x18\x06 \x01(\x08\x12\x10\n\x08progress\x18\x07 \x01(\x02\x12\x32\n\x08\x65ncoding\x18\x08 \x01(\x0e\x32 .musicforge.worker.AudioEncoding\x12\x16\n\x0equeue_position\x18\t \x01(\x05\x12\x1e\n\x16\x65stimated_wait_seconds\x18\n \x01(\x02\x12\x34\n\tartifacts\x18\x0b \x03(\x0b\x32!.musicforge.worker.ArtifactHandle\"\x81\x02\n\x10SubmitJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x30\n\x05\x61udio\x18\x02 \x01(\x0b\x32\x1f.musicforge.worker.AudioRequestH\x00\x12\x31\n\x06vocals\x18\x03 \x01(\x0b\x32\x1f.musicforge.worker.VocalRequestH\x00\x12<\n\x0b\x61rrangement\x18\x04 \x01(\x0b\x32%.musicforge.worker.ArrangementRequestH\x00\x12/\n\x05stems\x18\x05 \x01(\x0b\x32\x1e.musicforge.worker.StemRequestH\x00\x42\t\n\x07request\"\x1c\n\nJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"\xc9\x01\n\tJobStatus\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x0c\n\x04kind\x18\x02 \x01(\t\x12*\n\x05state\x18\x03 \x01(\x0e\x32\x1b.musicforge.worker.JobState\x12\x10\n\x08progress\x18\x04 \x01(\x02\x12\x18\n\x10\x63hunks_available\x18\x05 \x01(\x05\x12\x0f\n\x07\x61ttempt\x18\x06 \x01(\x05\x12\r\n\x05\x65rror\x18\x07 \x01(\t\x12\x12\n\ncreated_at\x18\x08 \x01(\x01\x12\x12\n\nupdated_at\x18\t \x01(\x01\"2\n\x10StreamJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x0e\n\x06offset\x18\x02 \x01(\x05\"\x82\x01\n\x08JobChunk\x12\r\n\x05index\x18\x01 \x01(\x05\x12.\n\x05\x61udio\x18\x02 \x01(\x0b\x32\x1d.musicforge.worker.AudioChunkH\x00\x12-\n\x05stems\x18\x03 \x01(\x0b\x32\x1c.musicforge.worker.StemChunkH\x00\x42\x08\n\x06result\"\x07\n\x05\x45mpty\"\xd9\x01\n\x0eHealthResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x15\n\rgpu_available\x18\x02 \x01(\x08\x12\x18\n\x10gpu_memory_bytes\x18\x03 \x01(\x03\x12\x15\n\rmodels_loaded\x18\x04 \x03(\t\x12,\n\x05\x63\x61\x63he\x18\x05 \x01(\x0b\x32\x1d.musicforge.worker.CacheStats\x12\x11\n\treadiness\x18\x06 \x01(\t\x12.\n\x07workers\x18\x07 \x03(\x0b\x32\x1d.musicforge.worker.WorkerLoad\"\x95\x01\n\nWorkerLoad\x12\r\n\x05index\x18\x01 \x01(\x05\x12\x0b\n\x03pid\x18\x02 \x01(\x05\x12\r\n\x05\x61live\x18\x03 \x01(\x08\x12\x17\n\x0f\x61\x63tive_requests\x18\x04 \x01(\x05\x12\x1a\n\x12\x63ompleted_requests\x18\x05 \x01(\x03\x12\x10\n\x08restarts\x18\x06 \x01(\x05\x12\x15\n\rmodels_loaded\x18\x07 \x03(\t\"]\n\nCacheStats\x12\x0c\n\x04hits\x18\x01 \x01(\x03\x12\x0e\n\x06misses\x18\x02 \x01(\x03\x12\r\n\x05\x62ytes\x18\x03 \x01(\x03\x12\x11\n\tevictions\x18\x04 \x01(\x03\x12\x0f\n\x07\x65ntries\x18\x05 \x01(\x03\"\x1f\n\x0fMetricsResponse\x12\x0c\n\x04text\x18\x01 \x01(\t*1\n\rAudioEncoding\x12\x0b\n\x07\x46LOAT32\x10\x00\x12\t\n\x05PCM16\x10\x01\x12\x08\n\x04\x46LAC\x10\x02*Y\n\x0e\x41rtifactFormat\x12\x11\n\rARTIFACT_NONE\x10\x00\x12\x10\n\x0c\x41RTIFACT_RAW\x10\x01\x12\x10\n\x0c\x41RTIFACT_NPY\x10\x02\x12\x10\n\x0c\x41RTIFACT_WAV\x10\x03*&\n\x08Priority\x12\x0f\n\x0bINTERACTIVE\x10\x00\x12\t\n\x05\x42\x41TCH\x10\x01*a\n\x08JobState\x12\x0e\n\nJOB_QUEUED\x10\x00\x12\x0f\n\x0bJOB_RUNNING\x10\x01\x12\x11\n\rJOB_SUCCEEDED\x10\x02\x12\x0e\n\nJOB_FAILED\x10\x03\x12\x11\n\rJOB_CANCELLED\x10\x04\x32\xe4\n\n\x0bMusicWorker\x12U\n\x0eGenerateTheory\x12 .musicforge.worker.TheoryRequest\x1a!.musicforge.worker.TheoryResponse\x12g\n\x14GenerateProgressions\x12&.musicforge.worker.ProgressionsRequest\x1a\'.musicforge.worker.ProgressionsResponse\x12S\n\x0fSynthesizeAudio\x12\x1f.musicforge.worker.AudioRequest\x1a\x1d.musicforge.worker.AudioChunk0\x01\x12[\n\x11RenderArrangement\x12%.musicforge.worker.ArrangementRequest\x1a\x1d.musicforge.worker.AudioChunk0\x01\x12T\n\x10SynthesizeVocals\x12\x1f.musicforge.worker.VocalRequest\x1a\x1d.musicforge.worker.AudioChunk0\x01\x12P\n\rSeparateStems\x12\x1e.musicforge.worker.StemRequest\x1a\x1f.musicforge.worker.StemResponse\x12U\n\x13SeparateStemsStream\x12\x1e.musicforge.worker.StemRequest\x1a\x1c.musicforge.worker.StemChunk0\x01\x12[\n\x13SeparateStemsUpload\x12\".musicforge.worker.StemUploadChunk\x1a\x1c.musicforge.worker.StemChunk(\x01\x30\x01\x12N\n\tSubmitJob\x12#.musicforge.worker.SubmitJobRequest\x1a\x1c.musicforge.worker.JobStatus\x12K\n\x0cGetJobStatus\x12\x1d.musicforge.worker.JobRequest\x1a\x1c.musicforge.worker.JobStatus\x12U\n\x0fStreamJobResult\x12#.musicforge.worker.StreamJobRequest\x1a\x1b.musicforge.worker.JobChunk0\x01\x12H\n\tCancelJob\x12\x1d.musicforge.worker.JobRequest\x1a\x1c.musicforge.worker.JobStatus\x12W\n\x0eRetainArtifact\x12\".musicforge.worker.ArtifactRequest\x1a!.musicforge.worker.ArtifactStatus\x12X\n\x0fReleaseArtifact\x12\".musicforge.worker.ArtifactRequest\x1a!.musicforge.worker.ArtifactStatus\x12J\n\x0bHealthCheck\x12\x18.musicforge.worker.Empty\x1a!.musicforge.worker.HealthResponse\x12J\n\nGetMetrics\x12\x18.musicforge.worker.Empty\x1a\".musicforge.worker.MetricsResponseB!\xaa\x02\x1eMusicForge.Infrastructure.Grpcb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -32,26 +32,68 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'worker_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   _globals['DESCRIPTOR']._loaded_options = None
   _globals['DESCRIPTOR']._serialized_options = b'\252\002\036MusicForge.Infrastructure.Grpc'
+  _globals['_AUDIOENCODING']._serialized_start=4237
+  _globals['_AUDIOENCODING']._serialized_end=4286
+  _globals['_ARTIFACTFORMAT']._serialized_start=4288
+  _globals['_ARTIFACTFORMAT']._serialized_end=4377
+  _globals['_PRIORITY']._serialized_start=4379
+  _globals['_PRIORITY']._serialized_end=4417
+  _globals['_JOBSTATE']._serialized_start=4419
+  _globals['_JOBSTATE']._serialized_end=4516
   _globals['_THEORYREQUEST']._serialized_start=36
   _globals['_THEORYREQUEST']._serialized_end=172
   _globals['_THEORYRESPONSE']._serialized_start=174
   _globals['_THEORYRESPONSE']._serialized_end=282
-  _globals['_SECTION']._serialized_start=284
-  _globals['_SECTION']._serialized_end=389
-  _globals['_AUDIOREQUEST']._serialized_start=392
-  _globals['_AUDIOREQUEST']._serialized_end=535
-  _globals['_AUDIOCHUNK']._serialized_start=537
-  _globals['_AUDIOCHUNK']._serialized_end=626
-  _globals['_VOCALREQUEST']._serialized_start=628
-  _globals['_VOCALREQUEST']._serialized_end=721
-  _globals['_STEMREQUEST']._serialized_start=723
-  _globals['_STEMREQUEST']._serialized_end=777
-  _globals['_STEMRESPONSE']._serialized_start=779
-  _globals['_STEMRESPONSE']._serialized_end=874
-  _globals['_EMPTY']._serialized_start=876
-  _globals['_EMPTY']._serialized_end=883
-  _globals['_HEALTHRESPONSE']._serialized_start=885
-  _globals['_HEALTHRESPONSE']._serialized_end=989
-  _globals['_MUSICWORKER']._serialized_start=992
-  _globals['_MUSICWORKER']._serialized_end=1421
+  _globals['_PROGRESSIONSREQUEST']._serialized_start=284
+  _globals['_PROGRESSIONSREQUEST']._serialized_end=335
+  _globals['_PROGRESSION']._serialized_start=337
+  _globals['_PROGRESSION']._serialized_end=394
+  _globals['_PROGRESSIONSRESPONSE']._serialized_start=396
+  _globals['_PROGRESSIONSRESPONSE']._serialized_end=472
+  _globals['_SECTION']._serialized_start=474
+  _globals['_SECTION']._serialized_end=579
+  _globals['_ARTIFACTHANDLE']._serialized_start=582
+  _globals['_ARTIFACTHANDLE']._serialized_end=802
+  _globals['_ARTIFACTREQUEST']._serialized_start=804
+  _globals['_ARTIFACTREQUEST']._serialized_end=842
+  _globals['_ARTIFACTSTATUS']._serialized_start=844
+  _globals['_ARTIFACTSTATUS']._serialized_end=921
+  _globals['_AUDIOREQUEST']._serialized_start=924
+  _globals['_AUDIOREQUEST']._serialized_end=1226
+  _globals['_AUDIOCHUNK']._serialized_start=1229
+  _globals['_AUDIOCHUNK']._serialized_end=1501
+  _globals['_ARRANGEMENTREQUEST']._serialized_start=1504
+  _globals['_ARRANGEMENTREQUEST']._serialized_end=1802
+  _globals['_VOCALREQUEST']._serialized_start=1805
+  _globals['_VOCALREQUEST']._serialized_end=2057
+  _globals['_STEMREQUEST']._serialized_start=2060
+  _globals['_STEMREQUEST']._serialized_end=2291
+  _globals['_STEMRESPONSE']._serialized_start=2294
+  _globals['_STEMRESPONSE']._serialized_end=2495
+  _globals['_STEMUPLOADCHUNK']._serialized_start=2498
+  _globals['_STEMUPLOADCHUNK']._serialized_end=2754
+  _globals['_STEMCHUNK']._serialized_start=2757
+  _globals['_STEMCHUNK']._serialized_end=3047
+  _globals['_SUBMITJOBREQUEST']._serialized_start=3050
+  _globals['_SUBMITJOBREQUEST']._serialized_end=3307
+  _globals['_JOBREQUEST']._serialized_start=3309
+  _globals['_JOBREQUEST']._serialized_end=3337
+  _globals['_JOBSTATUS']._serialized_start=3340
+  _globals['_JOBSTATUS']._serialized_end=3541
+  _globals['_STREAMJOBREQUEST']._serialized_start=3543
+  _globals['_STREAMJOBREQUEST']._serialized_end=3593
+  _globals['_JOBCHUNK']._serialized_start=3596
+  _globals['_JOBCHUNK']._serialized_end=3726
+  _globals['_EMPTY']._serialized_start=3728
+  _globals['_EMPTY']._serialized_end=3735
+  _globals['_HEALTHRESPONSE']._serialized_start=3738
+  _globals['_HEALTHRESPONSE']._serialized_end=3955
+  _globals['_WORKERLOAD']._serialized_start=3958
+  _globals['_WORKERLOAD']._serialized_end=4107
+  _globals['_CACHESTATS']._serialized_start=4109
+  _globals['_CACHESTATS']._serialized_end=4202
+  _globals['_METRICSRESPONSE']._serialized_start=4204
+  _globals['_METRICSRESPONSE']._serialized_end=4235
+  _globals['_MUSICWORKER']._serialized_start=4519
+  _globals['_MUSICWORKER']._serialized_end=5899
 # @@protoc_insertion_point(module_scope)
@@ -1,4 +1,5 @@
 from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from collections.abc import Iterable as _Iterable, Mapping as _Mapping
@@ -6,6 +7,46 @@ from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
+class AudioEncoding(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    FLOAT32: _ClassVar[AudioEncoding]
+    PCM16: _ClassVar[AudioEncoding]
+    FLAC: _ClassVar[AudioEncoding]
+
+class ArtifactFormat(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    ARTIFACT_NONE: _ClassVar[ArtifactFormat]
+    ARTIFACT_RAW: _ClassVar[ArtifactFormat]
+    ARTIFACT_NPY: _ClassVar[ArtifactFormat]
+    ARTIFACT_WAV: _ClassVar[ArtifactFormat]
+
+class Priority(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    INTERACTIVE: _ClassVar[Priority]
+    BATCH: _ClassVar[Priority]
+
+class JobState(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    JOB_QUEUED: _ClassVar[JobState]
+    JOB_RUNNING: _ClassVar[JobState]
+    JOB_SUCCEEDED: _ClassVar[JobState]
+    JOB_FAILED: _ClassVar[JobState]
+    JOB_CANCELLED: _ClassVar[JobState]
+FLOAT32: AudioEncoding
+PCM16: AudioEncoding
+FLAC: AudioEncoding
+ARTIFACT_NONE: ArtifactFormat
+ARTIFACT_RAW: ArtifactFormat
+ARTIFACT_NPY: ArtifactFormat
+ARTIFACT_WAV: ArtifactFormat
+INTERACTIVE: Priority
+BATCH: Priority
+JOB_QUEUED: JobState
+JOB_RUNNING: JobState
+JOB_SUCCEEDED: JobState
+JOB_FAILED: JobState
+JOB_CANCELLED: JobState
+
 class TheoryRequest(_message.Message):
     __slots__ = ("genre", "mood", "tempo_bpm", "key", "mode", "duration_seconds", "style_tags")
     GENRE_FIELD_NUMBER: _ClassVar[int]
@@ -34,6 +75,30 @@ class TheoryResponse(_message.Message):
     midi_data: bytes
     def __init__(self, chord_progression: _Optional[_Iterable[str]] = ..., sections: _Optional[_Iterable[_Union[Section, _Mapping]]] = ..., midi_data: _Optional[bytes] = ...) -> None: ...
 
+class ProgressionsRequest(_message.Message):
+    __slots__ = ("keys", "genres")
+    KEYS_FIELD_NUMBER: _ClassVar[int]
+    GENRES_FIELD_NUMBER: _ClassVar[int]
+    keys: _containers.RepeatedScalarFieldContainer[str]
+    genres: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, keys: _Optional[_Iterable[str]] = ..., genres: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class Progression(_message.Message):
+    __slots__ = ("key", "genre", "chords")
+    KEY_FIELD_NUMBER: _ClassVar[int]
+    GENRE_FIELD_NUMBER: _ClassVar[int]
+    CHORDS_FIELD_NUMBER: _ClassVar[int]
+    key: str
+    genre: str
+    chords: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, key: _Optional[str] = ..., genre: _Optional[str] = ..., chords: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class ProgressionsResponse(_message.Message):
+    __slots__ = ("progressions",)
+    PROGRESSIONS_FIELD_NUMBER: _ClassVar[int]
+    progressions: _containers.RepeatedCompositeFieldContainer[Progression]
+    def __init__(self, progressions: _Optional[_Iterable[_Union[Progression, _Mapping]]] = ...) -> None: ...
+
 class Section(_message.Message):
     __slots__ = ("name", "start_bar", "duration_bars", "energy_level", "elements")
     NAME_FIELD_NUMBER: _ClassVar[int]
@@ -48,80 +113,322 @@ class Section(_message.Message):
     elements: _containers.RepeatedScalarFieldContainer[str]
     def __init__(self, name: _Optional[str] = ..., start_bar: _Optional[int] = ..., duration_bars: _Optional[int] = ..., energy_level: _Optional[float] = ..., elements: _Optional[_Iterable[str]] = ...) -> None: ...
 
+class ArtifactHandle(_message.Message):
+    __slots__ = ("artifact_id", "path", "offset", "length", "dtype", "channels", "sample_rate", "format", "name", "complete")
+    ARTIFACT_ID_FIELD_NUMBER: _ClassVar[int]
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    OFFSET_FIELD_NUMBER: _ClassVar[int]
+    LENGTH_FIELD_NUMBER: _ClassVar[int]
+    DTYPE_FIELD_NUMBER: _ClassVar[int]
+    CHANNELS_FIELD_NUMBER: _ClassVar[int]
+    SAMPLE_RATE_FIELD_NUMBER: _ClassVar[int]
+    FORMAT_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    COMPLETE_FIELD_NUMBER: _ClassVar[int]
+    artifact_id: str
+    path: str
+    offset: int
+    length: int
+    dtype: str
+    channels: int
+    sample_rate: int
+    format: ArtifactFormat
+    name: str
+    complete: bool
+    def __init__(self, artifact_id: _Optional[str] = ..., path: _Optional[str] = ..., offset: _Optional[int] = ..., length: _Optional[int] = ..., dtype: _Optional[str] = ..., channels: _Optional[int] = ..., sample_rate: _Optional[int] = ..., format: _Optional[_Union[ArtifactFormat, str]] = ..., name: _Optional[str] = ..., complete: bool = ...) -> None: ...
+
+class ArtifactRequest(_message.Message):
+    __slots__ = ("artifact_id",)
+    ARTIFACT_ID_FIELD_NUMBER: _ClassVar[int]
+    artifact_id: str
+    def __init__(self, artifact_id: _Optional[str] = ...) -> None: ...
+
+class ArtifactStatus(_message.Message):
+    __slots__ = ("artifact_id", "references", "expires_at")
+    ARTIFACT_ID_FIELD_NUMBER: _ClassVar[int]
+    REFERENCES_FIELD_NUMBER: _ClassVar[int]
+    EXPIRES_AT_FIELD_NUMBER: _ClassVar[int]
+    artifact_id: str
+    references: int
+    expires_at: float
+    def __init__(self, artifact_id: _Optional[str] = ..., references: _Optional[int] = ..., expires_at: _Optional[float] = ...) -> None: ...
+
 class AudioRequest(_message.Message):
-    __slots__ = ("prompt", "duration_seconds", "genre", "energy_level", "conditioning_audio", "section_name")
+    __slots__ = ("prompt", "duration_seconds", "genre", "energy_level", "conditioning_audio", "section_name", "encoding", "priority", "artifact_format")
     PROMPT_FIELD_NUMBER: _ClassVar[int]
     DURATION_SECONDS_FIELD_NUMBER: _ClassVar[int]
     GENRE_FIELD_NUMBER: _ClassVar[int]
     ENERGY_LEVEL_FIELD_NUMBER: _ClassVar[int]
     CONDITIONING_AUDIO_FIELD_NUMBER: _ClassVar[int]
     SECTION_NAME_FIELD_NUMBER: _ClassVar[int]
+    ENCODING_FIELD_NUMBER: _ClassVar[int]
+    PRIORITY_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACT_FORMAT_FIELD_NUMBER: _ClassVar[int]
     prompt: str
     duration_seconds: int
     genre: str
     energy_level: float
     conditioning_audio: bytes
     section_name: str
-    def __init__(self, prompt: _Optional[str] = ..., duration_seconds: _Optional[int] = ..., genre: _Optional[str] = ..., energy_level: _Optional[float] = ..., conditioning_audio: _Optional[bytes] = ..., section_name: _Optional[str] = ...) -> None: ...
+    encoding: AudioEncoding
+    priority: Priority
+    artifact_format: ArtifactFormat
+    def __init__(self, prompt: _Optional[str] = ..., duration_seconds: _Optional[int] = ..., genre: _Optional[str] = ..., energy_level: _Optional[float] = ..., conditioning_audio: _Optional[bytes] = ..., section_name: _Optional[str] = ..., encoding: _Optional[_Union[AudioEncoding, str]] = ..., priority: _Optional[_Union[Priority, str]] = ..., artifact_format: _Optional[_Union[ArtifactFormat, str]] = ...) -> None: ...
 
 class AudioChunk(_message.Message):
-    __slots__ = ("audio_data", "sample_rate", "is_final", "progress")
+    __slots__ = ("audio_data", "sample_rate", "is_final", "progress", "encoding", "queue_position", "estimated_wait_seconds", "section_name", "artifact")
     AUDIO_DATA_FIELD_NUMBER: _ClassVar[int]
     SAMPLE_RATE_FIELD_NUMBER: _ClassVar[int]
     IS_FINAL_FIELD_NUMBER: _ClassVar[int]
     PROGRESS_FIELD_NUMBER: _ClassVar[int]
+    ENCODING_FIELD_NUMBER: _ClassVar[int]
+    QUEUE_POSITION_FIELD_NUMBER: _ClassVar[int]
+    ESTIMATED_WAIT_SECONDS_FIELD_NUMBER: _ClassVar[int]
+    SECTION_NAME_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACT_FIELD_NUMBER: _ClassVar[int]
     audio_data: bytes
     sample_rate: int
     is_final: bool
     progress: float
-    def __init__(self, audio_data: _Optional[bytes] = ..., sample_rate: _Optional[int] = ..., is_final: bool = ..., progress: _Optional[float] = ...) -> None: ...
+    encoding: AudioEncoding
+    queue_position: int
+    estimated_wait_seconds: float
+    section_name: str
+    artifact: ArtifactHandle
+    def __init__(self, audio_data: _Optional[bytes] = ..., sample_rate: _Optional[int] = ..., is_final: bool = ..., progress: _Optional[float] = ..., encoding: _Optional[_Union[AudioEncoding, str]] = ..., queue_position: _Optional[int] = ..., estimated_wait_seconds: _Optional[float] = ..., section_name: _Optional[str] = ..., artifact: _Optional[_Union[ArtifactHandle, _Mapping]] = ...) -> None: ...
+
+class ArrangementRequest(_message.Message):
+    __slots__ = ("prompt", "genre", "tempo_bpm", "beats_per_bar", "sections", "encoding", "priority", "artifact_format")
+    PROMPT_FIELD_NUMBER: _ClassVar[int]
+    GENRE_FIELD_NUMBER: _ClassVar[int]
+    TEMPO_BPM_FIELD_NUMBER: _ClassVar[int]
+    BEATS_PER_BAR_FIELD_NUMBER: _ClassVar[int]
+    SECTIONS_FIELD_NUMBER: _ClassVar[int]
+    ENCODING_FIELD_NUMBER: _ClassVar[int]
+    PRIORITY_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACT_FORMAT_FIELD_NUMBER: _ClassVar[int]
+    prompt: str
+    genre: str
+    tempo_bpm: int
+    beats_per_bar: int
+    sections: _containers.RepeatedCompositeFieldContainer[Section]
+    encoding: AudioEncoding
+    priority: Priority
+    artifact_format: ArtifactFormat
+    def __init__(self, prompt: _Optional[str] = ..., genre: _Optional[str] = ..., tempo_bpm: _Optional[int] = ..., beats_per_bar: _Optional[int] = ..., sections: _Optional[_Iterable[_Union[Section, _Mapping]]] = ..., encoding: _Optional[_Union[AudioEncoding, str]] = ..., priority: _Optional[_Union[Priority, str]] = ..., artifact_format: _Optional[_Union[ArtifactFormat, str]] = ...) -> None: ...
 
 class VocalRequest(_message.Message):
-    __slots__ = ("lyrics", "voice_type", "style", "target_duration_ms")
+    __slots__ = ("lyrics", "voice_type", "style", "target_duration_ms", "encoding", "priority", "artifact_format")
     LYRICS_FIELD_NUMBER: _ClassVar[int]
     VOICE_TYPE_FIELD_NUMBER: _ClassVar[int]
     STYLE_FIELD_NUMBER: _ClassVar[int]
     TARGET_DURATION_MS_FIELD_NUMBER: _ClassVar[int]
+    ENCODING_FIELD_NUMBER: _ClassVar[int]
+    PRIORITY_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACT_FORMAT_FIELD_NUMBER: _ClassVar[int]
     lyrics: str
     voice_type: str
     style: str
     target_duration_ms: int
-    def __init__(self, lyrics: _Optional[str] = ..., voice_type: _Optional[str] = ..., style: _Optional[str] = ..., target_duration_ms: _Optional[int] = ...) -> None: ...
+    encoding: AudioEncoding
+    priority: Priority
+    artifact_format: ArtifactFormat
+    def __init__(self, lyrics: _Optional[str] = ..., voice_type: _Optional[str] = ..., style: _Optional[str] = ..., target_duration_ms: _Optional[int] = ..., encoding: _Optional[_Union[AudioEncoding, str]] = ..., priority: _Optional[_Union[Priority, str]] = ..., artifact_format: _Optional[_Union[ArtifactFormat, str]] = ...) -> None: ...
 
 class StemRequest(_message.Message):
-    __slots__ = ("audio_data", "sample_rate")
+    __slots__ = ("audio_data", "sample_rate", "channels", "encoding", "priority", "artifact_format")
     AUDIO_DATA_FIELD_NUMBER: _ClassVar[int]
     SAMPLE_RATE_FIELD_NUMBER: _ClassVar[int]
+    CHANNELS_FIELD_NUMBER: _ClassVar[int]
+    ENCODING_FIELD_NUMBER: _ClassVar[int]
+    PRIORITY_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACT_FORMAT_FIELD_NUMBER: _ClassVar[int]
     audio_data: bytes
     sample_rate: int
-    def __init__(self, audio_data: _Optional[bytes] = ..., sample_rate: _Optional[int] = ...) -> None: ...
+    channels: int
+    encoding: AudioEncoding
+    priority: Priority
+    artifact_format: ArtifactFormat
+    def __init__(self, audio_data: _Optional[bytes] = ..., sample_rate: _Optional[int] = ..., channels: _Optional[int] = ..., encoding: _Optional[_Union[AudioEncoding, str]] = ..., priority: _Optional[_Union[Priority, str]] = ..., artifact_format: _Optional[_Union[ArtifactFormat, str]] = ...) -> None: ...
 
 class StemResponse(_message.Message):
-    __slots__ = ("drums", "bass", "vocals", "other", "sample_rate")
+    __slots__ = ("drums", "bass", "vocals", "other", "sample_rate", "encoding", "artifacts")
     DRUMS_FIELD_NUMBER: _ClassVar[int]
     BASS_FIELD_NUMBER: _ClassVar[int]
     VOCALS_FIELD_NUMBER: _ClassVar[int]
     OTHER_FIELD_NUMBER: _ClassVar[int]
     SAMPLE_RATE_FIELD_NUMBER: _ClassVar[int]
+    ENCODING_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACTS_FIELD_NUMBER: _ClassVar[int]
     drums: bytes
     bass: bytes
     vocals: bytes
     other: bytes
     sample_rate: int
-    def __init__(self, drums: _Optional[bytes] = ..., bass: _Optional[bytes] = ..., vocals: _Optional[bytes] = ..., other: _Optional[bytes] = ..., sample_rate: _Optional[int] = ...) -> None: ...
+    encoding: AudioEncoding
+    artifacts: _containers.RepeatedCompositeFieldContainer[ArtifactHandle]
+    def __init__(self, drums: _Optional[bytes] = ..., bass: _Optional[bytes] = ..., vocals: _Optional[bytes] = ..., other: _Optional[bytes] = ..., sample_rate: _Optional[int] = ..., encoding: _Optional[_Union[AudioEncoding, str]] = ..., artifacts: _Optional[_Iterable[_Union[ArtifactHandle, _Mapping]]] = ...) -> None: ...
+
+class StemUploadChunk(_message.Message):
+    __slots__ = ("audio_data", "sample_rate", "channels", "total_bytes", "encoding", "priority", "artifact_format")
+    AUDIO_DATA_FIELD_NUMBER: _ClassVar[int]
+    SAMPLE_RATE_FIELD_NUMBER: _ClassVar[int]
+    CHANNELS_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_BYTES_FIELD_NUMBER: _ClassVar[int]
+    ENCODING_FIELD_NUMBER: _ClassVar[int]
+    PRIORITY_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACT_FORMAT_FIELD_NUMBER: _ClassVar[int]
+    audio_data: bytes
+    sample_rate: int
+    channels: int
+    total_bytes: int
+    encoding: AudioEncoding
+    priority: Priority
+    artifact_format: ArtifactFormat
+    def __init__(self, audio_data: _Optional[bytes] = ..., sample_rate: _Optional[int] = ..., channels: _Optional[int] = ..., total_bytes: _Optional[int] = ..., encoding: _Optional[_Union[AudioEncoding, str]] = ..., priority: _Optional[_Union[Priority, str]] = ..., artifact_format: _Optional[_Union[ArtifactFormat, str]] = ...) -> None: ...
+
+class StemChunk(_message.Message):
+    __slots__ = ("drums", "bass", "vocals", "other", "sample_rate", "is_final", "progress", "encoding", "queue_position", "estimated_wait_seconds", "artifacts")
+    DRUMS_FIELD_NUMBER: _ClassVar[int]
+    BASS_FIELD_NUMBER: _ClassVar[int]
+    VOCALS_FIELD_NUMBER: _ClassVar[int]
+    OTHER_FIELD_NUMBER: _ClassVar[int]
+    SAMPLE_RATE_FIELD_NUMBER: _ClassVar[int]
+    IS_FINAL_FIELD_NUMBER: _ClassVar[int]
+    PROGRESS_FIELD_NUMBER: _ClassVar[int]
+    ENCODING_FIELD_NUMBER: _ClassVar[int]
+    QUEUE_POSITION_FIELD_NUMBER: _ClassVar[int]
+    ESTIMATED_WAIT_SECONDS_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACTS_FIELD_NUMBER: _ClassVar[int]
+    drums: bytes
+    bass: bytes
+    vocals: bytes
+    other: bytes
+    sample_rate: int
+    is_final: bool
+    progress: float
+    encoding: AudioEncoding
+    queue_position: int
+    estimated_wait_seconds: float
+    artifacts: _containers.RepeatedCompositeFieldContainer[ArtifactHandle]
+    def __init__(self, drums: _Optional[bytes] = ..., bass: _Optional[bytes] = ..., vocals: _Optional[bytes] = ..., other: _Optional[bytes] = ..., sample_rate: _Optional[int] = ..., is_final: bool = ..., progress: _Optional[float] = ..., encoding: _Optional[_Union[AudioEncoding, str]] = ..., queue_position: _Optional[int] = ..., estimated_wait_seconds: _Optional[float] = ..., artifacts: _Optional[_Iterable[_Union[ArtifactHandle, _Mapping]]] = ...) -> None: ...
+
+class SubmitJobRequest(_message.Message):
+    __slots__ = ("job_id", "audio", "vocals", "arrangement", "stems")
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    AUDIO_FIELD_NUMBER: _ClassVar[int]
+    VOCALS_FIELD_NUMBER: _ClassVar[int]
+    ARRANGEMENT_FIELD_NUMBER: _ClassVar[int]
+    STEMS_FIELD_NUMBER: _ClassVar[int]
+    job_id: str
+    audio: AudioRequest
+    vocals: VocalRequest
+    arrangement: ArrangementRequest
+    stems: StemRequest
+    def __init__(self, job_id: _Optional[str] = ..., audio: _Optional[_Union[AudioRequest, _Mapping]] = ..., vocals: _Optional[_Union[VocalRequest, _Mapping]] = ..., arrangement: _Optional[_Union[ArrangementRequest, _Mapping]] = ..., stems: _Optional[_Union[StemRequest, _Mapping]] = ...) -> None: ...
+
+class JobRequest(_message.Message):
+    __slots__ = ("job_id",)
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    job_id: str
+    def __init__(self, job_id: _Optional[str] = ...) -> None: ...
+
+class JobStatus(_message.Message):
+    __slots__ = ("job_id", "kind", "state", "progress", "chunks_available", "attempt", "error", "created_at", "updated_at")
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    KIND_FIELD_NUMBER: _ClassVar[int]
+    STATE_FIELD_NUMBER: _ClassVar[int]
+    PROGRESS_FIELD_NUMBER: _ClassVar[int]
+    CHUNKS_AVAILABLE_FIELD_NUMBER: _ClassVar[int]
+    ATTEMPT_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    CREATED_AT_FIELD_NUMBER: _ClassVar[int]
+    UPDATED_AT_FIELD_NUMBER: _ClassVar[int]
+    job_id: str
+    kind: str
+    state: JobState
+    progress: float
+    chunks_available: int
+    attempt: int
+    error: str
+    created_at: float
+    updated_at: float
+    def __init__(self, job_id: _Optional[str] = ..., kind: _Optional[str] = ..., state: _Optional[_Union[JobState, str]] = ..., progress: _Optional[float] = ..., chunks_available: _Optional[int] = ..., attempt: _Optional[int] = ..., error: _Optional[str] = ..., created_at: _Optional[float] = ..., updated_at: _Optional[float] = ...) -> None: ...
+
+class StreamJobRequest(_message.Message):
+    __slots__ = ("job_id", "offset")
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    OFFSET_FIELD_NUMBER: _ClassVar[int]
+    job_id: str
+    offset: int
+    def __init__(self, job_id: _Optional[str] = ..., offset: _Optional[int] = ...) -> None: ...
+
+class JobChunk(_message.Message):
+    __slots__ = ("index", "audio", "stems")
+    INDEX_FIELD_NUMBER: _ClassVar[int]
+    AUDIO_FIELD_NUMBER: _ClassVar[int]
+    STEMS_FIELD_NUMBER: _ClassVar[int]
+    index: int
+    audio: AudioChunk
+    stems: StemChunk
+    def __init__(self, index: _Optional[int] = ..., audio: _Optional[_Union[AudioChunk, _Mapping]] = ..., stems: _Optional[_Union[StemChunk, _Mapping]] = ...) -> None: ...
 
 class Empty(_message.Message):
     __slots__ = ()
     def __init__(self) -> None: ...
 
 class HealthResponse(_message.Message):
-    __slots__ = ("status", "gpu_available", "gpu_memory_bytes", "models_loaded")
+    __slots__ = ("status", "gpu_available", "gpu_memory_bytes", "models_loaded", "cache", "readiness", "workers")
     STATUS_FIELD_NUMBER: _ClassVar[int]
     GPU_AVAILABLE_FIELD_NUMBER: _ClassVar[int]
     GPU_MEMORY_BYTES_FIELD_NUMBER: _ClassVar[int]
     MODELS_LOADED_FIELD_NUMBER: _ClassVar[int]
+    CACHE_FIELD_NUMBER: _ClassVar[int]
+    READINESS_FIELD_NUMBER: _ClassVar[int]
+    WORKERS_FIELD_NUMBER: _ClassVar[int]
     status: str
     gpu_available: bool
     gpu_memory_bytes: int
     models_loaded: _containers.RepeatedScalarFieldContainer[str]
-    def __init__(self, status: _Optional[str] = ..., gpu_available: bool = ..., gpu_memory_bytes: _Optional[int] = ..., models_loaded: _Optional[_Iterable[str]] = ...) -> None: ...
+    cache: CacheStats
+    readiness: str
+    workers: _containers.RepeatedCompositeFieldContainer[WorkerLoad]
+    def __init__(self, status: _Optional[str] = ..., gpu_available: bool = ..., gpu_memory_bytes: _Optional[int] = ..., models_loaded: _Optional[_Iterable[str]] = ..., cache: _Optional[_Union[CacheStats, _Mapping]] = ..., readiness: _Optional[str] = ..., workers: _Optional[_Iterable[_Union[WorkerLoad, _Mapping]]] = ...) -> None: ...
+
+class WorkerLoad(_message.Message):
+    __slots__ = ("index", "pid", "alive", "active_requests", "completed_requests", "restarts", "models_loaded")
+    INDEX_FIELD_NUMBER: _ClassVar[int]
+    PID_FIELD_NUMBER: _ClassVar[int]
+    ALIVE_FIELD_NUMBER: _ClassVar[int]
+    ACTIVE_REQUESTS_FIELD_NUMBER: _ClassVar[int]
+    COMPLETED_REQUESTS_FIELD_NUMBER: _ClassVar[int]
+    RESTARTS_FIELD_NUMBER: _ClassVar[int]
+    MODELS_LOADED_FIELD_NUMBER: _ClassVar[int]
+    index: int
+    pid: int
+    alive: bool
+    active_requests: int
+    completed_requests: int
+    restarts: int
+    models_loaded: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, index: _Optional[int] = ..., pid: _Optional[int] = ..., alive: bool = ..., active_requests: _Optional[int] = ..., completed_requests: _Optional[int] = ..., restarts: _Optional[int] = ..., models_loaded: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class CacheStats(_message.Message):
+    __slots__ = ("hits", "misses", "bytes", "evictions", "entries")
+    HITS_FIELD_NUMBER: _ClassVar[int]
+    MISSES_FIELD_NUMBER: _ClassVar[int]
+    BYTES_FIELD_NUMBER: _ClassVar[int]
+    EVICTIONS_FIELD_NUMBER: _ClassVar[int]
+    ENTRIES_FIELD_NUMBER: _ClassVar[int]
+    hits: int
+    misses: int
+    bytes: int
+    evictions: int
+    entries: int
+    def __init__(self, hits: _Optional[int] = ..., misses: _Optional[int] = ..., bytes: _Optional[int] = ..., evictions: _Optional[int] = ..., entries: _Optional[int] = ...) -> None: ...
+
+class MetricsResponse(_message.Message):
+    __slots__ = ("text",)
+    TEXT_FIELD_NUMBER: _ClassVar[int]
+    text: str
+    def __init__(self, text: _Optional[str] = ...) -> None: ...
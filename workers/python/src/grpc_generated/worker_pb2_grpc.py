@@ -40,11 +40,21 @@ class MusicWorkerStub(object):
                 request_serializer=worker__pb2.TheoryRequest.SerializeToString,
                 response_deserializer=worker__pb2.TheoryResponse.FromString,
                 _registered_method=True)
+        self.GenerateProgressions = channel.unary_unary(
+                '/musicforge.worker.MusicWorker/GenerateProgressions',
+                request_serializer=worker__pb2.ProgressionsRequest.SerializeToString,
+                response_deserializer=worker__pb2.ProgressionsResponse.FromString,
+                _registered_method=True)
         self.SynthesizeAudio = channel.unary_stream(
                 '/musicforge.worker.MusicWorker/SynthesizeAudio',
                 request_serializer=worker__pb2.AudioRequest.SerializeToString,
                 response_deserializer=worker__pb2.AudioChunk.FromString,
                 _registered_method=True)
+        self.RenderArrangement = channel.unary_stream(
+                '/musicforge.worker.MusicWorker/RenderArrangement',
+                request_serializer=worker__pb2.ArrangementRequest.SerializeToString,
+                response_deserializer=worker__pb2.AudioChunk.FromString,
+                _registered_method=True)
         self.SynthesizeVocals = channel.unary_stream(
                 '/musicforge.worker.MusicWorker/SynthesizeVocals',
                 request_serializer=worker__pb2.VocalRequest.SerializeToString,
@@ -55,11 +65,56 @@ class MusicWorkerStub(object):
                 request_serializer=worker__pb2.StemRequest.SerializeToString,
                 response_deserializer=worker__pb2.StemResponse.FromString,
                 _registered_method=True)
+        self.SeparateStemsStream = channel.unary_stream(
+                '/musicforge.worker.MusicWorker/SeparateStemsStream',
+                request_serializer=worker__pb2.StemRequest.SerializeToString,
+                response_deserializer=worker__pb2.StemChunk.FromString,
+                _registered_method=True)
+        self.SeparateStemsUpload = channel.stream_stream(
+                '/musicforge.worker.MusicWorker/SeparateStemsUpload',
+                request_serializer=worker__pb2.StemUploadChunk.SerializeToString,
+                response_deserializer=worker__pb2.StemChunk.FromString,
+                _registered_method=True)
+        self.SubmitJob = channel.unary_unary(
+                '/musicforge.worker.MusicWorker/SubmitJob',
+                request_serializer=worker__pb2.SubmitJobRequest.SerializeToString,
+                response_deserializer=worker__pb2.JobStatus.FromString,
+                _registered_method=True)
+        self.GetJobStatus = channel.unary_unary(
+                '/musicforge.worker.MusicWorker/GetJobStatus',
+                request_serializer=worker__pb2.JobRequest.SerializeToString,
+                response_deserializer=worker__pb2.JobStatus.FromString,
+                _registered_method=True)
+        self.StreamJobResult = channel.unary_stream(
+                '/musicforge.worker.MusicWorker/StreamJobResult',
+                request_serializer=worker__pb2.StreamJobRequest.SerializeToString,
+                response_deserializer=worker__pb2.JobChunk.FromString,
+                _registered_method=True)
+        self.CancelJob = channel.unary_unary(
+                '/musicforge.worker.MusicWorker/CancelJob',
+                request_serializer=worker__pb2.JobRequest.SerializeToString,
+                response_deserializer=worker__pb2.JobStatus.FromString,
+                _registered_method=True)
+        self.RetainArtifact = channel.unary_unary(
+                '/musicforge.worker.MusicWorker/RetainArtifact',
+                request_serializer=worker__pb2.ArtifactRequest.SerializeToString,
+                response_deserializer=worker__pb2.ArtifactStatus.FromString,
+                _registered_method=True)
+        self.ReleaseArtifact = channel.unary_unary(
+                '/musicforge.worker.MusicWorker/ReleaseArtifact',
+                request_serializer=worker__pb2.ArtifactRequest.SerializeToString,
+                response_deserializer=worker__pb2.ArtifactStatus.FromString,
+                _registered_method=True)
         self.HealthCheck = channel.unary_unary(
                 '/musicforge.worker.MusicWorker/HealthCheck',
                 request_serializer=worker__pb2.Empty.SerializeToString,
                 response_deserializer=worker__pb2.HealthResponse.FromString,
                 _registered_method=True)
+        self.GetMetrics = channel.unary_unary(
+                '/musicforge.worker.MusicWorker/GetMetrics',
+                request_serializer=worker__pb2.Empty.SerializeToString,
+                response_deserializer=worker__pb2.MetricsResponse.FromString,
+                _registered_method=True)
 
 
 class MusicWorkerServicer(object):
@@ -73,6 +128,13 @@ class MusicWorkerServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GenerateProgressions(self, request, context):
+        """Chord progressions for every combination of several keys and genres
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def SynthesizeAudio(self, request, context):
         """Synthesize instrumental audio with streaming response
         """
@@ -80,6 +142,13 @@ class MusicWorkerServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def RenderArrangement(self, request, context):
+        """Render every section of a song plan concurrently and stream the stitched track in order
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def SynthesizeVocals(self, request, context):
         """Synthesize vocal audio with streaming response
         """
@@ -94,6 +163,62 @@ class MusicWorkerServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def SeparateStemsStream(self, request, context):
+        """Separate long audio into stems segment by segment with streaming response
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SeparateStemsUpload(self, request_iterator, context):
+        """Upload audio in chunks and separate it into stems with streaming response
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SubmitJob(self, request, context):
+        """Queue a generation as a durable job that runs without a client attached
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetJobStatus(self, request, context):
+        """Current state and progress of a job
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamJobResult(self, request, context):
+        """Stream a job's results from a chunk offset, following it until it finishes
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CancelJob(self, request, context):
+        """Stop a queued or running job
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def RetainArtifact(self, request, context):
+        """Take another reference to an artifact and extend its lifetime
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ReleaseArtifact(self, request, context):
+        """Drop a reference to an artifact; the file is deleted when none are left
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def HealthCheck(self, request, context):
         """Check worker health and GPU status
         """
@@ -101,6 +226,13 @@ class MusicWorkerServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetMetrics(self, request, context):
+        """Worker metrics in Prometheus text exposition format
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_MusicWorkerServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -109,11 +241,21 @@ def add_MusicWorkerServicer_to_server(servicer, server):
                     request_deserializer=worker__pb2.TheoryRequest.FromString,
                     response_serializer=worker__pb2.TheoryResponse.SerializeToString,
             ),
+            'GenerateProgressions': grpc.unary_unary_rpc_method_handler(
+                    servicer.GenerateProgressions,
+                    request_deserializer=worker__pb2.ProgressionsRequest.FromString,
+                    response_serializer=worker__pb2.ProgressionsResponse.SerializeToString,
+            ),
             'SynthesizeAudio': grpc.unary_stream_rpc_method_handler(
                     servicer.SynthesizeAudio,
                     request_deserializer=worker__pb2.AudioRequest.FromString,
                     response_serializer=worker__pb2.AudioChunk.SerializeToString,
             ),
+            'RenderArrangement': grpc.unary_stream_rpc_method_handler(
+                    servicer.RenderArrangement,
+                    request_deserializer=worker__pb2.ArrangementRequest.FromString,
+                    response_serializer=worker__pb2.AudioChunk.SerializeToString,
+            ),
             'SynthesizeVocals': grpc.unary_stream_rpc_method_handler(
                     servicer.SynthesizeVocals,
                     request_deserializer=worker__pb2.VocalRequest.FromString,
@@ -124,11 +266,56 @@ def add_MusicWorkerServicer_to_server(servicer, server):
                     request_deserializer=worker__pb2.StemRequest.FromString,
                     response_serializer=worker__pb2.StemResponse.SerializeToString,
             ),
+            'SeparateStemsStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.SeparateStemsStream,
+                    request_deserializer=worker__pb2.StemRequest.FromString,
+                    response_serializer=worker__pb2.StemChunk.SerializeToString,
+            ),
+            'SeparateStemsUpload': grpc.stream_stream_rpc_method_handler(
+                    servicer.SeparateStemsUpload,
+                    request_deserializer=worker__pb2.StemUploadChunk.FromString,
+                    response_serializer=worker__pb2.StemChunk.SerializeToString,
+            ),
+            'SubmitJob': grpc.unary_unary_rpc_method_handler(
+                    servicer.SubmitJob,
+                    request_deserializer=worker__pb2.SubmitJobRequest.FromString,
+                    response_serializer=worker__pb2.JobStatus.SerializeToString,
+            ),
+            'GetJobStatus': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetJobStatus,
+                    request_deserializer=worker__pb2.JobRequest.FromString,
+                    response_serializer=worker__pb2.JobStatus.SerializeToString,
+            ),
+            'StreamJobResult': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamJobResult,
+                    request_deserializer=worker__pb2.StreamJobRequest.FromString,
+                    response_serializer=worker__pb2.JobChunk.SerializeToString,
+            ),
+            'CancelJob': grpc.unary_unary_rpc_method_handler(
+                    servicer.CancelJob,
+                    request_deserializer=worker__pb2.JobRequest.FromString,
+                    response_serializer=worker__pb2.JobStatus.SerializeToString,
+            ),
+            'RetainArtifact': grpc.unary_unary_rpc_method_handler(
+                    servicer.RetainArtifact,
+                    request_deserializer=worker__pb2.ArtifactRequest.FromString,
+                    response_serializer=worker__pb2.ArtifactStatus.SerializeToString,
+            ),
+            'ReleaseArtifact': grpc.unary_unary_rpc_method_handler(
+                    servicer.ReleaseArtifact,
+                    request_deserializer=worker__pb2.ArtifactRequest.FromString,
+                    response_serializer=worker__pb2.ArtifactStatus.SerializeToString,
+            ),
             'HealthCheck': grpc.unary_unary_rpc_method_handler(
                     servicer.HealthCheck,
                     request_deserializer=worker__pb2.Empty.FromString,
                     response_serializer=worker__pb2.HealthResponse.SerializeToString,
             ),
+            'GetMetrics': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetMetrics,
+                    request_deserializer=worker__pb2.Empty.FromString,
+                    response_serializer=worker__pb2.MetricsResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'musicforge.worker.MusicWorker', rpc_method_handlers)
@@ -168,6 +355,33 @@ class MusicWorker(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GenerateProgressions(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/musicforge.worker.MusicWorker/GenerateProgressions',
+            worker__pb2.ProgressionsRequest.SerializeToString,
+            worker__pb2.ProgressionsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def SynthesizeAudio(request,
             target,
@@ -195,6 +409,33 @@ class MusicWorker(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def RenderArrangement(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/musicforge.worker.MusicWorker/RenderArrangement',
+            worker__pb2.ArrangementRequest.SerializeToString,
+            worker__pb2.AudioChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def SynthesizeVocals(request,
             target,
@@ -249,6 +490,222 @@ class MusicWorker(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def SeparateStemsStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/musicforge.worker.MusicWorker/SeparateStemsStream',
+            worker__pb2.StemRequest.SerializeToString,
+            worker__pb2.StemChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SeparateStemsUpload(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/musicforge.worker.MusicWorker/SeparateStemsUpload',
+            worker__pb2.StemUploadChunk.SerializeToString,
+            worker__pb2.StemChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SubmitJob(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/musicforge.worker.MusicWorker/SubmitJob',
+            worker__pb2.SubmitJobRequest.SerializeToString,
+            worker__pb2.JobStatus.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetJobStatus(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/musicforge.worker.MusicWorker/GetJobStatus',
+            worker__pb2.JobRequest.SerializeToString,
+            worker__pb2.JobStatus.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamJobResult(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/musicforge.worker.MusicWorker/StreamJobResult',
+            worker__pb2.StreamJobRequest.SerializeToString,
+            worker__pb2.JobChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CancelJob(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/musicforge.worker.MusicWorker/CancelJob',
+            worker__pb2.JobRequest.SerializeToString,
+            worker__pb2.JobStatus.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def RetainArtifact(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/musicforge.worker.MusicWorker/RetainArtifact',
+            worker__pb2.ArtifactRequest.SerializeToString,
+            worker__pb2.ArtifactStatus.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ReleaseArtifact(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/musicforge.worker.MusicWorker/ReleaseArtifact',
+            worker__pb2.ArtifactRequest.SerializeToString,
+            worker__pb2.ArtifactStatus.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def HealthCheck(request,
             target,
@@ -275,3 +732,30 @@ class MusicWorker(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def GetMetrics(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/musicforge.worker.MusicWorker/GetMetrics',
+            worker__pb2.Empty.SerializeToString,
+            worker__pb2.MetricsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
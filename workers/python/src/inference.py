@@ -0,0 +1,98 @@
+"""Execution layer that keeps blocking model inference off the event loop."""
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Iterator
+
+import structlog
+
+from src.cancellation import CancelToken
+from src.metrics import QUEUE_DEPTH
+
+logger = structlog.get_logger()
+
+_DONE = object()
+
+
+class InferenceExecutor:
+    """Runs model calls on bounded per-model thread pools.
+    
+    Each model gets its own pool so a long Demucs separation never queues
+    behind (or starves) MusicGen or Bark work, and the asyncio loop stays
+    free for health and theory requests.
+    """
+    
+    def __init__(self, max_workers: int = 1):
+        self._max_workers = max_workers
+        self._pools: dict[str, ThreadPoolExecutor] = {}
+        self._lock = threading.Lock()
+    
+    def _pool(self, model: str) -> ThreadPoolExecutor:
+        """Get (or lazily create) the pool for a model."""
+        with self._lock:
+            pool = self._pools.get(model)
+            if pool is None:
+                pool = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix=f"{model}-inference",
+                )
+                self._pools[model] = pool
+            return pool
+    
+    def _submit(self, model: str, fn: Callable[[], Any]) -> "asyncio.Future[Any]":
+        """Schedule a call, counting it in the queue depth until a thread picks it up."""
+        def started() -> Any:
+            QUEUE_DEPTH.dec(model=model)
+            return fn()
+        
+        QUEUE_DEPTH.inc(model=model)
+        return asyncio.get_running_loop().run_in_executor(self._pool(model), started)
+    
+    async def run(self, model: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking call on the model's pool and await its result."""
+        return await self._submit(model, functools.partial(fn, *args, **kwargs))
+    
+    async def iterate(
+        self,
+        model: str,
+        gen_fn: Callable[..., Iterator[Any]],
+        *args,
+        cancel: CancelToken | None = None,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        """Drive a synchronous generator on the model's pool as an async iterator.
+        
+        The generator is created and advanced on pool threads, one item per
+        step, so the consumer applies natural backpressure. A ``cancel``
+        token is passed on to ``gen_fn`` and set if the consumer stops
+        early, so the step in progress can stop instead of running out.
+        """
+        if cancel is not None:
+            kwargs["cancel"] = cancel
+        gen = iter(await self._submit(model, functools.partial(gen_fn, *args, **kwargs)))
+        exhausted = False
+        try:
+            while True:
+                item = await self._submit(model, functools.partial(next, gen, _DONE))
+                if item is _DONE:
+                    exhausted = True
+                    break
+                yield item
+        finally:
+            if cancel is not None and not exhausted:
+                cancel.cancel()
+            close = getattr(gen, "close", None)
+            if close is not None:
+                await self._submit(model, close)
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down all model pools."""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        
+        for pool in pools:
+            pool.shutdown(wait=wait)
+        
+        logger.info("Inference executor shut down", pools=len(pools))
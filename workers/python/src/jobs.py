@@ -0,0 +1,313 @@
+"""Durable generation jobs backed by a local SQLite store.
+
+A job is a serialized request plus the response messages it has produced
+so far. Messages are committed to the store as they are generated, so a
+client can disconnect and resume streaming from any chunk offset, and a
+worker restart re-queues whatever was still running.
+"""
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from enum import IntEnum
+from typing import AsyncIterator, Callable, NamedTuple
+
+import structlog
+
+from src.admission import AdmissionRejectedError
+from src.inference import InferenceExecutor
+
+logger = structlog.get_logger()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    request BLOB NOT NULL,
+    state INTEGER NOT NULL,
+    progress REAL NOT NULL DEFAULT 0,
+    chunks INTEGER NOT NULL DEFAULT 0,
+    attempt INTEGER NOT NULL DEFAULT 0,
+    error TEXT NOT NULL DEFAULT '',
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chunks (
+    job_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (job_id, seq)
+);
+"""
+
+_JOB_COLUMNS = "id, kind, request, state, progress, chunks, attempt, error, created_at, updated_at"
+
+
+class JobState(IntEnum):
+    """Job lifecycle (mirrors ``JobState`` in worker.proto)."""
+    QUEUED = 0
+    RUNNING = 1
+    SUCCEEDED = 2
+    FAILED = 3
+    CANCELLED = 4
+    
+    @property
+    def finished(self) -> bool:
+        return self >= JobState.SUCCEEDED
+
+
+class Job(NamedTuple):
+    id: str
+    kind: str
+    request: bytes
+    state: JobState
+    progress: float
+    chunks: int
+    attempt: int
+    error: str
+    created_at: float
+    updated_at: float
+
+
+class JobStore:
+    """Jobs and their result messages in one SQLite database.
+    
+    Each appended message is its own transaction, so everything a client
+    has been told about survives a crash. Safe to call from any thread.
+    """
+    
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, "jobs.db")
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+    
+    def create(self, job_id: str, kind: str, request: bytes) -> tuple[Job, bool]:
+        """Add a queued job; returns the job and whether it was new."""
+        now = time.time()
+        with self._lock:
+            cursor = self._db.execute(
+                "INSERT OR IGNORE INTO jobs (id, kind, request, state, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, kind, request, JobState.QUEUED, now, now),
+            )
+        return self.get(job_id), cursor.rowcount == 1
+    
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            row = self._db.execute(f"SELECT {_JOB_COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return _job(row) if row else None
+    
+    def set_state(self, job_id: str, state: JobState, error: str = "") -> None:
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET state = ?, error = ?, updated_at = ?, "
+                "progress = CASE WHEN ? THEN 1.0 ELSE progress END WHERE id = ?",
+                (state, error, time.time(), state == JobState.SUCCEEDED, job_id),
+            )
+    
+    def append(self, job_id: str, data: bytes, progress: float) -> int:
+        """Commit one result message; returns its chunk index."""
+        with self._lock, self._db:
+            self._db.execute("BEGIN IMMEDIATE")
+            (index,) = self._db.execute("SELECT chunks FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            self._db.execute("INSERT INTO chunks (job_id, seq, data) VALUES (?, ?, ?)", (job_id, index, data))
+            self._db.execute(
+                "UPDATE jobs SET chunks = ?, progress = ?, updated_at = ? WHERE id = ?",
+                (index + 1, progress, time.time(), job_id),
+            )
+        return index
+    
+    def read(self, job_id: str, offset: int, limit: int = 16) -> list[bytes]:
+        """Result messages from chunk ``offset`` on, at most ``limit`` of them."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT data FROM chunks WHERE job_id = ? AND seq >= ? ORDER BY seq LIMIT ?",
+                (job_id, offset, limit),
+            ).fetchall()
+        return [row[0] for row in rows]
+    
+    def recover(self) -> list[Job]:
+        """Re-queue jobs a previous run left running; returns every queued job.
+        
+        A re-queued job starts over as a new attempt: generation is not
+        deterministic, so its partial results are dropped rather than
+        continued.
+        """
+        with self._lock, self._db:
+            self._db.execute("BEGIN IMMEDIATE")
+            self._db.execute(
+                "DELETE FROM chunks WHERE job_id IN (SELECT id FROM jobs WHERE state = ?)",
+                (JobState.RUNNING,),
+            )
+            self._db.execute(
+                "UPDATE jobs SET state = ?, chunks = 0, progress = 0, attempt = attempt + 1, "
+                "updated_at = ? WHERE state = ?",
+                (JobState.QUEUED, time.time(), JobState.RUNNING),
+            )
+            rows = self._db.execute(
+                f"SELECT {_JOB_COLUMNS} FROM jobs WHERE state = ? ORDER BY created_at",
+                (JobState.QUEUED,),
+            ).fetchall()
+        return [_job(row) for row in rows]
+    
+    def prune(self, ttl_seconds: float) -> int:
+        """Delete finished jobs last updated more than ``ttl_seconds`` ago."""
+        cutoff = time.time() - ttl_seconds
+        finished = (JobState.SUCCEEDED, JobState.FAILED, JobState.CANCELLED)
+        with self._lock, self._db:
+            self._db.execute("BEGIN IMMEDIATE")
+            expired = "SELECT id FROM jobs WHERE state IN (?, ?, ?) AND updated_at < ?"
+            self._db.execute(f"DELETE FROM chunks WHERE job_id IN ({expired})", (*finished, cutoff))
+            cursor = self._db.execute(f"DELETE FROM jobs WHERE id IN ({expired})", (*finished, cutoff))
+        return cursor.rowcount
+    
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+def _job(row) -> Job:
+    return Job(*row[:3], JobState(row[3]), *row[4:])
+
+
+class JobManager:
+    """Runs stored jobs in the background and follows their results.
+    
+    ``runners`` maps a job kind to a function turning the stored request
+    bytes into a stream of response messages; messages with a
+    ``queue_position`` are status updates and are not stored. At most
+    ``max_running`` jobs run at once; the rest wait their turn in
+    submission order.
+    """
+    
+    # Delay before retrying a job its model's admission queue turned away
+    ADMISSION_RETRY_SECONDS = 1.0
+    
+    def __init__(
+        self,
+        store: JobStore,
+        runners: dict[str, Callable[[bytes], AsyncIterator]],
+        executor: InferenceExecutor,
+        max_running: int = 2,
+        ttl_seconds: float = 7 * 24 * 3600,
+    ):
+        self.store = store
+        self._runners = runners
+        self._executor = executor
+        self._slots = asyncio.Semaphore(max(1, max_running))
+        self._ttl = ttl_seconds
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._cancelled: set[str] = set()
+        self._changed: dict[str, asyncio.Event] = {}
+    
+    async def _store(self, fn, *args):
+        return await self._executor.run("jobs", fn, *args)
+    
+    async def submit(self, kind: str, request: bytes, job_id: str = "") -> Job:
+        """Store and schedule a job; an existing ``job_id`` returns that job unchanged."""
+        if kind not in self._runners:
+            raise ValueError(f"Unknown job kind: {kind}")
+        job, created = await self._store(self.store.create, job_id or uuid.uuid4().hex, kind, request)
+        if created:
+            logger.info("Job submitted", job_id=job.id, kind=kind)
+            self._schedule(job)
+        return job
+    
+    async def get(self, job_id: str) -> Job | None:
+        return await self._store(self.store.get, job_id)
+    
+    async def cancel(self, job_id: str) -> Job | None:
+        """Stop a queued or running job; finished jobs are left as they are."""
+        task = self._tasks.get(job_id)
+        if task is not None:
+            self._cancelled.add(job_id)
+            task.cancel()
+            await asyncio.wait([task])
+        return await self.get(job_id)
+    
+    async def resume(self) -> None:
+        """Re-queue jobs left over from a previous run and drop expired ones."""
+        pruned = await self._store(self.store.prune, self._ttl)
+        jobs = await self._store(self.store.recover)
+        for job in jobs:
+            if job.id not in self._tasks:
+                self._schedule(job)
+        logger.info("Job store ready", resumed=len(jobs), pruned=pruned)
+    
+    async def stream(self, job_id: str, offset: int = 0) -> AsyncIterator[tuple[int, bytes]]:
+        """Yield (index, message) from ``offset`` on until the job finishes."""
+        while True:
+            changed = self._changed.setdefault(job_id, asyncio.Event())
+            messages = await self._store(self.store.read, job_id, offset)
+            for message in messages:
+                yield offset, message
+                offset += 1
+            if messages:
+                continue
+            
+            job = await self.get(job_id)
+            if job is None or (job.state.finished and offset >= job.chunks):
+                return
+            try:
+                # Updates come through this process, but poll in case one is missed
+                await asyncio.wait_for(changed.wait(), timeout=1.0)
+            except TimeoutError:
+                pass
+    
+    def shutdown(self) -> None:
+        """Stop running jobs without finishing them; the next start re-queues them."""
+        for task in self._tasks.values():
+            task.cancel()
+    
+    def _schedule(self, job: Job) -> None:
+        task = asyncio.ensure_future(self._run(job))
+        self._tasks[job.id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.id, None))
+    
+    def _notify(self, job_id: str) -> None:
+        event = self._changed.pop(job_id, None)
+        if event is not None:
+            event.set()
+    
+    async def _run(self, job: Job) -> None:
+        try:
+            async with self._slots:
+                await self._store(self.store.set_state, job.id, JobState.RUNNING)
+                self._notify(job.id)
+                logger.info("Job started", job_id=job.id, kind=job.kind, attempt=job.attempt)
+                
+                while True:
+                    try:
+                        async for message in self._runners[job.kind](job.request):
+                            if message.queue_position:
+                                continue
+                            await self._store(
+                                self.store.append, job.id, message.SerializeToString(), message.progress
+                            )
+                            self._notify(job.id)
+                        break
+                    except AdmissionRejectedError as e:
+                        # Rejected before producing anything; wait for room
+                        logger.info("Job waiting for admission", job_id=job.id, reason=str(e))
+                        await asyncio.sleep(self.ADMISSION_RETRY_SECONDS)
+            
+            await self._store(self.store.set_state, job.id, JobState.SUCCEEDED)
+            logger.info("Job succeeded", job_id=job.id)
+        except asyncio.CancelledError:
+            if job.id in self._cancelled:
+                self._cancelled.discard(job.id)
+                await self._store(self.store.set_state, job.id, JobState.CANCELLED)
+                logger.info("Job cancelled", job_id=job.id)
+            else:
+                raise
+        except Exception as e:
+            logger.error("Job failed", job_id=job.id, error=str(e))
+            await self._store(self.store.set_state, job.id, JobState.FAILED, str(e) or type(e).__name__)
+        finally:
+            self._notify(job.id)
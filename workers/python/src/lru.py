@@ -0,0 +1,90 @@
+"""Bounded, thread-safe LRU cache for in-process model artifacts."""
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from src.metrics import CACHE_EVENTS
+
+
+class LRUCache:
+    """Least-recently-used mapping with hit/miss counters.
+    
+    Counters are kept on the instance and mirrored to the
+    ``musicforge_cache_events_total`` metric under ``name``. With
+    ``max_bytes`` and a ``size_of`` function the cache is also bounded by
+    the total size of its values.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = 128,
+        max_bytes: int = 0,
+        size_of: Callable[[Any], int] | None = None,
+    ):
+        self.name = name
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._size_of = size_of
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._sizes: dict[Hashable, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                CACHE_EVENTS.inc(cache=self.name, result="hit")
+                return self._entries[key]
+            self.misses += 1
+            CACHE_EVENTS.inc(cache=self.name, result="miss")
+            return default
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        if self._max_entries <= 0:
+            return
+        size = self._size_of(value) if self._size_of is not None else 0
+        if self._max_bytes and size > self._max_bytes:
+            return
+        with self._lock:
+            self._bytes += size - self._sizes.get(key, 0)
+            self._sizes[key] = size
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries or (
+                self._max_bytes and self._bytes > self._max_bytes
+            ):
+                evicted, _ = self._entries.popitem(last=False)
+                self._bytes -= self._sizes.pop(evicted)
+    
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value or compute, store and return it.
+        
+        The computation runs outside the lock, so concurrent misses on the
+        same key may compute twice; the last result wins.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._bytes = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def stats(self) -> dict[str, int]:
+        stats = {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+        if self._size_of is not None:
+            stats["bytes"] = self._bytes
+        return stats
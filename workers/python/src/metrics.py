@@ -0,0 +1,266 @@
+"""Prometheus-style metrics for the worker.
+
+Metrics are kept in a process-wide registry and rendered in the Prometheus
+text exposition format, either through the ``GetMetrics`` RPC or the optional
+HTTP endpoint started by :func:`start_http_server`.
+"""
+import asyncio
+import bisect
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+import structlog
+
+logger = structlog.get_logger()
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+RATIO_BUCKETS = (0.05, 0.1, 0.25, 0.5, 0.75, 1, 1.5, 2, 4, 8, 16)
+
+
+def _label_key(labels: dict[str, str]) -> tuple[tuple[str, str], ...]:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: tuple[tuple[str, str], ...], extra: str = "") -> str:
+    parts = [f'{k}="{v}"' for k, v in key]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric:
+    kind = ""
+    
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._lock = threading.Lock()
+    
+    def render(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Monotonically increasing value."""
+    kind = "counter"
+    
+    def __init__(self, name: str, help_text: str):
+        super().__init__(name, help_text)
+        self._values: dict[tuple, float] = {}
+    
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+    
+    def value(self, **labels) -> float:
+        return self._values.get(_label_key(labels), 0)
+    
+    def render(self) -> list[str]:
+        lines = super().render()
+        with self._lock:
+            for key, value in self._values.items():
+                lines.append(f"{self.name}{_format_labels(key)} {value}")
+        return lines
+
+
+class Gauge(Counter):
+    """Value that can go up and down."""
+    kind = "gauge"
+    
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+    
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[_label_key(labels)] = value
+    
+    @contextmanager
+    def track(self, **labels) -> Iterator[None]:
+        """Increment for the duration of a block."""
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+
+class Histogram(_Metric):
+    """Distribution of observations over fixed buckets."""
+    kind = "histogram"
+    
+    def __init__(self, name: str, help_text: str, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        super().__init__(name, help_text)
+        self._buckets = buckets
+        self._series: dict[tuple, list] = {}
+    
+    def observe(self, value: float, **labels) -> None:
+        key = _label_key(labels)
+        index = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self._buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+    
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        """Observe the wall time of a block."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+    
+    def count(self, **labels) -> int:
+        series = self._series.get(_label_key(labels))
+        return series[2] if series else 0
+    
+    def render(self) -> list[str]:
+        lines = super().render()
+        with self._lock:
+            for key, (counts, total, count) in self._series.items():
+                cumulative = 0
+                for bound, n in zip([*self._buckets, "+Inf"], counts):
+                    cumulative += n
+                    le = 'le="%s"' % bound
+                    lines.append(f"{self.name}_bucket{_format_labels(key, le)} {cumulative}")
+                lines.append(f"{self.name}_sum{_format_labels(key)} {total}")
+                lines.append(f"{self.name}_count{_format_labels(key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together."""
+    
+    def __init__(self):
+        self._metrics: list[_Metric] = []
+    
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+    
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+RPC_LATENCY = REGISTRY.register(Histogram(
+    "musicforge_rpc_latency_seconds", "Wall time of each RPC, including the full stream"))
+TIME_TO_FIRST_CHUNK = REGISTRY.register(Histogram(
+    "musicforge_time_to_first_chunk_seconds", "Time until a streaming RPC yields its first chunk"))
+STAGE_SECONDS = REGISTRY.register(Histogram(
+    "musicforge_stage_seconds", "Time spent per processing stage"))
+REALTIME_FACTOR = REGISTRY.register(Histogram(
+    "musicforge_realtime_factor", "Audio seconds produced per wall second", RATIO_BUCKETS))
+AUDIO_SECONDS = REGISTRY.register(Counter(
+    "musicforge_audio_seconds_total", "Audio seconds produced"))
+QUEUE_DEPTH = REGISTRY.register(Gauge(
+    "musicforge_queue_depth", "Inference calls waiting for a worker thread"))
+IN_FLIGHT = REGISTRY.register(Gauge(
+    "musicforge_in_flight", "RPCs currently being served"))
+MODEL_EVENTS = REGISTRY.register(Counter(
+    "musicforge_model_events_total", "Model load, unload and cancel events"))
+CACHE_EVENTS = REGISTRY.register(Counter(
+    "musicforge_cache_events_total", "In-process cache hits and misses"))
+ADMISSION_REJECTIONS = REGISTRY.register(Counter(
+    "musicforge_admission_rejections_total", "Requests rejected by admission control"))
+
+
+async def start_http_server(port: int, registry: MetricsRegistry = REGISTRY) -> asyncio.AbstractServer:
+    """Serve the registry as plain text on ``/metrics``."""
+    
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await reader.readline()
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            
+            path = request_line.split(b" ")[1] if request_line.count(b" ") >= 2 else b""
+            if path.split(b"?")[0] == b"/metrics":
+                status, body = "200 OK", registry.render().encode()
+            else:
+                status, body = "404 Not Found", b"not found\n"
+            
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                "Content-Type: text/plain; version=0.0.4\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+    
+    server = await asyncio.start_server(handle, host="0.0.0.0", port=port)
+    logger.info("Metrics endpoint listening", port=port)
+    return server
+
+
+async def observe_stream(rpc: str, stream):
+    """Record in-flight count, time to first chunk and latency of a streaming RPC."""
+    started = time.perf_counter()
+    first = True
+    with IN_FLIGHT.track(rpc=rpc):
+        try:
+            async for item in stream:
+                if first:
+                    TIME_TO_FIRST_CHUNK.observe(time.perf_counter() - started, rpc=rpc)
+                    first = False
+                yield item
+        finally:
+            RPC_LATENCY.observe(time.perf_counter() - started, rpc=rpc)
+
+
+@contextmanager
+def observe_call(rpc: str) -> Iterator[None]:
+    """Record in-flight count and latency of a unary RPC."""
+    with IN_FLIGHT.track(rpc=rpc), RPC_LATENCY.time(rpc=rpc):
+        yield
+
+
+def instrument_rpc(handler):
+    """Decorate a servicer method so its calls are recorded under its name."""
+    rpc = handler.__name__
+    
+    if inspect.isasyncgenfunction(handler):
+        @functools.wraps(handler)
+        async def stream_wrapper(*args, **kwargs):
+            async for item in observe_stream(rpc, handler(*args, **kwargs)):
+                yield item
+        return stream_wrapper
+    
+    @functools.wraps(handler)
+    async def unary_wrapper(*args, **kwargs):
+        with observe_call(rpc):
+            return await handler(*args, **kwargs)
+    return unary_wrapper
+
+
+class RealtimeTracker:
+    """Accumulates produced audio to report the real-time factor of a stream."""
+    
+    def __init__(self, rpc: str):
+        self._rpc = rpc
+        self._started = time.perf_counter()
+        self._seconds = 0.0
+    
+    def add(self, samples: int, sample_rate: int) -> None:
+        seconds = samples / sample_rate if sample_rate else 0.0
+        self._seconds += seconds
+        AUDIO_SECONDS.inc(seconds, rpc=self._rpc)
+    
+    def finish(self) -> None:
+        elapsed = time.perf_counter() - self._started
+        if self._seconds and elapsed > 0:
+            REALTIME_FACTOR.observe(self._seconds / elapsed, rpc=self._rpc)
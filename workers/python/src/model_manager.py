@@ -0,0 +1,178 @@
+"""Central registry that keeps model residency within a memory budget."""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+import structlog
+
+from src.cancellation import RequestCancelledError
+from src.metrics import MODEL_EVENTS, STAGE_SECONDS
+
+logger = structlog.get_logger()
+
+
+class _ModelEntry:
+    """Bookkeeping for one registered model."""
+    
+    def __init__(self, wrapper: Any, estimated_bytes: int):
+        self.wrapper = wrapper
+        self.estimated_bytes = estimated_bytes
+        self.resident_bytes = 0
+        self.reserved_bytes = 0   # held against the budget while loading
+        self.loaded = False
+        self.in_use = 0
+        self.last_used = 0.0
+        self.load_lock = threading.Lock()
+
+
+class ModelManager:
+    """Loads models on demand and unloads least recently used ones.
+    
+    Wrappers must provide ``load()`` and ``unload()``; if they also provide
+    ``resident_bytes()`` it is used to measure the real footprint after
+    loading, otherwise the registered estimate is used. Models that are in
+    use are never evicted.
+    """
+    
+    def __init__(self, budget_bytes: int = 0):
+        self._budget = budget_bytes
+        self._entries: dict[str, _ModelEntry] = {}
+        self._cond = threading.Condition()
+    
+    def register(self, name: str, wrapper: Any, estimated_bytes: int = 0) -> None:
+        """Register a model wrapper under a name."""
+        with self._cond:
+            self._entries[name] = _ModelEntry(wrapper, estimated_bytes)
+    
+    @contextmanager
+    def acquire(self, name: str) -> Iterator[Any]:
+        """Ensure a model is resident and pin it for the duration of the block."""
+        entry = self._entries[name]
+        
+        with self._cond:
+            entry.in_use += 1
+            entry.last_used = time.monotonic()
+        
+        try:
+            if not entry.loaded:
+                self._load(name, entry)
+            yield entry.wrapper
+        finally:
+            with self._cond:
+                entry.in_use -= 1
+                entry.last_used = time.monotonic()
+                self._cond.notify_all()
+    
+    def call(self, name: str, method: str, *args, **kwargs) -> Any:
+        """Call a wrapper method with the model pinned."""
+        with self.acquire(name) as wrapper:
+            return getattr(wrapper, method)(*args, **kwargs)
+    
+    def stream(self, name: str, method: str, *args, **kwargs) -> Iterator[Any]:
+        """Iterate a wrapper generator with the model pinned until it finishes."""
+        with self.acquire(name) as wrapper:
+            try:
+                yield from getattr(wrapper, method)(*args, **kwargs)
+            except RequestCancelledError:
+                MODEL_EVENTS.inc(model=name, event="cancel")
+                raise
+    
+    def load(self, name: str) -> None:
+        """Load a model ahead of time (e.g. preloading at startup)."""
+        with self.acquire(name):
+            pass
+    
+    def unload(self, name: str) -> None:
+        """Unload a model if it is resident and idle."""
+        with self._cond:
+            entry = self._entries[name]
+            if entry.loaded and entry.in_use == 0:
+                self._unload(name, entry)
+    
+    def resident(self) -> list[str]:
+        """Names of models currently resident."""
+        with self._cond:
+            return [name for name, entry in self._entries.items() if entry.loaded]
+    
+    def resident_bytes(self) -> int:
+        with self._cond:
+            return sum(e.resident_bytes for e in self._entries.values() if e.loaded)
+    
+    def _load(self, name: str, entry: _ModelEntry) -> None:
+        # Loading happens outside the manager lock so other models stay
+        # usable; the estimate is reserved first so concurrent loads of
+        # different models cannot overcommit the budget between them.
+        with entry.load_lock:
+            if entry.loaded:
+                return
+            
+            with self._cond:
+                self._make_room(name, entry.estimated_bytes)
+                entry.reserved_bytes = entry.estimated_bytes
+            
+            started = time.monotonic()
+            try:
+                entry.wrapper.load()
+                measure = getattr(entry.wrapper, "resident_bytes", None)
+                size = measure() if measure is not None else 0
+            except BaseException:
+                with self._cond:
+                    entry.reserved_bytes = 0
+                    self._cond.notify_all()
+                raise
+            
+            with self._cond:
+                entry.resident_bytes = size or entry.estimated_bytes
+                entry.estimated_bytes = entry.resident_bytes
+                entry.reserved_bytes = 0
+                entry.loaded = True
+                self._cond.notify_all()
+        
+        elapsed = time.monotonic() - started
+        MODEL_EVENTS.inc(model=name, event="load")
+        STAGE_SECONDS.observe(elapsed, stage="model_load", model=name)
+        logger.info("Model loaded", model=name, bytes=entry.resident_bytes,
+                    seconds=round(elapsed, 2))
+    
+    def _make_room(self, name: str, needed: int) -> None:
+        """Evict idle models, least recently used first, until ``needed`` fits.
+        
+        Models still loading count at their reserved estimate. Waits for
+        busy models to be released if that is the only way to fit; if
+        nothing else is resident the model is loaded anyway.
+        """
+        if self._budget <= 0:
+            return
+        
+        while self._used_bytes() + needed > self._budget:
+            idle = [
+                (e.last_used, n) for n, e in self._entries.items()
+                if n != name and e.loaded and e.in_use == 0
+            ]
+            if idle:
+                _, victim = min(idle)
+                self._unload(victim, self._entries[victim])
+                continue
+            
+            busy = any(
+                (e.loaded or e.reserved_bytes) and e.in_use
+                for n, e in self._entries.items() if n != name
+            )
+            if not busy:
+                logger.warning("Model exceeds memory budget", model=name,
+                               needed=needed, budget=self._budget)
+                return
+            self._cond.wait()
+    
+    def _used_bytes(self) -> int:
+        return sum(
+            e.resident_bytes if e.loaded else e.reserved_bytes for e in self._entries.values()
+        )
+    
+    def _unload(self, name: str, entry: _ModelEntry) -> None:
+        entry.wrapper.unload()
+        entry.loaded = False
+        MODEL_EVENTS.inc(model=name, event="unload")
+        logger.info("Model unloaded", model=name, bytes=entry.resident_bytes)
+        entry.resident_bytes = 0
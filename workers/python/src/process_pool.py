@@ -0,0 +1,503 @@
+"""Supervisor that runs model replicas in separate worker processes.
+
+Each worker process owns its own ``ModelManager`` and model wrappers and
+runs one job at a time. The serving process dispatches every call to the
+least-loaded worker. Arrays travel in both directions through
+``multiprocessing.shared_memory`` blocks; only small descriptors are
+pickled over the pipe. Iterator arguments stay in the serving process and
+the worker pulls their items one at a time, so a long input is never
+copied into shared memory all at once. A worker that dies is restarted, and its in-flight
+jobs fail with :class:`WorkerCrashedError`.
+"""
+import asyncio
+import functools
+import itertools
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+from multiprocessing import shared_memory
+from typing import Any, AsyncIterator, Callable, NamedTuple
+
+import numpy as np
+import structlog
+
+from src.cancellation import CancelToken, RequestCancelledError
+from src.config import get_settings
+
+logger = structlog.get_logger()
+
+RESTART_DELAY_SECONDS = 0.5
+
+
+class WorkerCrashedError(RuntimeError):
+    """A worker process exited while running a job."""
+
+
+class RemoteError(RuntimeError):
+    """A job raised inside a worker process."""
+
+
+class SharedArray(NamedTuple):
+    """Descriptor for an array parked in a shared memory block."""
+    
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+class StreamedArgument(NamedTuple):
+    """Stands in for an iterator argument that the worker pulls item by item."""
+    
+    index: int
+
+
+def default_models() -> dict[str, Any]:
+    """Model wrappers owned by each worker process."""
+    from src.components import BarkWrapper, DemucsWrapper, MusicGenWrapper
+    
+    return {"musicgen": MusicGenWrapper(), "bark": BarkWrapper(), "demucs": DemucsWrapper()}
+
+
+def to_shared(value: Any) -> Any:
+    """Replace arrays in a (nested) value with shared memory descriptors.
+    
+    Iterators are materialized into lists, since they cannot cross processes;
+    ``WorkerPool`` streams top-level iterator arguments instead.
+    """
+    if isinstance(value, np.ndarray):
+        array = np.ascontiguousarray(value)
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, array.dtype, buffer=block.buf)[...] = array
+        descriptor = SharedArray(block.name, array.shape, array.dtype.str)
+        block.close()
+        return descriptor
+    if isinstance(value, SharedArray):
+        return value
+    if isinstance(value, dict):
+        return {k: to_shared(v) for k, v in value.items()}
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        return type(value)(*(to_shared(v) for v in value))
+    if isinstance(value, (list, tuple)):
+        return type(value)(to_shared(v) for v in value)
+    if hasattr(value, "__next__"):
+        return [to_shared(v) for v in value]
+    return value
+
+
+def from_shared(value: Any, release: bool = True) -> Any:
+    """Copy arrays back out of shared memory, unlinking each block."""
+    if isinstance(value, SharedArray):
+        block = shared_memory.SharedMemory(name=value.name)
+        try:
+            if not release:
+                return None
+            return np.ndarray(value.shape, np.dtype(value.dtype), buffer=block.buf).copy()
+        finally:
+            block.close()
+            block.unlink()
+    if isinstance(value, dict):
+        return {k: from_shared(v, release) for k, v in value.items()}
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        return type(value)(*(from_shared(v, release) for v in value))
+    if isinstance(value, (list, tuple)):
+        return type(value)(from_shared(v, release) for v in value)
+    return value
+
+
+def discard_shared(value: Any) -> None:
+    """Unlink the shared memory blocks in a value without reading them."""
+    from_shared(value, release=False)
+
+
+def _worker_main(index: int, conn, model_factory: Callable[[], dict[str, Any]]) -> None:
+    """Worker process loop: run jobs from the pipe one at a time."""
+    from src.model_manager import ModelManager
+    
+    settings = get_settings()
+    models = ModelManager(settings.model_memory_budget_mb * 1024 * 1024)
+    for name, wrapper in model_factory().items():
+        models.register(name, wrapper, getattr(wrapper, "estimated_bytes", 0))
+    
+    jobs: queue.Queue = queue.Queue()
+    tokens: dict[int, CancelToken] = {}
+    # job id -> items of its streamed arguments, as they arrive
+    feeds: dict[int, queue.Queue] = {}
+    feeds_lock = threading.Lock()
+    send_lock = threading.Lock()
+    
+    def send(message: tuple) -> None:
+        with send_lock:
+            conn.send(message)
+    
+    def receive() -> None:
+        # Reads ahead so cancellations reach a job that is still running.
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                message = None
+            if message is None:
+                jobs.put(None)
+                with feeds_lock:
+                    for feed in feeds.values():
+                        feed.put(None)
+                return
+            if message[0] == "cancel":
+                tokens.setdefault(message[1], CancelToken()).cancel()
+                with feeds_lock:
+                    if message[1] in feeds:
+                        feeds[message[1]].put(None)
+            elif message[0] == "arg":
+                with feeds_lock:
+                    feed = feeds.get(message[1])
+                    if feed is not None:
+                        feed.put(message[2])
+                if feed is None:
+                    discard_shared(message[2])
+            else:
+                jobs.put(message)
+    
+    def pull(job_id: int, index: int):
+        # One item in flight at a time; the pipe round trip is the backpressure.
+        feed = feeds[job_id]
+        while True:
+            send(("pull", job_id, index))
+            item = feed.get()
+            if item is None:
+                return
+            yield from_shared(item[0])
+    
+    threading.Thread(target=receive, name="worker-receive", daemon=True).start()
+    send(("status", None, {"pid": os.getpid(), "models_loaded": []}))
+    
+    while True:
+        message = jobs.get()
+        if message is None:
+            break
+        _, job_id, model, method, args, kwargs, streaming = message
+        token = tokens.setdefault(job_id, CancelToken())
+        try:
+            args, kwargs = from_shared((args, kwargs))
+            if any(isinstance(a, StreamedArgument) for a in args):
+                with feeds_lock:
+                    feeds[job_id] = queue.Queue()
+                args = tuple(
+                    pull(job_id, a.index) if isinstance(a, StreamedArgument) else a for a in args
+                )
+            if kwargs.get("cancel") is True:
+                kwargs["cancel"] = token
+            if token.cancelled:
+                pass
+            elif method is None:
+                models.load(model)
+                send(("item", job_id, None))
+            elif streaming:
+                stream = models.stream(model, method, *args, **kwargs)
+                try:
+                    for item in stream:
+                        if token.cancelled:
+                            break
+                        send(("item", job_id, to_shared(item)))
+                finally:
+                    stream.close()
+            else:
+                send(("item", job_id, to_shared(models.call(model, method, *args, **kwargs))))
+            send(("done", job_id, None))
+        except Exception as e:
+            send(("error", job_id, f"{type(e).__name__}: {e}"))
+        finally:
+            tokens.pop(job_id, None)
+            with feeds_lock:
+                feed = feeds.pop(job_id, None)
+            while feed is not None and not feed.empty():
+                discard_shared(feed.get_nowait())
+            send(("status", None, {"pid": os.getpid(), "models_loaded": models.resident()}))
+
+
+class _Job:
+    """Results of one dispatched call, delivered onto the caller's loop."""
+    
+    def __init__(self, job_id: int, worker: "_Worker", loop: asyncio.AbstractEventLoop):
+        self.id = job_id
+        self.worker = worker
+        self.loop = loop
+        self.results: asyncio.Queue = asyncio.Queue()
+        self.finished = False
+        # argument index -> iterator the worker pulls from
+        self.sources: dict[int, Any] = {}
+    
+    def deliver(self, kind: str, payload: Any) -> None:
+        self.loop.call_soon_threadsafe(self.results.put_nowait, (kind, payload))
+
+
+class _Worker:
+    """Supervisor-side state for one worker process."""
+    
+    def __init__(self, index: int):
+        self.index = index
+        self.process = None
+        self.conn = None
+        self.pid = 0
+        self.active = 0
+        self.completed = 0
+        self.restarts = 0
+        self.models_loaded: list[str] = []
+        self.send_lock = threading.Lock()
+    
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+    
+    def send(self, message: tuple) -> None:
+        with self.send_lock:
+            self.conn.send(message)
+
+
+class WorkerPool:
+    """Dispatches model calls to a pool of worker processes.
+    
+    ``stream`` and ``call`` mirror ``ModelManager.stream`` and
+    ``ModelManager.call``, but are awaitable and run in another process. A
+    ``cancel`` token argument is replaced by one owned by the worker, which
+    is set when the caller's token is or when the stream is closed early.
+    """
+    
+    def __init__(self, size: int, model_factory: Callable[[], dict[str, Any]] = default_models):
+        self._ctx = mp.get_context("spawn")
+        self._model_factory = model_factory
+        self._workers = [_Worker(i) for i in range(max(1, size))]
+        self._jobs: dict[int, _Job] = {}
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._closed = False
+    
+    def start(self) -> None:
+        """Spawn every worker process."""
+        for worker in self._workers:
+            self._spawn(worker)
+        logger.info("Worker pool started", workers=len(self._workers))
+    
+    def _spawn(self, worker: _Worker) -> None:
+        parent, child = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(worker.index, child, self._model_factory),
+            name=f"musicforge-worker-{worker.index}",
+            daemon=True,
+        )
+        process.start()
+        child.close()
+        worker.process, worker.conn, worker.pid = process, parent, process.pid
+        threading.Thread(
+            target=self._read, args=(worker, parent),
+            name=f"worker-{worker.index}-reader", daemon=True,
+        ).start()
+    
+    def _read(self, worker: _Worker, conn) -> None:
+        """Route a worker's messages to their jobs until the pipe closes."""
+        while True:
+            try:
+                kind, job_id, payload = conn.recv()
+            except (EOFError, OSError):
+                break
+            
+            if kind == "status":
+                worker.pid = payload["pid"]
+                worker.models_loaded = payload["models_loaded"]
+                continue
+            
+            with self._lock:
+                job = self._jobs.get(job_id)
+            if kind == "pull":
+                self._feed(worker, job, job_id, payload)
+                continue
+            if job is None or job.finished:
+                discard_shared(payload)
+                continue
+            
+            if kind == "item":
+                job.deliver(kind, from_shared(payload))
+            elif kind == "done":
+                job.deliver(kind, None)
+            else:
+                job.deliver(kind, RemoteError(payload))
+        
+        self._on_exit(worker, conn)
+    
+    def _feed(self, worker: _Worker, job: _Job | None, job_id: int, index: int) -> None:
+        """Send the next item of a streamed argument, or None once there is none."""
+        item = None
+        if job is not None and not job.finished:
+            try:
+                item = (to_shared(next(job.sources[index])),)
+            except StopIteration:
+                pass
+            except Exception as e:
+                job.deliver("error", e)
+        try:
+            worker.send(("arg", job_id, item))
+        except (OSError, ValueError):
+            discard_shared(item)
+    
+    def _on_exit(self, worker: _Worker, conn) -> None:
+        conn.close()
+        if self._closed:
+            return
+        
+        worker.process.join(timeout=1)
+        exitcode = worker.process.exitcode
+        with self._lock:
+            orphans = [job for job in self._jobs.values() if job.worker is worker]
+        for job in orphans:
+            job.deliver("error", WorkerCrashedError(
+                f"Worker {worker.index} exited with code {exitcode}"
+            ))
+        
+        worker.restarts += 1
+        worker.active = 0
+        worker.models_loaded = []
+        logger.error("Worker process exited, restarting", worker=worker.index,
+                     exitcode=exitcode, failed_jobs=len(orphans))
+        time.sleep(RESTART_DELAY_SECONDS)
+        if not self._closed:
+            self._spawn(worker)
+    
+    def _least_loaded(self) -> _Worker:
+        alive = [w for w in self._workers if w.alive] or self._workers
+        return min(alive, key=lambda w: w.active)
+    
+    async def _submit(
+        self, model: str, method: str | None, args: tuple, kwargs: dict,
+        streaming: bool, worker: _Worker | None = None,
+    ) -> _Job:
+        # A token cannot cross processes; the worker substitutes its own,
+        # which is cancelled when this job is.
+        cancel = kwargs.pop("cancel", None)
+        if cancel is not None:
+            kwargs["cancel"] = True
+        
+        # Iterators are pulled by the worker as it goes, not copied up front.
+        sources = {i: a for i, a in enumerate(args) if hasattr(a, "__next__")}
+        args = tuple(StreamedArgument(i) if i in sources else a for i, a in enumerate(args))
+        
+        # Copying large inputs into shared memory stays off the event loop.
+        loop = asyncio.get_running_loop()
+        args, kwargs = await loop.run_in_executor(None, to_shared, (args, kwargs))
+        
+        worker = worker or self._least_loaded()
+        job = _Job(next(self._ids), worker, loop)
+        job.sources = sources
+        with self._lock:
+            self._jobs[job.id] = job
+        worker.active += 1
+        try:
+            worker.send(("job", job.id, model, method, args, kwargs, streaming))
+        except (OSError, ValueError) as e:
+            self._finish(job)
+            discard_shared((args, kwargs))
+            raise WorkerCrashedError(f"Worker {worker.index} is unavailable") from e
+        if cancel is not None:
+            cancel.add_callback(functools.partial(loop.call_soon_threadsafe, self._cancel, job))
+        return job
+    
+    def _cancel(self, job: _Job) -> None:
+        """Stop a job in its worker and wake its consumer, if still waiting."""
+        if job.finished:
+            return
+        self._finish(job)
+        job.results.put_nowait(("error", RequestCancelledError()))
+    
+    def _finish(self, job: _Job, completed: bool = False) -> None:
+        if job.finished:
+            return
+        job.finished = True
+        job.sources = {}
+        with self._lock:
+            self._jobs.pop(job.id, None)
+        job.worker.active = max(0, job.worker.active - 1)
+        if completed:
+            job.worker.completed += 1
+        elif job.worker.alive:
+            try:
+                job.worker.send(("cancel", job.id))
+            except (OSError, ValueError):
+                pass
+        
+        # Drop anything delivered but never consumed.
+        while not job.results.empty():
+            _, payload = job.results.get_nowait()
+            if not isinstance(payload, BaseException):
+                discard_shared(payload)
+    
+    async def _results(self, job: _Job) -> AsyncIterator[Any]:
+        completed = False
+        try:
+            while True:
+                kind, payload = await job.results.get()
+                if kind == "item":
+                    yield payload
+                elif kind == "done":
+                    completed = True
+                    return
+                else:
+                    raise payload
+        finally:
+            self._finish(job, completed)
+    
+    async def stream(self, model: str, method: str, *args, **kwargs) -> AsyncIterator[Any]:
+        """Iterate a wrapper generator method on the least-loaded worker."""
+        job = await self._submit(model, method, args, kwargs, streaming=True)
+        async for item in self._results(job):
+            yield item
+    
+    async def call(self, model: str, method: str, *args, **kwargs) -> Any:
+        """Call a wrapper method on the least-loaded worker."""
+        job = await self._submit(model, method, args, kwargs, streaming=False)
+        result = None
+        async for result in self._results(job):
+            pass
+        return result
+    
+    async def preload(self, models: list[str]) -> None:
+        """Load the given models in every worker process."""
+        async def load(worker: _Worker, model: str) -> None:
+            job = await self._submit(model, None, (), {}, streaming=False, worker=worker)
+            async for _ in self._results(job):
+                pass
+        
+        await asyncio.gather(*[load(w, m) for w in self._workers for m in models])
+    
+    def stats(self) -> list[dict[str, Any]]:
+        """Per-process load for health reporting."""
+        return [
+            {
+                "index": w.index,
+                "pid": w.pid,
+                "alive": w.alive,
+                "active_requests": w.active,
+                "completed_requests": w.completed,
+                "restarts": w.restarts,
+                "models_loaded": list(w.models_loaded),
+            }
+            for w in self._workers
+        ]
+    
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop every worker process."""
+        self._closed = True
+        for worker in self._workers:
+            if worker.conn is None:
+                continue
+            try:
+                worker.send(None)
+            except (OSError, ValueError):
+                pass
+        for worker in self._workers:
+            if worker.process is None:
+                continue
+            worker.process.join(timeout)
+            if worker.process.is_alive():
+                worker.process.terminate()
+        logger.info("Worker pool shut down", workers=len(self._workers))
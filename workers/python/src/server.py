@@ -1,6 +1,10 @@
 """gRPC server for MusicForge worker."""
 import argparse
 import asyncio
+import contextlib
+import functools
+import importlib
+import math
 from concurrent import futures
 import numpy as np
 import grpc
@@ -13,6 +17,21 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "grpc_generated"))
 
 from src.config import get_settings, detect_device
 from src.components import MusicGenWrapper, BarkWrapper, DemucsWrapper, TheoryEngine
+from src.inference import InferenceExecutor
+from src.model_manager import ModelManager
+from src.cancellation import CancelToken
+from src.admission import AdmissionController, AdmissionRejectedError, Priority
+from src.process_pool import WorkerPool
+from src.metrics import REGISTRY, RealtimeTracker, instrument_rpc, start_http_server
+from src.batching import MusicGenBatcher
+from src.cache import ResultCache, make_key, normalize_text
+from src.artifacts import ArtifactStore, ArtifactWriter, sample_dtype, stored_encoding
+from src.audio_codec import STEM_NAMES, encode_audio, encode_stems
+from src.dsp import StreamProcessor
+from src.jobs import Job, JobManager, JobState, JobStore
+from src.arrangement import (
+    DEFAULT_BEATS_PER_BAR, SectionRender, Stitcher, bar_seconds, plan_sections,
+)
 
 # Import generated gRPC code (will be generated from proto)
 # For now, define inline until proto compilation
@@ -20,33 +39,72 @@ from google.protobuf import empty_pb2
 
 logger = structlog.get_logger()
 
+# Heavy frameworks imported by the background warmup rather than at startup.
+_WARM_IMPORTS = ("torch", "music21")
+
 
 class MusicWorkerServicer:
     """gRPC servicer for music generation."""
     
-    def __init__(self):
-        self._theory = TheoryEngine()
-        self._musicgen = MusicGenWrapper()
-        self._bark = BarkWrapper()
-        self._demucs = DemucsWrapper()
-        self._models_loaded: list[str] = []
+    def __init__(
+        self,
+        theory: TheoryEngine | None = None,
+        musicgen: MusicGenWrapper | None = None,
+        bark: BarkWrapper | None = None,
+        demucs: DemucsWrapper | None = None,
+        pool: WorkerPool | None = None,
+    ):
+        self._theory = theory or TheoryEngine()
+        self._musicgen = musicgen or MusicGenWrapper()
+        self._bark = bark or BarkWrapper()
+        self._demucs = demucs or DemucsWrapper()
+        settings = get_settings()
+        self._models = ModelManager(settings.model_memory_budget_mb * 1024 * 1024)
+        self._models.register("musicgen", self._musicgen, self._musicgen.estimated_bytes)
+        self._models.register("bark", self._bark, self._bark.estimated_bytes)
+        self._models.register("demucs", self._demucs, self._demucs.estimated_bytes)
+        self._executor = InferenceExecutor(settings.inference_workers)
+        # With a worker pool, models run in the pool's processes and the
+        # local wrappers only provide metadata such as model ids.
+        self._pool = pool
+        if pool is not None:
+            generate_batch = functools.partial(pool.stream, "musicgen", "generate_batch")
+        else:
+            generate_batch = functools.partial(self._models.stream, "musicgen", "generate_batch")
+        self._batcher = MusicGenBatcher(
+            generate_batch,
+            None if pool is not None else self._executor,
+            window_ms=settings.batch_window_ms,
+            max_batch_size=settings.max_batch_size,
+        )
+        self._cache = ResultCache(
+            settings.cache_dir,
+            max_bytes=settings.cache_max_mb * 1024 * 1024,
+            ttl_seconds=settings.cache_ttl_seconds,
+        )
+        self._admission = AdmissionController(
+            {
+                "musicgen": settings.musicgen_max_concurrent,
+                "bark": settings.bark_max_concurrent,
+                "demucs": settings.demucs_max_concurrent,
+            },
+            queue_size=settings.admission_queue_size,
+        )
+        self._artifacts = ArtifactStore(settings.artifact_dir, ttl_seconds=settings.artifact_ttl_seconds)
+        self._jobs = self._job_manager(JobStore(settings.job_dir)) if settings.job_dir else None
+        self._ready = False
+        # Set once warmup has finished importing torch and music21
+        self._frameworks_imported = False
     
+    @instrument_rpc
     async def GenerateTheory(self, request, context):
         """Generate music theory elements."""
         logger.info("GenerateTheory called", genre=request.genre, mood=request.mood)
         
-        # Determine key parameters (simplifying for now, request has limited fields)
-        # Assuming request might have key/mode or we pick defaults
-        root = "C"
-        mode = "major"
-        if request.key:
-             # Basic parsing if key is string "C Major" etc
-             parts = request.key.split()
-             if len(parts) >= 1: root = parts[0]
-             if len(parts) >= 2: mode = parts[1].lower()
-
+        root, mode = _parse_key(request.key)
+        
         # Generate progression
-        chords = self._theory.generate_progression(root, mode, request.genre)
+        chords = await self._theory_call(self._theory.generate_progression, root, mode, request.genre)
         
         # Generate sections
         section_data = self._theory.generate_sections(duration_bars=64) # Fixed for now or calc from seconds
@@ -66,9 +124,30 @@ class MusicWorkerServicer:
         return worker_pb2.TheoryResponse(
             chord_progression=chords,
             sections=sections,
-            midi_data=b"",  # Would contain actual MIDI data from theory engine if implemented
+            midi_data=self._theory.render_midi(chords, section_data, request.tempo_bpm),
         )
     
+    @instrument_rpc
+    async def GenerateProgressions(self, request, context):
+        """Generate progressions for every requested key and genre."""
+        from src.grpc_generated import worker_pb2
+        
+        keys = list(request.keys) or [""]
+        genres = list(request.genres) or ["pop"]
+        try:
+            results = await self._theory_call(
+                self._theory.generate_progressions, [_parse_key(k) for k in keys], genres
+            )
+        except Exception as exc:
+            await _abort(context, grpc.StatusCode.INVALID_ARGUMENT, f"Invalid key: {exc}")
+        
+        names = [k for k in keys for _ in genres]
+        return worker_pb2.ProgressionsResponse(progressions=[
+            worker_pb2.Progression(key=name, genre=genre, chords=chords)
+            for name, (_, _, genre, chords) in zip(names, results)
+        ])
+    
+    @instrument_rpc
     async def SynthesizeAudio(self, request, context):
         """Generate audio with streaming response."""
         logger.info("SynthesizeAudio called", 
@@ -77,22 +156,215 @@ class MusicWorkerServicer:
         
         from src.grpc_generated import worker_pb2
         
-        for audio, sample_rate, progress in self._musicgen.generate(
-            prompt=request.prompt,
-            duration_seconds=request.duration_seconds,
-            genre=request.genre,
-            energy_level=request.energy_level,
+        await self._check_artifacts(request.artifact_format, context)
+        key = make_key("audio", {
+            "model": self._musicgen.model_id,
+            "params": MusicGenWrapper.GENERATION_PARAMS,
+            "window": [MusicGenWrapper.CHUNK_SECONDS, MusicGenWrapper.OVERLAP_SECONDS],
+            "prompt": normalize_text(request.prompt),
+            "genre": request.genre.strip().lower(),
+            "energy_level": round(request.energy_level, 3),
+            "duration_seconds": request.duration_seconds,
+            "encoding": request.encoding,
+            "output": _output_params(),
+        })
+        
+        async for chunk in self._cached_stream(
+            _cache_key(key, request.artifact_format), worker_pb2.AudioChunk,
+            self._generate_audio(request, context),
+        ):
+            yield chunk
+    
+    async def _generate_audio(self, request, context):
+        from src.grpc_generated import worker_pb2
+        
+        ticket = await self._admit(
+            "musicgen", request.priority, max(1, request.duration_seconds), context
+        )
+        cancel = _request_token(context, ticket)
+        try:
+            async for status in self._wait_for_slot(ticket, context, worker_pb2.AudioChunk):
+                yield status
+            async for chunk in self._musicgen_chunks(request, cancel):
+                yield chunk
+        finally:
+            ticket.release()
+    
+    async def _musicgen_chunks(self, request, cancel: CancelToken | None = None):
+        from src.grpc_generated import worker_pb2
+        
+        realtime = RealtimeTracker("SynthesizeAudio")
+        post = _post_processor()
+        artifact = self._open_artifact(request, post.target_rate)
+        with _artifact_scope(artifact):
+            async for audio, sample_rate, progress in self._batcher.generate(
+                prompt=request.prompt,
+                duration_seconds=request.duration_seconds,
+                genre=request.genre,
+                energy_level=request.energy_level,
+                cancel=cancel,
+            ):
+                realtime.add(audio.shape[-1], sample_rate)
+                
+                # Post-process and encode off the event loop
+                payload = await self._executor.run(
+                    "codec", _process_audio, post, audio, sample_rate, progress >= 1.0,
+                    request.encoding, artifact,
+                )
+                
+                yield worker_pb2.AudioChunk(
+                    **payload,
+                    sample_rate=post.target_rate,
+                    is_final=(progress >= 1.0),
+                    progress=progress,
+                )
+            
+            async for chunk in self._flush_audio(post, request.encoding, artifact):
+                yield chunk
+        realtime.finish()
+    
+    @instrument_rpc
+    async def RenderArrangement(self, request, context):
+        """Render a song's sections concurrently and stream the stitched track."""
+        logger.info("RenderArrangement called",
+                   prompt=request.prompt[:50],
+                   sections=len(request.sections),
+                   tempo=request.tempo_bpm)
+        
+        from src.grpc_generated import worker_pb2
+        
+        plans = plan_sections(request.sections)
+        if not plans:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "No sections to render")
+        seconds = sum(p.bars for p in plans) * bar_seconds(request.tempo_bpm, request.beats_per_bar)
+        limit = get_settings().max_duration_seconds
+        if seconds > limit:
+            await _abort(
+                context, grpc.StatusCode.INVALID_ARGUMENT,
+                f"Arrangement runs {seconds:.0f}s, longer than the {limit}s limit",
+            )
+        await self._check_artifacts(request.artifact_format, context)
+        
+        key = make_key("arrangement", {
+            "model": self._musicgen.model_id,
+            "params": MusicGenWrapper.GENERATION_PARAMS,
+            "window": [MusicGenWrapper.CHUNK_SECONDS, MusicGenWrapper.OVERLAP_SECONDS],
+            "prompt": normalize_text(request.prompt),
+            "genre": request.genre.strip().lower(),
+            "bar_seconds": bar_seconds(request.tempo_bpm, request.beats_per_bar),
+            "sections": [[p.name, p.bars, round(p.energy_level, 3), p.elements] for p in plans],
+            "encoding": request.encoding,
+            "output": _output_params(),
+        })
+        
+        async for chunk in self._cached_stream(
+            _cache_key(key, request.artifact_format), worker_pb2.AudioChunk,
+            self._generate_arrangement(request, plans, context),
         ):
-            # Convert to bytes
-            audio_bytes = audio.astype(np.float32).tobytes()
+            yield chunk
+    
+    async def _generate_arrangement(self, request, plans, context):
+        from src.grpc_generated import worker_pb2
+        
+        # Every distinct section is rendered at the longest section's length
+        # (plus the crossfade into the next one), so they share MusicGen
+        # batches and the song takes about as long as its longest section.
+        # The stitcher trims each section to its own bars.
+        bar = bar_seconds(request.tempo_bpm, request.beats_per_bar)
+        fade = bar / (request.beats_per_bar or DEFAULT_BEATS_PER_BAR)  # one beat
+        duration = math.ceil(max(p.bars for p in plans) * bar + fade)
+        renders = len({p.render_key for p in plans})
+        
+        ticket = await self._admit("musicgen", request.priority, renders * duration, context)
+        cancel = _request_token(context, ticket)
+        try:
+            async for status in self._wait_for_slot(ticket, context, worker_pb2.AudioChunk):
+                yield status
+            async for chunk in self._arrangement_chunks(request, plans, bar, fade, duration, cancel):
+                yield chunk
+        finally:
+            ticket.release()
+    
+    async def _arrangement_chunks(
+        self, request, plans, bar: float, fade: float, duration: int,
+        cancel: CancelToken | None = None,
+    ):
+        from src.grpc_generated import worker_pb2
+        
+        renders: dict = {}
+        tasks = []
+        for plan in plans:
+            if plan.render_key not in renders:
+                render = renders[plan.render_key] = SectionRender()
+                tasks.append(asyncio.ensure_future(
+                    self._render_section(render, plan, request, duration, cancel)
+                ))
+        logger.info("Rendering arrangement", sections=len(plans), renders=len(renders), duration=duration)
+        
+        realtime = RealtimeTracker("RenderArrangement")
+        post = _post_processor()
+        artifact = self._open_artifact(request, post.target_rate)
+        stitcher = Stitcher(fade)
+        total_seconds = sum(p.bars for p in plans) * bar
+        emitted = 0.0
+        try:
+            for plan in plans:
+                async for audio in stitcher.section(renders[plan.render_key], plan.bars * bar):
+                    realtime.add(audio.shape[-1], stitcher.sample_rate)
+                    emitted += audio.shape[-1] / stitcher.sample_rate
+                    payload = await self._executor.run(
+                        "codec", _process_audio, post, audio, stitcher.sample_rate, False,
+                        request.encoding, artifact,
+                    )
+                    yield worker_pb2.AudioChunk(
+                        **payload,
+                        sample_rate=post.target_rate,
+                        progress=min(emitted / total_seconds, 0.999),
+                        section_name=plan.name,
+                    )
             
+            # Audio the resampler still holds, and the end-of-stream marker
+            tail = await self._executor.run("codec", post.flush)
+            if tail is None:
+                tail = np.zeros(0, dtype=np.float32)
+            payload = await self._executor.run(
+                "codec", _audio_payload, tail, post.target_rate, True, request.encoding, artifact
+            )
             yield worker_pb2.AudioChunk(
-                audio_data=audio_bytes,
-                sample_rate=sample_rate,
-                is_final=(progress >= 1.0),
-                progress=progress,
+                **payload,
+                sample_rate=post.target_rate,
+                is_final=True,
+                progress=1.0,
+                section_name=plans[-1].name,
             )
+        except BaseException:
+            if artifact is not None:
+                artifact.abort()
+            raise
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        realtime.finish()
+    
+    async def _render_section(self, render: SectionRender, plan, request, duration: int, cancel):
+        """Generate one distinct section into its render buffer."""
+        error = None
+        try:
+            async for audio, sample_rate, _ in self._batcher.generate(
+                prompt=plan.prompt(request.prompt),
+                duration_seconds=duration,
+                genre=request.genre,
+                energy_level=plan.energy_level,
+                cancel=cancel,
+            ):
+                render.append(audio, sample_rate)
+        except Exception as e:
+            error = e
+        finally:
+            render.finish(error)
     
+    @instrument_rpc
     async def SynthesizeVocals(self, request, context):
         """Generate vocal audio with streaming."""
         logger.info("SynthesizeVocals called", 
@@ -101,100 +373,778 @@ class MusicWorkerServicer:
         
         from src.grpc_generated import worker_pb2
         
-        for audio, sample_rate, progress in self._bark.synthesize(
-            text=request.lyrics,
-            voice_type=request.voice_type,
-            style=request.style,
+        await self._check_artifacts(request.artifact_format, context)
+        key = make_key("vocals", {
+            "model": self._bark.model_id,
+            "lyrics": normalize_text(request.lyrics),
+            "voice_type": request.voice_type,
+            "style": normalize_text(request.style),
+            "encoding": request.encoding,
+            "output": _output_params(seam=True),
+        })
+        
+        async for chunk in self._cached_stream(
+            _cache_key(key, request.artifact_format), worker_pb2.AudioChunk,
+            self._generate_vocals(request, context),
         ):
-            audio_bytes = audio.astype(np.float32).tobytes()
+            yield chunk
+    
+    async def _generate_vocals(self, request, context):
+        from src.grpc_generated import worker_pb2
+        
+        # Roughly one second of audio per 15 characters of lyrics
+        ticket = await self._admit(
+            "bark", request.priority, max(1.0, len(request.lyrics) / 15), context
+        )
+        cancel = _request_token(context, ticket)
+        try:
+            async for status in self._wait_for_slot(ticket, context, worker_pb2.AudioChunk):
+                yield status
+            async for chunk in self._bark_chunks(request, cancel):
+                yield chunk
+        finally:
+            ticket.release()
+    
+    async def _bark_chunks(self, request, cancel: CancelToken | None = None):
+        from src.grpc_generated import worker_pb2
+        
+        realtime = RealtimeTracker("SynthesizeVocals")
+        # Sentences are generated separately, so their seams are crossfaded
+        post = _post_processor(seam=True)
+        artifact = self._open_artifact(request, post.target_rate)
+        with _artifact_scope(artifact):
+            async for audio, sample_rate, progress in self._model_stream(
+                "bark",
+                "synthesize",
+                text=request.lyrics,
+                voice_type=request.voice_type,
+                style=request.style,
+                cancel=cancel,
+            ):
+                realtime.add(audio.shape[-1], sample_rate)
+                payload = await self._executor.run(
+                    "codec", _process_audio, post, audio, sample_rate, progress >= 1.0,
+                    request.encoding, artifact,
+                )
+                
+                yield worker_pb2.AudioChunk(
+                    **payload,
+                    sample_rate=post.target_rate,
+                    is_final=(progress >= 1.0),
+                    progress=progress,
+                )
             
-            yield worker_pb2.AudioChunk(
-                audio_data=audio_bytes,
-                sample_rate=sample_rate,
-                is_final=(progress >= 1.0),
-                progress=progress,
-            )
+            async for chunk in self._flush_audio(post, request.encoding, artifact):
+                yield chunk
+        realtime.finish()
+    
+    async def _flush_audio(
+        self, post: StreamProcessor, encoding: int, artifact: ArtifactWriter | None = None
+    ):
+        """Emit audio still held by the post-processor if the stream ended without a final chunk."""
+        from src.grpc_generated import worker_pb2
+        
+        tail = await self._executor.run("codec", post.flush)
+        if tail is None or not tail.shape[-1]:
+            return
+        payload = await self._executor.run(
+            "codec", _audio_payload, tail, post.target_rate, True, encoding, artifact
+        )
+        yield worker_pb2.AudioChunk(
+            **payload,
+            sample_rate=post.target_rate,
+            is_final=True,
+            progress=1.0,
+        )
     
+    @instrument_rpc
     async def SeparateStems(self, request, context):
         """Separate audio into stems."""
         logger.info("SeparateStems called", data_size=len(request.audio_data))
         
         from src.grpc_generated import worker_pb2
         
+        await self._check_artifacts(request.artifact_format, context)
+        key = _cache_key(await self._stem_key(
+            "stems", request.audio_data, request.sample_rate,
+            max(1, request.channels), request.encoding,
+        ), request.artifact_format)
+        cached = await self._executor.run("cache", self._cache.get, key) if key else None
+        if cached is not None:
+            return worker_pb2.StemResponse.FromString(cached[0])
+        
         # Convert bytes back to numpy
         audio = np.frombuffer(request.audio_data, dtype=np.float32)
+        if request.channels > 1:
+            audio = audio.reshape(-1, request.channels).T
         
-        stems = self._demucs.separate(audio, request.sample_rate)
+        ticket = await self._admit(
+            "demucs", request.priority, audio.shape[-1] / max(1, request.sample_rate), context
+        )
+        try:
+            async for _ in self._wait_for_slot(ticket, context, worker_pb2.StemChunk):
+                pass
+            stems = await self._model_call("demucs", "separate", audio, request.sample_rate)
+        finally:
+            ticket.release()
         
-        return worker_pb2.StemResponse(
-            drums=stems.get("drums", np.array([])).astype(np.float32).tobytes(),
-            bass=stems.get("bass", np.array([])).astype(np.float32).tobytes(),
-            vocals=stems.get("vocals", np.array([])).astype(np.float32).tobytes(),
-            other=stems.get("other", np.array([])).astype(np.float32).tobytes(),
-            sample_rate=self._demucs._model.samplerate if self._demucs._model else 44100,
+        sample_rate = self._demucs._model.samplerate if self._demucs._model else 44100
+        posts = _stem_processors()
+        artifacts = self._open_stem_artifacts(request.artifact_format, request.encoding)
+        with _artifact_scope(*(artifacts or {}).values()):
+            payload = await self._executor.run(
+                "codec", _process_stems, posts, stems, sample_rate, True, request.encoding, artifacts
+            )
+        
+        response = worker_pb2.StemResponse(
+            **payload,
+            sample_rate=get_settings().output_sample_rate,
         )
+        
+        if self._cache.enabled and key:
+            await self._executor.run(
+                "cache", self._cache.put, key, [response.SerializeToString()]
+            )
+        return response
     
-    async def HealthCheck(self, request, context):
-        """Return health status."""
-        import torch
+    @instrument_rpc
+    async def SeparateStemsStream(self, request, context):
+        """Separate audio into stems segment by segment with streaming."""
+        logger.info("SeparateStemsStream called", data_size=len(request.audio_data))
+        
+        from src.grpc_generated import worker_pb2
+        
+        await self._check_artifacts(request.artifact_format, context)
+        channels = max(1, request.channels)
+        key = await self._stem_key(
+            "stems_stream", request.audio_data, request.sample_rate, channels, request.encoding
+        )
+        
+        async for chunk in self._cached_stream(
+            _cache_key(key, request.artifact_format),
+            worker_pb2.StemChunk,
+            self._separate_stream(
+                request.audio_data, request.sample_rate, channels, request.encoding,
+                request.priority, context, request.artifact_format,
+            ),
+        ):
+            yield chunk
+    
+    @instrument_rpc
+    async def SeparateStemsUpload(self, request_iterator, context):
+        """Separate audio uploaded in chunks, streaming stems back."""
+        from src.grpc_generated import worker_pb2
+        
+        buffer = None
+        size = 0
+        sample_rate = 0
+        channels = 1
+        encoding = 0
+        priority = Priority.INTERACTIVE
+        artifact_format = 0
+        limit = get_settings().max_upload_mb * 1024 * 1024
+        
+        # Assemble the upload in place; slice assignment grows the buffer if
+        # the client's size hint was missing or short.
+        async for chunk in request_iterator:
+            if buffer is None:
+                sample_rate = chunk.sample_rate
+                channels = max(1, chunk.channels)
+                encoding = chunk.encoding
+                priority = chunk.priority
+                artifact_format = chunk.artifact_format
+                if chunk.total_bytes > limit:
+                    await _abort(
+                        context, grpc.StatusCode.RESOURCE_EXHAUSTED,
+                        _upload_too_large(chunk.total_bytes, limit),
+                    )
+                buffer = bytearray(chunk.total_bytes)
+            end = size + len(chunk.audio_data)
+            if end > limit:
+                await _abort(
+                    context, grpc.StatusCode.RESOURCE_EXHAUSTED, _upload_too_large(end, limit)
+                )
+            buffer[size:end] = chunk.audio_data
+            size = end
+        
+        if buffer is None or sample_rate <= 0:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "No audio uploaded")
+        await self._check_artifacts(artifact_format, context)
+        
+        logger.info("SeparateStemsUpload received", data_size=size)
         
+        frame_bytes = 4 * channels
+        audio_data = memoryview(buffer)[:size - size % frame_bytes]
+        key = await self._stem_key(
+            "stems_stream", audio_data, sample_rate, channels, encoding
+        )
+        
+        async for chunk in self._cached_stream(
+            _cache_key(key, artifact_format),
+            worker_pb2.StemChunk,
+            self._separate_stream(
+                audio_data, sample_rate, channels, encoding, priority, context, artifact_format
+            ),
+        ):
+            yield chunk
+    
+    async def _separate_stream(
+        self, audio_data, sample_rate: int, channels: int, encoding: int,
+        priority: int = Priority.INTERACTIVE, context=None, artifact_format: int = 0,
+    ):
         from src.grpc_generated import worker_pb2
         
-        gpu_available = torch.cuda.is_available() or (
-            hasattr(torch.backends, "mps") and torch.backends.mps.is_available()
+        audio = np.frombuffer(audio_data, dtype=np.float32)
+        
+        ticket = await self._admit(
+            "demucs", priority, len(audio) / max(1, sample_rate * channels), context
         )
+        cancel = _request_token(context, ticket)
+        try:
+            async for status in self._wait_for_slot(ticket, context, worker_pb2.StemChunk):
+                yield status
+            async for chunk in self._stem_chunks(
+                audio, sample_rate, channels, encoding, cancel, artifact_format
+            ):
+                yield chunk
+        finally:
+            ticket.release()
+    
+    async def _stem_chunks(
+        self, audio: np.ndarray, sample_rate: int, channels: int, encoding: int,
+        cancel: CancelToken | None = None, artifact_format: int = 0,
+    ):
+        from src.grpc_generated import worker_pb2
+        
+        posts = _stem_processors()
+        artifacts = self._open_stem_artifacts(artifact_format, encoding)
+        with _artifact_scope(*(artifacts or {}).values()):
+            async for stems, model_rate, progress in self._model_stream(
+                "demucs",
+                "separate_stream",
+                _iter_blocks(audio, sample_rate * channels),
+                sample_rate,
+                channels,
+                total_samples=len(audio) // channels,
+                cancel=cancel,
+            ):
+                payload = await self._executor.run(
+                    "codec", _process_stems, posts, stems, model_rate, progress >= 1.0,
+                    encoding, artifacts,
+                )
+                
+                yield worker_pb2.StemChunk(
+                    **payload,
+                    sample_rate=get_settings().output_sample_rate,
+                    is_final=(progress >= 1.0),
+                    progress=progress,
+                )
+    
+    async def _stem_key(
+        self, kind: str, audio_data, sample_rate: int, channels: int, encoding: int
+    ) -> str:
+        """Hash a separation request, including its audio bytes, off the event loop."""
+        if not self._cache.enabled:
+            return ""
+        
+        params = {
+            "model": self._demucs.model_id,
+            "segment": [DemucsWrapper.SEGMENT_SECONDS, DemucsWrapper.OVERLAP_SECONDS],
+            "sample_rate": sample_rate,
+            "channels": channels,
+            "encoding": encoding,
+            "output_sample_rate": get_settings().output_sample_rate,
+        }
+        return await self._executor.run("cache", make_key, kind, params, audio_data)
+    
+    async def _cached_stream(self, key: str, message_type, produce):
+        """Replay a cached response stream, or produce, store and yield a fresh one."""
+        if not self._cache.enabled or not key:
+            async for message in produce:
+                yield message
+            return
+        
+        cached = await self._executor.run("cache", self._cache.get, key)
+        if cached is not None:
+            logger.info("Result cache hit", key=key[:12], chunks=len(cached))
+            for data in cached:
+                yield message_type.FromString(data)
+            return
         
+        writer = await self._executor.run("cache", self._cache.writer, key)
+        try:
+            async for message in produce:
+                if not message.queue_position:
+                    await self._executor.run("cache", writer.append, message.SerializeToString())
+                yield message
+        except BaseException:
+            writer.abort()
+            raise
+        await self._executor.run("cache", writer.commit)
+    
+    @instrument_rpc
+    async def SubmitJob(self, request, context):
+        """Store a generation request as a durable job and start it in the background."""
+        jobs = await self._require_jobs(context)
+        kind = request.WhichOneof("request")
+        if kind is None:
+            await _abort(context, grpc.StatusCode.INVALID_ARGUMENT, "No request to run")
+        payload = getattr(request, kind)
+        if kind == "arrangement" and not payload.sections:
+            await _abort(context, grpc.StatusCode.INVALID_ARGUMENT, "No sections to render")
+        
+        job = await jobs.submit(kind, payload.SerializeToString(), request.job_id)
+        return _job_status(job)
+    
+    @instrument_rpc
+    async def GetJobStatus(self, request, context):
+        """Return a job's state and how many results it has stored."""
+        jobs = await self._require_jobs(context)
+        return _job_status(await self._require_job(jobs.get(request.job_id), context))
+    
+    @instrument_rpc
+    async def CancelJob(self, request, context):
+        """Stop a queued or running job, keeping the results it already stored."""
+        jobs = await self._require_jobs(context)
+        return _job_status(await self._require_job(jobs.cancel(request.job_id), context))
+    
+    @instrument_rpc
+    async def StreamJobResult(self, request, context):
+        """Stream a job's stored results from an offset, then follow it until it finishes."""
+        from src.grpc_generated import worker_pb2
+        
+        jobs = await self._require_jobs(context)
+        job = await self._require_job(jobs.get(request.job_id), context)
+        message_type = worker_pb2.StemChunk if job.kind == "stems" else worker_pb2.AudioChunk
+        field = "stems" if job.kind == "stems" else "audio"
+        
+        async for index, data in jobs.stream(job.id, max(0, request.offset)):
+            yield worker_pb2.JobChunk(index=index, **{field: message_type.FromString(data)})
+        
+        job = await jobs.get(job.id)
+        if job.state == JobState.FAILED:
+            await _abort(context, grpc.StatusCode.INTERNAL, f"Job failed: {job.error}")
+        elif job.state == JobState.CANCELLED:
+            await _abort(context, grpc.StatusCode.CANCELLED, "Job was cancelled")
+    
+    async def _require_jobs(self, context) -> JobManager:
+        if self._jobs is None:
+            await _abort(context, grpc.StatusCode.FAILED_PRECONDITION, "Jobs are disabled (set MUSICFORGE_JOB_DIR)")
+        return self._jobs
+    
+    async def _require_job(self, lookup, context) -> Job:
+        job = await lookup
+        if job is None:
+            await _abort(context, grpc.StatusCode.NOT_FOUND, "Unknown job")
+        return job
+    
+    def _job_manager(self, store: JobStore) -> JobManager:
+        """Jobs run the same handlers as their streaming RPCs, with no client attached."""
+        from src.grpc_generated import worker_pb2
+        
+        def runner(handler, request_type):
+            return lambda data: handler(request_type.FromString(data), None)
+        
+        settings = get_settings()
+        return JobManager(
+            store,
+            {
+                "audio": runner(self.SynthesizeAudio, worker_pb2.AudioRequest),
+                "vocals": runner(self.SynthesizeVocals, worker_pb2.VocalRequest),
+                "arrangement": runner(self.RenderArrangement, worker_pb2.ArrangementRequest),
+                "stems": runner(self.SeparateStemsStream, worker_pb2.StemRequest),
+            },
+            self._executor,
+            max_running=settings.job_max_running,
+            ttl_seconds=settings.job_ttl_seconds,
+        )
+    
+    @instrument_rpc
+    async def RetainArtifact(self, request, context):
+        """Take another reference to an artifact and extend its lifetime."""
+        return await self._update_artifact(self._artifacts.retain, request.artifact_id, context)
+    
+    @instrument_rpc
+    async def ReleaseArtifact(self, request, context):
+        """Drop a reference to an artifact, deleting its file when none are left."""
+        return await self._update_artifact(self._artifacts.release, request.artifact_id, context)
+    
+    async def _update_artifact(self, update, artifact_id: str, context):
+        from src.grpc_generated import worker_pb2
+        
+        await self._check_artifacts(True, context)
+        status = await self._executor.run("artifacts", update, artifact_id)
+        if status is None:
+            await _abort(context, grpc.StatusCode.NOT_FOUND, "Unknown artifact")
+        references, expires_at = status
+        return worker_pb2.ArtifactStatus(
+            artifact_id=artifact_id, references=references, expires_at=expires_at
+        )
+    
+    async def _check_artifacts(self, artifact_format: int, context) -> None:
+        if artifact_format and not self._artifacts.enabled:
+            await _abort(
+                context, grpc.StatusCode.FAILED_PRECONDITION,
+                "Artifacts are disabled (set MUSICFORGE_ARTIFACT_DIR)",
+            )
+    
+    def _open_artifact(self, request, sample_rate: int) -> ArtifactWriter | None:
+        """An artifact for a stream's audio, or None when the request wants it inline."""
+        if not request.artifact_format:
+            return None
+        return self._artifacts.create(request.artifact_format, sample_dtype(request.encoding), sample_rate)
+    
+    def _open_stem_artifacts(self, artifact_format: int, encoding: int) -> dict[str, ArtifactWriter] | None:
+        if not artifact_format:
+            return None
+        rate = get_settings().output_sample_rate
+        return {
+            name: self._artifacts.create(artifact_format, sample_dtype(encoding), rate, name)
+            for name in STEM_NAMES
+        }
+    
+    @instrument_rpc
+    async def HealthCheck(self, request, context):
+        """Return health status."""
+        from src.grpc_generated import worker_pb2
+        
+        # Probing the GPU needs torch; until warmup has finished importing it,
+        # answer without waiting on the import lock on the event loop.
+        gpu_available = False
         gpu_memory = 0
-        if torch.cuda.is_available():
-            gpu_memory = torch.cuda.get_device_properties(0).total_memory
+        if self._frameworks_imported:
+            import torch
+            
+            gpu_available = torch.cuda.is_available() or (
+                hasattr(torch.backends, "mps") and torch.backends.mps.is_available()
+            )
+            if torch.cuda.is_available():
+                gpu_memory = torch.cuda.get_device_properties(0).total_memory
         
         return worker_pb2.HealthResponse(
             status="healthy",
             gpu_available=gpu_available,
             gpu_memory_bytes=gpu_memory,
-            models_loaded=self._models_loaded,
+            models_loaded=self._models_loaded(),
+            cache=worker_pb2.CacheStats(**self._cache.stats()),
+            readiness="ready" if self._ready else "warming",
+            workers=[worker_pb2.WorkerLoad(**w) for w in self._pool.stats()] if self._pool else [],
         )
     
+    async def GetMetrics(self, request, context):
+        """Return worker metrics in Prometheus text format."""
+        from src.grpc_generated import worker_pb2
+        
+        return worker_pb2.MetricsResponse(text=REGISTRY.render())
+    
+    async def resume_jobs(self) -> None:
+        """Pick up jobs that were queued or running when the worker last stopped."""
+        if self._jobs is not None:
+            await self._jobs.resume()
+    
+    def shutdown(self) -> None:
+        """Release inference resources."""
+        if self._jobs is not None:
+            # Running jobs stay marked running, so the next start re-queues them
+            self._jobs.shutdown()
+        self._executor.shutdown(wait=False)
+        if self._pool is not None:
+            self._pool.shutdown()
+    
+    def _model_stream(self, model: str, method: str, *args, **kwargs):
+        """Iterate a model generator in-process or on the worker pool."""
+        if self._pool is not None:
+            return self._pool.stream(model, method, *args, **kwargs)
+        return self._executor.iterate(model, self._models.stream, model, method, *args, **kwargs)
+    
+    async def _model_call(self, model: str, method: str, *args, **kwargs):
+        """Call a model method in-process or on the worker pool."""
+        if self._pool is not None:
+            return await self._pool.call(model, method, *args, **kwargs)
+        return await self._executor.run(model, self._models.call, model, method, *args, **kwargs)
+    
+    async def _admit(self, model: str, priority: int, cost: float, context):
+        """Take a place in the model's admission queue, or reject the RPC."""
+        try:
+            return self._admission.admit(
+                model, Priority(priority), cost, time_remaining=_time_remaining(context)
+            )
+        except AdmissionRejectedError as e:
+            await _reject(context, e)
+    
+    async def _wait_for_slot(self, ticket, context, message_type):
+        """Yield queue status messages until the ticket is admitted."""
+        try:
+            async for position, wait in ticket.wait(_time_remaining(context)):
+                yield message_type(queue_position=position, estimated_wait_seconds=wait)
+        except AdmissionRejectedError as e:
+            await _reject(context, e)
+    
+    def _models_loaded(self) -> list[str]:
+        if self._pool is None:
+            return self._models.resident()
+        return sorted({m for w in self._pool.stats() for m in w["models_loaded"]})
+    
+    async def _theory_call(self, fn, *args):
+        """Call the theory engine, on a thread until warmup has imported music21."""
+        if self._frameworks_imported:
+            return fn(*args)
+        return await self._executor.run("theory", fn, *args)
+    
     def preload_models(self, models: list[str]) -> None:
         """Preload specified models."""
-        if "musicgen" in models:
-            self._musicgen.load()
-            self._models_loaded.append("musicgen")
-        if "bark" in models:
-            self._bark.load()
-            self._models_loaded.append("bark")
-        if "demucs" in models:
-            self._demucs.load()
-            self._models_loaded.append("demucs")
+        for name in models:
+            self._models.load(name)
+    
+    async def warm_up(self, preload: list[str] | None = None) -> None:
+        """Import model frameworks and preload models off the event loop.
+        
+        Runs after the server has started, so health and theory requests are
+        answered while the worker is still warming.
+        """
+        try:
+            await self._executor.run("warmup", _import_frameworks)
+            self._frameworks_imported = True
+            await self._executor.run("warmup", self._theory.precompute)
+            if preload:
+                logger.info("Preloading models", models=preload)
+                if self._pool is not None:
+                    await self._pool.preload(preload)
+                else:
+                    await self._executor.run("warmup", self.preload_models, preload)
+        except Exception:
+            logger.exception("Warmup failed; models will load on first use")
+        finally:
+            self._ready = True
+            logger.info("Worker ready")
+
+
+def _time_remaining(context) -> float | None:
+    """Seconds until the RPC deadline, or None without one."""
+    if context is None:
+        return None
+    return context.time_remaining()
+
+
+def _request_token(context, ticket=None) -> CancelToken:
+    """A token set when the RPC ends, e.g. on client disconnect or deadline expiry.
+    
+    Cancelling also frees the request's admission slot right away, rather
+    than when its generator is finally unwound.
+    """
+    cancel = CancelToken()
+    if ticket is not None:
+        cancel.add_callback(ticket.release)
+    if context is not None:
+        context.add_done_callback(lambda _: cancel.cancel())
+    return cancel
+
+
+async def _abort(context, code: grpc.StatusCode, details: str):
+    """Abort the RPC, or raise when called without one (e.g. from tests)."""
+    if context is None:
+        raise grpc.aio.AbortError(f"{code.name}: {details}")
+    await context.abort(code, details)
+
+
+def _upload_too_large(size: int, limit: int) -> str:
+    return f"Upload of {size} bytes exceeds the {limit // (1024 * 1024)} MB limit"
+
+
+def _job_status(job: Job):
+    from src.grpc_generated import worker_pb2
+    
+    return worker_pb2.JobStatus(
+        job_id=job.id,
+        kind=job.kind,
+        state=int(job.state),
+        progress=job.progress,
+        chunks_available=job.chunks,
+        attempt=job.attempt,
+        error=job.error,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+    )
+
+
+async def _reject(context, error: AdmissionRejectedError):
+    logger.warning("Request rejected by admission control", reason=str(error))
+    if context is None:
+        raise error
+    await context.abort(error.code, str(error))
+
+
+def _output_params(seam: bool = False) -> list:
+    """Post-processing settings that change a stream's audio, for cache keys."""
+    settings = get_settings()
+    return [
+        settings.output_sample_rate,
+        settings.output_loudness_lufs,
+        settings.seam_crossfade_ms if seam else 0,
+    ]
+
+
+def _post_processor(seam: bool = False) -> StreamProcessor:
+    """Resampling and loudness normalization for one audio or vocals stream."""
+    settings = get_settings()
+    return StreamProcessor(
+        settings.output_sample_rate,
+        target_lufs=settings.output_loudness_lufs or None,
+        seam_fade_ms=settings.seam_crossfade_ms if seam else 0,
+    )
+
+
+def _stem_processors() -> dict[str, StreamProcessor]:
+    """Per-stem resampling only; stems keep their levels so they still sum to the mix."""
+    rate = get_settings().output_sample_rate
+    return {name: StreamProcessor(rate) for name in STEM_NAMES}
+
+
+def _cache_key(key: str, artifact_format: int) -> str:
+    """The result cache key, or "" to bypass the cache for responses holding artifact handles."""
+    # Cached handles would outlive the artifacts they point at
+    return "" if artifact_format else key
+
+
+@contextlib.contextmanager
+def _artifact_scope(*artifacts: ArtifactWriter | None):
+    """Finish a response's artifacts when it completes; drop them if it fails or is abandoned."""
+    try:
+        yield
+    except BaseException:
+        for artifact in artifacts:
+            if artifact is not None:
+                artifact.abort()
+        raise
+    for artifact in artifacts:
+        if artifact is not None:
+            artifact.finish()
+
+
+def _artifact_handle(artifact: ArtifactWriter, offset: int, length: int):
+    from src.grpc_generated import worker_pb2
+    
+    return worker_pb2.ArtifactHandle(
+        artifact_id=artifact.id,
+        path=artifact.path,
+        offset=offset,
+        length=length,
+        dtype=artifact.dtype.str,
+        channels=artifact.channels,
+        sample_rate=artifact.sample_rate,
+        format=artifact.format,
+        name=artifact.name,
+        complete=artifact.finished,
+    )
+
+
+def _audio_payload(
+    audio, sample_rate: int, final: bool, encoding: int, artifact: ArtifactWriter | None = None
+) -> dict:
+    """AudioChunk audio fields: encoded bytes, or a handle to the audio appended to ``artifact``."""
+    if artifact is None:
+        return {"audio_data": encode_audio(audio, sample_rate, encoding), "encoding": encoding}
+    return {
+        "artifact": _artifact_handle(artifact, *artifact.write(audio, final)),
+        "encoding": stored_encoding(encoding),
+    }
+
+
+def _process_audio(
+    post: StreamProcessor, audio, sample_rate: int, final: bool, encoding: int,
+    artifact: ArtifactWriter | None = None,
+) -> dict:
+    return _audio_payload(post.process(audio, sample_rate, final), post.target_rate, final, encoding, artifact)
+
+
+def _process_stems(
+    posts: dict[str, StreamProcessor], stems: dict, sample_rate: int, final: bool, encoding: int,
+    artifacts: dict[str, ArtifactWriter] | None = None,
+) -> dict:
+    processed = {
+        name: posts[name].process(stem, sample_rate, final)
+        for name, stem in stems.items() if name in posts
+    }
+    if artifacts is None:
+        return {**encode_stems(processed, get_settings().output_sample_rate, encoding), "encoding": encoding}
+    return {
+        "artifacts": [
+            _artifact_handle(artifacts[name], *artifacts[name].write(audio, final))
+            for name, audio in processed.items()
+        ],
+        "encoding": stored_encoding(encoding),
+    }
+
+
+def _parse_key(text: str) -> tuple[str, str]:
+    """Split a key such as "C Major" into (root, mode), defaulting to C major."""
+    root = "C"
+    mode = "major"
+    parts = text.split()
+    if len(parts) >= 1: root = parts[0]
+    if len(parts) >= 2: mode = parts[1].lower()
+    return root, mode
+
+
+def _import_frameworks() -> None:
+    for module in _WARM_IMPORTS:
+        importlib.import_module(module)
+    logger.info("Frameworks imported", device=detect_device())
+
+
+def _iter_blocks(audio: np.ndarray, block_size: int):
+    """Yield views of a flat sample buffer in fixed-size blocks."""
+    for start in range(0, len(audio), block_size):
+        yield audio[start:start + block_size]
 
 
 async def serve(port: int = 50051, preload: list[str] | None = None):
     """Start gRPC server."""
     from src.grpc_generated import worker_pb2_grpc
     
+    # Only the unary SeparateStems needs large messages; the streaming and
+    # upload variants work with any limit.
+    settings = get_settings()
+    max_message = settings.grpc_max_message_mb * 1024 * 1024
+    
     server = grpc.aio.server(
         futures.ThreadPoolExecutor(max_workers=4),
         options=[
-            ("grpc.max_send_message_length", 100 * 1024 * 1024),  # 100MB
-            ("grpc.max_receive_message_length", 100 * 1024 * 1024),
+            ("grpc.max_send_message_length", max_message),
+            ("grpc.max_receive_message_length", max_message),
         ],
     )
     
-    servicer = MusicWorkerServicer()
-    
-    if preload:
-        logger.info("Preloading models", models=preload)
-        servicer.preload_models(preload)
+    pool = None
+    if settings.worker_processes > 0:
+        pool = WorkerPool(settings.worker_processes)
+        pool.start()
+    servicer = MusicWorkerServicer(pool=pool)
     
     worker_pb2_grpc.add_MusicWorkerServicer_to_server(servicer, server)
     
     listen_addr = f"[::]:{port}"
     server.add_insecure_port(listen_addr)
+    if settings.uds_path:
+        # Co-located clients skip TCP; a socket left by an unclean exit would block the bind
+        if os.path.exists(settings.uds_path):
+            os.unlink(settings.uds_path)
+        server.add_insecure_port(f"unix:{settings.uds_path}")
+        logger.info("Listening on Unix socket", path=settings.uds_path)
     
-    logger.info("Starting gRPC server", address=listen_addr, device=detect_device())
+    logger.info("Starting gRPC server", address=listen_addr)
     
     await server.start()
-    await server.wait_for_termination()
+    warmup = asyncio.create_task(servicer.warm_up(preload))
+    await servicer.resume_jobs()
+    
+    if settings.metrics_port:
+        await start_http_server(settings.metrics_port)
+    try:
+        await server.wait_for_termination()
+    finally:
+        warmup.cancel()
+        servicer.shutdown()
 
 
 def main():
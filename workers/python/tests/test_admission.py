@@ -0,0 +1,72 @@
+"""Tests for admission control."""
+import asyncio
+
+import pytest
+
+from src.admission import AdmissionController, DeadlineError, Priority, QueueFullError
+
+
+async def _positions(ticket, timeout=None):
+    return [update async for update in ticket.wait(timeout)]
+
+
+@pytest.mark.asyncio
+async def test_waits_for_a_slot_and_reports_position():
+    controller = AdmissionController({"musicgen": 1})
+    running = controller.admit("musicgen")
+    queued = controller.admit("musicgen")
+    
+    waiter = asyncio.ensure_future(_positions(queued))
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+    
+    running.release()
+    
+    assert [p for p, _ in await waiter] == [1]
+    assert queued.admitted
+
+
+@pytest.mark.asyncio
+async def test_interactive_requests_are_admitted_before_batch():
+    controller = AdmissionController({"bark": 1})
+    running = controller.admit("bark")
+    batch = controller.admit("bark", Priority.BATCH)
+    interactive = controller.admit("bark", Priority.INTERACTIVE)
+    
+    assert interactive.position() == 1
+    assert batch.position() == 2
+    
+    running.release()
+    
+    assert interactive.admitted and not batch.admitted
+
+
+def test_full_queue_is_rejected_immediately():
+    controller = AdmissionController({"demucs": 1}, queue_size=1)
+    controller.admit("demucs")
+    controller.admit("demucs")
+    
+    with pytest.raises(QueueFullError):
+        controller.admit("demucs")
+    # Batch requests have their own bounded queue
+    controller.admit("demucs", Priority.BATCH)
+
+
+@pytest.mark.asyncio
+async def test_deadlines_are_enforced_before_and_while_queued():
+    controller = AdmissionController({"musicgen": 1})
+    first = controller.admit("musicgen", cost=10)
+    await asyncio.sleep(0.02)
+    first.release()  # learns ~2ms per unit of cost
+    
+    running = controller.admit("musicgen", cost=10)
+    with pytest.raises(DeadlineError):
+        controller.admit("musicgen", cost=1000, time_remaining=0.5)
+    
+    queued = controller.admit("musicgen", cost=1, time_remaining=5)
+    assert queued.estimated_wait() > 0
+    with pytest.raises(DeadlineError):
+        await _positions(queued, timeout=0.01)
+    
+    running.release()
+    assert controller.stats()["musicgen"] == {"running": 0, "waiting": 0}
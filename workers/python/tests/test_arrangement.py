@@ -0,0 +1,168 @@
+"""Tests for section-parallel arrangement rendering."""
+import numpy as np
+import pytest
+
+from benchmarks.stubs import StubBarkWrapper, StubDemucsWrapper, StubMusicGenWrapper
+from src.arrangement import SectionRender, Stitcher, plan_sections
+
+
+class CountingMusicGen(StubMusicGenWrapper):
+    """Records the size of every MusicGen batch."""
+    
+    def __init__(self):
+        super().__init__(cost=0.0)
+        self.batches = []
+    
+    def generate_batch(self, requests, *args, **kwargs):
+        self.batches.append(len(requests))
+        return super().generate_batch(requests, *args, **kwargs)
+
+
+def _section(name, start_bar, bars, energy=0.5, elements=("drums",)):
+    return {"name": name, "start_bar": start_bar, "duration_bars": bars,
+            "energy_level": energy, "elements": list(elements)}
+
+
+def test_repeated_sections_share_a_render():
+    plans = plan_sections([
+        _section("Chorus", 8, 4), _section("verse", 4, 4), _section("intro", 0, 4), _section("chorus", 12, 8),
+    ])
+    
+    assert [p.name for p in plans] == ["intro", "verse", "Chorus", "chorus"]
+    assert plans[2].render_key == plans[3].render_key
+    assert len({p.render_key for p in plans}) == 3
+
+
+async def _stitch(stitcher, render, seconds):
+    return [chunk async for chunk in stitcher.section(render, seconds)]
+
+
+@pytest.mark.asyncio
+async def test_sections_are_cut_on_bar_boundaries_and_crossfaded():
+    first, second = SectionRender(), SectionRender()
+    for render, value in ((first, 1.0), (second, 2.0)):
+        for _ in range(3):
+            render.append(np.full((1, 40), value, dtype=np.float32), 100)
+        render.finish()
+    stitcher = Stitcher(fade_seconds=0.1)
+    
+    out = await _stitch(stitcher, first, 1.0) + await _stitch(stitcher, second, 0.5)
+    audio = np.concatenate(out, axis=-1)[0]
+    
+    assert audio.shape == (150,)
+    np.testing.assert_array_equal(audio[:100], 1.0)
+    # Equal-power fade from the first render's tail into the second section
+    assert audio[100] == pytest.approx(1.0)
+    assert audio[109] == pytest.approx(2.0)
+    np.testing.assert_array_equal(audio[110:], 2.0)
+
+
+@pytest.mark.asyncio
+async def test_short_render_is_padded_to_its_bars():
+    render = SectionRender()
+    render.append(np.ones((2, 30), dtype=np.float32), 100)
+    render.finish()
+    
+    audio = np.concatenate(await _stitch(Stitcher(fade_seconds=0.1), render, 0.5), axis=-1)
+    
+    assert audio.shape == (2, 50)
+    np.testing.assert_array_equal(audio[:, 30:], 0.0)
+
+
+@pytest.mark.asyncio
+async def test_render_arrangement_batches_distinct_sections_and_streams_in_order():
+    from src.grpc_generated import worker_pb2
+    from src.server import MusicWorkerServicer
+    
+    musicgen = CountingMusicGen()
+    servicer = MusicWorkerServicer(
+        musicgen=musicgen, bark=StubBarkWrapper(0.0), demucs=StubDemucsWrapper(0.0)
+    )
+    admit, costs = servicer._admit, []
+    
+    async def recording_admit(model, priority, cost, context):
+        costs.append(cost)
+        return await admit(model, priority, cost, context)
+    
+    servicer._admit = recording_admit
+    
+    # 240 bpm in 4/4: one bar per second
+    request = worker_pb2.ArrangementRequest(
+        prompt="synthwave", tempo_bpm=240, sections=[
+            worker_pb2.Section(**_section("intro", 0, 4)),
+            worker_pb2.Section(**_section("chorus", 4, 4)),
+            worker_pb2.Section(**_section("verse", 8, 3)),
+            worker_pb2.Section(**_section("chorus", 11, 4)),
+        ],
+    )
+    
+    chunks = [c async for c in servicer.RenderArrangement(request, None)]
+    
+    # Three distinct sections padded to the longest in one batch; the
+    # second chorus is replayed
+    assert musicgen.batches == [3]
+    assert costs == [3 * 5]
+    names = [c.section_name for c in chunks]
+    assert [n for i, n in enumerate(names) if i == 0 or names[i - 1] != n] == [
+        "intro", "chorus", "verse", "chorus"
+    ]
+    samples = sum(len(c.audio_data) for c in chunks) // 4
+    assert samples == pytest.approx(15 * 44100, abs=2)
+    assert chunks[-1].is_final and chunks[-1].progress == 1.0
+    assert all(c.sample_rate == 44100 for c in chunks)
+
+
+@pytest.mark.asyncio
+async def test_render_arrangement_takes_about_as_long_as_its_longest_section():
+    import time
+    
+    from src.grpc_generated import worker_pb2
+    from src.server import MusicWorkerServicer
+    
+    servicer = MusicWorkerServicer(
+        musicgen=StubMusicGenWrapper(cost=0.1), bark=StubBarkWrapper(0.0), demucs=StubDemucsWrapper(0.0)
+    )
+    longest = worker_pb2.AudioRequest(prompt="synthwave", duration_seconds=5)
+    request = worker_pb2.ArrangementRequest(
+        prompt="synthwave", tempo_bpm=240, sections=[
+            worker_pb2.Section(**_section("intro", 0, 2)),
+            worker_pb2.Section(**_section("chorus", 2, 4)),
+            worker_pb2.Section(**_section("verse", 6, 3)),
+            worker_pb2.Section(**_section("chorus", 9, 4)),
+        ],
+    )
+    [c async for c in servicer.SynthesizeAudio(longest, None)]  # warm up
+    
+    started = time.monotonic()
+    [c async for c in servicer.SynthesizeAudio(longest, None)]
+    single = time.monotonic() - started
+    started = time.monotonic()
+    [c async for c in servicer.RenderArrangement(request, None)]
+    arrangement = time.monotonic() - started
+    
+    # Rendering the three sections one after another would take 3x
+    assert arrangement < 1.6 * single
+
+
+@pytest.mark.asyncio
+async def test_render_arrangement_rejects_songs_over_the_duration_limit():
+    import grpc
+    
+    from src.grpc_generated import worker_pb2
+    from src.server import MusicWorkerServicer
+    
+    musicgen = CountingMusicGen()
+    servicer = MusicWorkerServicer(
+        musicgen=musicgen, bark=StubBarkWrapper(0.0), demucs=StubDemucsWrapper(0.0)
+    )
+    # 304 one-second bars against the default 300s limit
+    request = worker_pb2.ArrangementRequest(
+        prompt="synthwave", tempo_bpm=240, sections=[
+            worker_pb2.Section(**_section("intro", 0, 4)),
+            worker_pb2.Section(**_section("verse", 4, 300)),
+        ],
+    )
+    
+    with pytest.raises(grpc.aio.AbortError, match="INVALID_ARGUMENT"):
+        [c async for c in servicer.RenderArrangement(request, None)]
+    assert musicgen.batches == []
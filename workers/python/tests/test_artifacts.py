@@ -0,0 +1,159 @@
+"""Tests for the memory-mapped artifact store."""
+import os
+import time
+
+import grpc
+import numpy as np
+import pytest
+import soundfile as sf
+
+from benchmarks.stubs import StubBarkWrapper, StubDemucsWrapper, StubMusicGenWrapper
+from src.artifacts import ArtifactFormat, ArtifactStore, sample_dtype
+from src.audio_codec import AudioEncoding
+from src.grpc_generated import worker_pb2
+from src.server import MusicWorkerServicer
+
+
+def _stereo(samples):
+    rng = np.random.default_rng(0)
+    return rng.uniform(-0.5, 0.5, (2, samples)).astype(np.float32)
+
+
+@pytest.mark.parametrize("encoding", [AudioEncoding.FLOAT32, AudioEncoding.PCM16])
+def test_artifact_layouts_hold_interleaved_frames(tmp_path, encoding):
+    store = ArtifactStore(str(tmp_path))
+    audio = _stereo(1000)
+    tolerance = 0 if encoding == AudioEncoding.FLOAT32 else 1 / 32767
+    
+    for format in (ArtifactFormat.RAW, ArtifactFormat.NPY, ArtifactFormat.WAV):
+        writer = store.create(format, sample_dtype(encoding), 48000)
+        first = writer.write(audio[:, :600])
+        offset, length = writer.write(audio[:, 600:], final=True)
+        assert offset == first[0] + first[1]
+        
+        # Each write's region holds exactly its own frames
+        tail = np.fromfile(writer.path, dtype=writer.dtype, count=length // writer.dtype.itemsize, offset=offset)
+        expected = audio[:, 600:].T.ravel()
+        if encoding == AudioEncoding.PCM16:
+            tail = tail / 32767
+        np.testing.assert_allclose(tail, expected, atol=tolerance)
+        
+        if format == ArtifactFormat.NPY:
+            frames = np.load(writer.path, mmap_mode="r")
+            assert frames.shape == (1000, 2)
+        elif format == ArtifactFormat.WAV:
+            frames, rate = sf.read(writer.path, dtype="float32")
+            assert rate == 48000
+            # soundfile scales 16-bit PCM by 1/32768
+            np.testing.assert_allclose(frames, audio.T, atol=2 * tolerance + 1e-6)
+
+
+def test_artifacts_are_reference_counted_and_expire(tmp_path):
+    store = ArtifactStore(str(tmp_path), ttl_seconds=60)
+    kept = store.create(ArtifactFormat.RAW, np.dtype("<f4"), 32000)
+    kept.write(_stereo(100), final=True)
+    stale = store.create(ArtifactFormat.NPY, np.dtype("<f4"), 32000)
+    stale.write(_stereo(100), final=True)
+    
+    assert store.retain(kept.id)[0] == 2
+    assert store.release(kept.id)[0] == 1
+    assert os.path.exists(kept.path)
+    assert store.release(kept.id)[0] == 0
+    assert not os.path.exists(kept.path)
+    assert store.release(kept.id) is None
+    
+    # A restarted store adopts leftover files and still expires them
+    restarted = ArtifactStore(str(tmp_path), ttl_seconds=60)
+    assert restarted.stats() == {"artifacts": 1, "references": 1}
+    assert restarted.collect(now=os.stat(stale.path).st_mtime + 61) == 1
+    assert not os.path.exists(stale.path)
+
+
+def test_artifacts_being_written_do_not_expire(tmp_path):
+    store = ArtifactStore(str(tmp_path), ttl_seconds=60)
+    writer = store.create(ArtifactFormat.RAW, np.dtype("<f4"), 32000)
+    writer.write(_stereo(100))
+    
+    assert store.collect(now=time.time() + 3600) == 0
+    writer.write(_stereo(100), final=True)
+    assert os.path.getsize(writer.path) == 2 * 100 * 2 * 4
+    
+    # The lifetime starts once the artifact is finished
+    assert store.collect(now=time.time() + 30) == 0
+    assert store.collect(now=time.time() + 61) == 1
+
+
+def _servicer(artifact_dir):
+    servicer = MusicWorkerServicer(
+        musicgen=StubMusicGenWrapper(0.0), bark=StubBarkWrapper(0.0), demucs=StubDemucsWrapper(0.0)
+    )
+    servicer._artifacts = ArtifactStore(str(artifact_dir))
+    return servicer
+
+
+@pytest.mark.asyncio
+async def test_audio_stream_returns_artifact_handles(tmp_path):
+    servicer = _servicer(tmp_path)
+    request = worker_pb2.AudioRequest(
+        prompt="lofi beat", duration_seconds=4, artifact_format=worker_pb2.ARTIFACT_NPY
+    )
+    
+    chunks = [c async for c in servicer.SynthesizeAudio(request, None)]
+    handles = [c.artifact for c in chunks]
+    
+    assert all(not c.audio_data for c in chunks)
+    assert len({h.artifact_id for h in handles}) == 1
+    assert handles[-1].complete and chunks[-1].is_final
+    assert [h.offset for h in handles[1:]] == [h.offset + h.length for h in handles[:-1]]
+    
+    frames = np.load(handles[0].path)
+    assert frames.shape == (sum(h.length for h in handles) // 4, 1)
+    assert frames.shape[0] == pytest.approx(4 * chunks[0].sample_rate, rel=0.01)
+    
+    status = await servicer.ReleaseArtifact(worker_pb2.ArtifactRequest(artifact_id=handles[0].artifact_id), None)
+    assert status.references == 0
+    assert not os.path.exists(handles[0].path)
+
+
+@pytest.mark.asyncio
+async def test_stem_stream_returns_one_artifact_per_stem(tmp_path):
+    servicer = _servicer(tmp_path)
+    request = worker_pb2.StemRequest(
+        audio_data=_stereo(44100).T.tobytes(), sample_rate=44100, channels=2,
+        encoding=worker_pb2.PCM16, artifact_format=worker_pb2.ARTIFACT_WAV,
+    )
+    
+    chunks = [c async for c in servicer.SeparateStemsStream(request, None)]
+    
+    final = chunks[-1].artifacts
+    assert sorted(h.name for h in final) == ["bass", "drums", "other", "vocals"]
+    assert all(h.complete and h.dtype == "<i2" for h in final)
+    assert not chunks[-1].drums
+    assert all(c.encoding == worker_pb2.PCM16 for c in chunks)
+    for handle in final:
+        frames, rate = sf.read(handle.path)
+        assert rate == handle.sample_rate
+        assert frames.shape == (44100 * rate // 44100, 2)
+
+
+@pytest.mark.asyncio
+async def test_artifact_requests_need_an_artifact_directory(tmp_path):
+    servicer = _servicer(tmp_path)
+    servicer._artifacts = ArtifactStore(None)
+    request = worker_pb2.AudioRequest(prompt="lofi beat", duration_seconds=4, artifact_format=worker_pb2.ARTIFACT_RAW)
+    
+    with pytest.raises(grpc.aio.AbortError, match="FAILED_PRECONDITION"):
+        [c async for c in servicer.SynthesizeAudio(request, None)]
+
+
+@pytest.mark.asyncio
+async def test_flac_requests_report_the_stored_encoding(tmp_path):
+    servicer = _servicer(tmp_path)
+    request = worker_pb2.AudioRequest(
+        prompt="lofi beat", duration_seconds=2, encoding=worker_pb2.FLAC,
+        artifact_format=worker_pb2.ARTIFACT_RAW,
+    )
+    
+    chunks = [c async for c in servicer.SynthesizeAudio(request, None)]
+    
+    assert all(c.encoding == worker_pb2.PCM16 and c.artifact.dtype == "<i2" for c in chunks)
@@ -0,0 +1,62 @@
+"""Tests for audio wire encodings."""
+import numpy as np
+import pytest
+
+from src.audio_buffer import StagingBuffers, as_float32, byte_view, to_host
+from src.audio_codec import AudioEncoding, decode_audio, encode_audio, encode_stems
+
+
+@pytest.fixture
+def stereo():
+    t = np.linspace(0, 1, 4800, dtype=np.float32)
+    return np.stack([np.sin(2 * np.pi * 440 * t), 0.5 * np.cos(2 * np.pi * 220 * t)])
+
+
+def test_float32_is_lossless(stereo):
+    data = encode_audio(stereo, 48000, AudioEncoding.FLOAT32)
+    
+    assert len(data) == stereo.size * 4
+    np.testing.assert_array_equal(decode_audio(data, AudioEncoding.FLOAT32, 2), stereo)
+
+
+def test_pcm16_halves_payload(stereo):
+    data = encode_audio(stereo, 48000, AudioEncoding.PCM16)
+    
+    assert len(data) == stereo.size * 2
+    np.testing.assert_allclose(decode_audio(data, AudioEncoding.PCM16, 2), stereo, atol=1e-4)
+
+
+def test_flac_roundtrip_is_smaller(stereo):
+    pytest.importorskip("soundfile")
+    data = encode_audio(stereo, 48000, AudioEncoding.FLAC)
+    
+    assert data[:4] == b"fLaC"
+    assert len(data) < stereo.size * 2
+    np.testing.assert_allclose(decode_audio(data, AudioEncoding.FLAC, 2), stereo, atol=1e-4)
+
+
+def test_encode_stems_fills_missing_stems(stereo):
+    encoded = encode_stems({"drums": stereo}, 44100, AudioEncoding.PCM16)
+    
+    assert set(encoded) == {"drums", "bass", "vocals", "other"}
+    assert len(encoded["drums"]) == stereo.size * 2
+    assert encoded["bass"] == b""
+
+
+def test_float32_conversions_share_memory(stereo):
+    import torch
+    
+    host = to_host(torch.from_numpy(stereo))
+    
+    assert np.shares_memory(host, stereo)
+    assert as_float32(host) is host
+    assert np.shares_memory(np.frombuffer(byte_view(host), np.float32), stereo)
+
+
+def test_staging_buffers_are_reused_per_thread():
+    staging = StagingBuffers()
+    first = staging.get("pcm", (2, 100), np.int16)
+    smaller = staging.get("pcm", (2, 50), np.int16)
+    
+    assert smaller.shape == (2, 50)
+    assert np.shares_memory(first, smaller)
@@ -0,0 +1,51 @@
+"""Tests for the CPU inference backends."""
+import torch
+from torch import nn
+
+from src.components.backends import apply_backend, inference_context, resolve_backend
+from src.config import InferenceBackend
+
+
+def _model() -> nn.Module:
+    torch.manual_seed(0)
+    return nn.Sequential(nn.Linear(16, 32), nn.ReLU(), nn.Linear(32, 4)).eval()
+
+
+def test_unsupported_backends_fall_back_to_eager():
+    assert resolve_backend(InferenceBackend.INT8, "cuda") == InferenceBackend.EAGER
+    assert resolve_backend(InferenceBackend.BF16, "mps") == InferenceBackend.EAGER
+    assert resolve_backend(InferenceBackend.INT8, "cpu") == InferenceBackend.INT8
+
+
+def test_int8_quantizes_linear_layers_in_place():
+    model = _model()
+    x = torch.randn(8, 16)
+    with torch.no_grad():
+        expected = model(x)
+        
+        apply_backend(model, InferenceBackend.INT8)
+        actual = model(x)
+    
+    assert not any(type(m) is nn.Linear for m in model.modules())
+    assert torch.allclose(actual, expected, atol=0.05)
+
+
+def test_compiled_wraps_forward_lazily():
+    model = _model()
+    forward = model.forward
+    
+    apply_backend(model, InferenceBackend.COMPILED)
+    
+    assert model.forward is not forward
+
+
+def test_bf16_context_autocasts_matmuls():
+    model = _model()
+    
+    with torch.no_grad(), inference_context(InferenceBackend.BF16, "cpu"):
+        out = model(torch.randn(2, 16))
+    with inference_context(InferenceBackend.EAGER, "cpu"):
+        eager = model(torch.randn(2, 16))
+    
+    assert out.dtype == torch.bfloat16
+    assert eager.dtype == torch.float32
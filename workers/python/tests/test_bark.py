@@ -0,0 +1,107 @@
+"""Tests for BarkWrapper segment synthesis."""
+import sys
+import threading
+import time
+import types
+
+import numpy as np
+import pytest
+
+from src.components.bark import BarkWrapper
+
+
+class FakeBark(BarkWrapper):
+    """Bark wrapper whose segments take a per-sentence delay."""
+    
+    sample_rate = 100
+    
+    def __init__(self, delays: dict[str, float]):
+        super().__init__()
+        self._loaded = True
+        self._delays = delays
+        self._lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+    
+    def _generate_segment(self, sentence, voice_preset, seed=None, cancel=None):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self._delays.get(sentence, 0.01))
+        with self._lock:
+            self.active -= 1
+        return np.full(10, len(sentence), dtype=np.float32)
+
+
+@pytest.fixture
+def sentences(monkeypatch):
+    monkeypatch.setattr(BarkWrapper, "_split_sentences", lambda self, text: text.split("|"))
+    return ["slow one", "fast", "medium.."]
+
+
+def test_segments_run_concurrently_but_yield_in_order(sentences):
+    bark = FakeBark({"slow one": 0.2, "fast": 0.01, "medium..": 0.05})
+    
+    chunks = list(bark.synthesize("|".join(sentences)))
+    
+    assert [c[0][0] for c in chunks] == [len(s) for s in sentences]
+    assert [c[2] for c in chunks] == pytest.approx([1 / 3, 2 / 3, 1.0])
+    assert bark.max_active > 1
+
+
+def test_first_segment_streams_before_the_rest_finish(sentences):
+    bark = FakeBark({"slow one": 0.01, "fast": 0.3, "medium..": 0.3})
+    
+    started = time.monotonic()
+    gen = bark.synthesize("|".join(sentences))
+    next(gen)
+    first = time.monotonic() - started
+    gen.close()
+    
+    assert first < 0.2
+
+
+@pytest.fixture
+def bark_generation(monkeypatch):
+    """Stand-in ``bark.generation`` module that counts stage calls."""
+    calls = {"prompt": 0, "semantic": 0, "coarse": 0, "fine": 0}
+    module = types.ModuleType("bark.generation")
+    module.stage_kwargs = {}
+    
+    def counted(stage, result):
+        def fn(*args, **kwargs):
+            calls[stage] += 1
+            module.stage_kwargs[stage] = kwargs
+            return result(*args)
+        return fn
+    
+    module._load_history_prompt = counted("prompt", lambda preset: {"preset": preset})
+    module.generate_text_semantic = counted("semantic", lambda text: np.array([len(text)]))
+    module.generate_coarse = counted("coarse", lambda semantic: semantic * 2)
+    module.generate_fine = counted("fine", lambda coarse: coarse * 3)
+    module.codec_decode = lambda fine: fine.astype(np.float32)
+    monkeypatch.setitem(sys.modules, "bark", types.ModuleType("bark"))
+    monkeypatch.setitem(sys.modules, "bark.generation", module)
+    return calls
+
+
+def test_repeated_lines_skip_semantic_and_coarse_stages(bark_generation):
+    bark = BarkWrapper()
+    
+    first = bark._generate_segment("la la chorus", "v2/en_speaker_9")
+    again = bark._generate_segment("la la chorus", "v2/en_speaker_9")
+    bark._generate_segment("la la chorus", "v2/en_speaker_9", seed=7)
+    
+    np.testing.assert_array_equal(first, again)
+    assert bark_generation == {"prompt": 1, "semantic": 2, "coarse": 2, "fine": 3}
+    stats = bark.cache_stats()
+    assert stats["bark_coarse"] == {"hits": 1, "misses": 2, "entries": 2}
+    assert stats["bark_voice_prompt"]["hits"] == 2
+
+
+def test_autoregressive_stages_use_the_kv_cache(bark_generation):
+    BarkWrapper()._generate_segment("la la chorus", "v2/en_speaker_9")
+    
+    stage_kwargs = sys.modules["bark.generation"].stage_kwargs
+    assert stage_kwargs["semantic"]["use_kv_caching"] is True
+    assert stage_kwargs["coarse"]["use_kv_caching"] is True
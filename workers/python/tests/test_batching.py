@@ -0,0 +1,103 @@
+"""Tests for the MusicGen micro-batching scheduler."""
+import asyncio
+
+import numpy as np
+import pytest
+import torch
+
+from src.batching import MusicGenBatcher
+from src.components.musicgen import MusicGenWrapper
+from src.inference import InferenceExecutor
+
+
+class BatchedFakeMusicGen:
+    """Stub model whose output encodes each description's length."""
+    
+    sample_rate = 10
+    
+    def __init__(self):
+        self.duration = 0
+        self.batches = []
+    
+    def set_generation_params(self, duration, **kwargs):
+        self.duration = duration
+    
+    def generate(self, descriptions, progress=False):
+        self.batches.append(list(descriptions))
+        n = int(self.duration * self.sample_rate)
+        values = torch.tensor([float(len(d)) for d in descriptions])
+        return values.reshape(-1, 1, 1).expand(-1, 1, n).clone()
+    
+    def generate_continuation(self, prompt, prompt_sample_rate, descriptions, progress=False):
+        n = int(self.duration * self.sample_rate) - prompt.shape[-1]
+        new = prompt[..., -1:].expand(-1, -1, n)
+        return torch.cat([prompt, new], dim=-1)
+
+
+@pytest.fixture
+def model():
+    return BatchedFakeMusicGen()
+
+
+@pytest.fixture
+def batcher(model):
+    wrapper = MusicGenWrapper()
+    wrapper._model = model
+    wrapper._loaded = True
+    executor = InferenceExecutor()
+    yield MusicGenBatcher(wrapper.generate_batch, executor, window_ms=20, max_batch_size=4)
+    executor.shutdown()
+
+
+async def _collect(batcher, prompt, duration):
+    return [chunk async for chunk in batcher.generate(prompt, duration_seconds=duration)]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_forward_pass(batcher, model):
+    """Requests inside the window with the same duration are batched together."""
+    results = await asyncio.gather(
+        _collect(batcher, "a", 5),
+        _collect(batcher, "bb", 5),
+        _collect(batcher, "ccc", 5),
+    )
+    
+    assert len(model.batches) == 1
+    assert len(model.batches[0]) == 3
+    
+    # Each caller gets back only its own item
+    for expected, chunks in zip([1.0, 2.0, 3.0], results):
+        audio = np.concatenate([c[0] for c in chunks], axis=-1)
+        assert audio.shape == (1, 50)
+        assert np.all(audio == expected)
+
+
+@pytest.mark.asyncio
+async def test_different_durations_are_not_batched(batcher, model):
+    """Requests are grouped by duration."""
+    await asyncio.gather(_collect(batcher, "a", 5), _collect(batcher, "b", 8))
+    
+    assert sorted(len(b) for b in model.batches) == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_full_batch_flushes_immediately(batcher, model):
+    """Hitting max_batch_size starts the batch without waiting for the window."""
+    prompts = ["p1", "p2", "p3", "p4", "p5"]
+    await asyncio.gather(*[_collect(batcher, p, 5) for p in prompts])
+    
+    assert [len(b) for b in model.batches] == [4, 1]
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_propagates_to_every_caller(batcher, model):
+    """A failing forward pass raises in each waiting stream."""
+    def boom(descriptions, progress=False):
+        raise RuntimeError("out of memory")
+    model.generate = boom
+    
+    results = await asyncio.gather(
+        _collect(batcher, "a", 5), _collect(batcher, "b", 5), return_exceptions=True
+    )
+    
+    assert all(isinstance(r, RuntimeError) for r in results)
@@ -0,0 +1,54 @@
+"""Smoke tests for the serving benchmark harness."""
+import pytest
+
+from benchmarks import bench_audio_path, bench_backends, bench_midi
+from benchmarks.bench_startup import measure_import
+from benchmarks.bench_worker import BenchmarkConfig, run_benchmark
+from src.config import InferenceBackend
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("rpc", ["audio", "vocals", "stems", "arrangement", "theory"])
+async def test_benchmark_reports_metrics(rpc):
+    """Each RPC can be driven end to end over a local channel with stub models."""
+    config = BenchmarkConfig(rpc=rpc, requests=2, concurrency=2, duration_seconds=3, cost=0.0)
+    
+    results = await run_benchmark(config)
+    
+    assert results["throughput_rps"] > 0
+    assert results["latency_seconds"]["p99"] >= results["latency_seconds"]["p50"]
+    assert results["time_to_first_chunk_seconds"]["p50"] > 0
+    assert results["bytes_on_wire"] > 0
+    assert results["peak_rss_mb"] > 0
+
+
+def test_server_import_does_not_pull_in_model_frameworks():
+    """Importing the server stays cheap; torch and music21 load during warmup."""
+    results = measure_import(runs=1)
+    
+    assert results["heavy_modules_imported"] == []
+
+
+def test_midi_writer_stays_under_a_millisecond_per_bar():
+    results = bench_midi.run_benchmark(bars=32, iterations=20)
+    
+    assert results["bytes"] > 0
+    assert results["us_per_bar"] < 1000
+
+
+def test_audio_path_allocates_once_per_encoding_step():
+    results = bench_audio_path.run_benchmark(seconds=1.0, iterations=3)
+    
+    for encoding in results["encodings"].values():
+        assert encoding["allocations_per_chunk"] <= 2
+        assert encoding["allocations_per_chunk"] < encoding["legacy_allocations_per_chunk"]
+
+
+def test_backend_benchmark_compares_against_eager():
+    backends = [InferenceBackend.EAGER, InferenceBackend.INT8]
+    results = bench_backends.run_benchmark("tiny", seconds=1.0, iterations=1, backends=backends)
+    
+    eager, int8 = results["backends"]["eager"], results["backends"]["int8"]
+    assert eager["top1_agreement"] == 1.0
+    assert int8["realtime_factor"] > 0
+    assert int8["top1_agreement"] > 0.8
@@ -0,0 +1,77 @@
+"""Tests for the content-addressed result cache."""
+import pytest
+
+from src.cache import ResultCache, make_key, normalize_text
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache(str(tmp_path), max_bytes=1024, ttl_seconds=60)
+
+
+def test_make_key_is_stable_and_content_addressed():
+    """Equal requests hash equally; any field or payload change alters the key."""
+    params = {"prompt": normalize_text("  warm   pad "), "duration": 10}
+    
+    assert make_key("audio", params) == make_key("audio", {"duration": 10, "prompt": "warm pad"})
+    assert make_key("audio", params) != make_key("vocals", params)
+    assert make_key("stems", params, b"a") != make_key("stems", params, b"b")
+
+
+def test_roundtrip_and_counters(cache):
+    """Stored message streams replay in order and hits/misses are counted."""
+    assert cache.get("k") is None
+    
+    cache.put("k", [b"first", b"", b"third"])
+    
+    assert cache.get("k") == [b"first", b"", b"third"]
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+
+
+def test_lru_eviction_by_size(cache):
+    """Least recently used entries are evicted once over the byte budget."""
+    cache.put("a", [b"x" * 400])
+    cache.put("b", [b"x" * 400])
+    cache.get("a")  # a is now most recently used
+    cache.put("c", [b"x" * 400])
+    
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expiry(tmp_path):
+    """Entries older than the TTL are treated as misses."""
+    cache = ResultCache(str(tmp_path), ttl_seconds=0)
+    cache.put("k", [b"data"])
+    
+    assert cache.get("k") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_aborted_writer_leaves_no_entry(cache):
+    """Partially produced streams are never published."""
+    writer = cache.writer("k")
+    writer.append(b"partial")
+    writer.abort()
+    
+    assert cache.get("k") is None
+
+
+def test_index_survives_restart(tmp_path):
+    """A new cache instance picks up entries written by a previous one."""
+    ResultCache(str(tmp_path)).put("k", [b"data"])
+    
+    assert ResultCache(str(tmp_path)).get("k") == [b"data"]
+
+
+def test_disabled_cache_never_hits():
+    """A cache without a directory is a no-op."""
+    cache = ResultCache(None)
+    cache.put("k", [b"data"])
+    
+    assert not cache.enabled
+    assert cache.get("k") is None
@@ -0,0 +1,77 @@
+"""Tests for cooperative cancellation of model work."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from benchmarks.stubs import StubMusicGenWrapper
+from src.batching import MusicGenBatcher
+from src.cancellation import CancelToken, RequestCancelledError
+from src.inference import InferenceExecutor
+
+
+def test_token_runs_callbacks_once():
+    calls = []
+    token = CancelToken()
+    token.add_callback(lambda: calls.append("early"))
+    
+    token.cancel()
+    token.cancel()
+    token.add_callback(lambda: calls.append("late"))
+    
+    assert token.cancelled
+    assert calls == ["early", "late"]
+
+
+def test_musicgen_stops_between_decoding_steps():
+    """Cancelling mid-window stops at the next step, not the end of the window."""
+    wrapper = StubMusicGenWrapper(cost=0.1)  # 1s per 10s window
+    wrapper.load()
+    cancel = CancelToken()
+    threading.Timer(0.1, cancel.cancel).start()
+    
+    started = time.monotonic()
+    with pytest.raises(RequestCancelledError):
+        list(wrapper.generate("lofi", duration_seconds=30, cancel=cancel))
+    
+    assert time.monotonic() - started < 0.5
+
+
+@pytest.fixture
+def slow_batcher():
+    wrapper = StubMusicGenWrapper(cost=0.05)
+    wrapper.load()
+    executor = InferenceExecutor()
+    yield MusicGenBatcher(wrapper.generate_batch, executor, window_ms=20, max_batch_size=4)
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_batch_continues_while_any_caller_remains(slow_batcher):
+    async def leave_after_first(prompt):
+        stream = slow_batcher.generate(prompt, duration_seconds=25)
+        chunk = await stream.__anext__()
+        await stream.aclose()
+        return [chunk]
+    
+    async def read_all(prompt):
+        return [c async for c in slow_batcher.generate(prompt, duration_seconds=25)]
+    
+    left, stayed = await asyncio.gather(leave_after_first("a"), read_all("b"))
+    
+    assert len(left) == 1
+    assert [p for _, _, p in stayed] == pytest.approx([0.4, 0.8, 1.0])
+
+
+@pytest.mark.asyncio
+async def test_batch_is_cancelled_once_every_caller_leaves(slow_batcher):
+    stream = slow_batcher.generate("a", duration_seconds=30)
+    await stream.__anext__()
+    
+    started = time.monotonic()
+    await stream.aclose()
+    await asyncio.wait_for(asyncio.gather(*slow_batcher._tasks), timeout=5)
+    
+    # The remaining 20s of audio would take about a second to generate
+    assert time.monotonic() - started < 0.3
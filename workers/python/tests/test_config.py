@@ -2,7 +2,7 @@
 import os
 import pytest
 
-from src.config import Settings, DeviceType, MusicGenModelSize, get_settings
+from src.config import Settings, DeviceType, InferenceBackend, MusicGenModelSize, get_settings
 
 
 def test_settings_defaults():
@@ -21,12 +21,14 @@ def test_settings_from_env(monkeypatch):
     monkeypatch.setenv("MUSICFORGE_GRPC_PORT", "8080")
     monkeypatch.setenv("MUSICFORGE_DEVICE", "cuda")
     monkeypatch.setenv("MUSICFORGE_MUSICGEN_MODEL_SIZE", "medium")
+    monkeypatch.setenv("MUSICFORGE_INFERENCE_BACKEND", "INT8")
     
     settings = Settings.from_env()
     
     assert settings.grpc_port == 8080
     assert settings.device == DeviceType.CUDA
     assert settings.musicgen_model_size == MusicGenModelSize.MEDIUM
+    assert settings.inference_backend == InferenceBackend.INT8
 
 
 def test_device_type_enum():
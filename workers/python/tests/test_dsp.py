@@ -0,0 +1,75 @@
+"""Tests for streaming audio post-processing."""
+import numpy as np
+import pytest
+from scipy.signal import resample_poly
+
+from src.dsp import (
+    LoudnessNormalizer, Resampler, SeamCrossfader, StreamProcessor, _filter_bank,
+    equal_power_crossfade,
+)
+
+
+def _tone(seconds: float, sample_rate: int, amplitude: float, channels: int = 1) -> np.ndarray:
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    tone = (amplitude * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+    return np.repeat(tone[np.newaxis, :], channels, axis=0)
+
+
+@pytest.mark.parametrize("source_rate, target_rate", [(32000, 44100), (24000, 44100), (48000, 44100)])
+def test_chunked_resampling_matches_whole_signal(source_rate, target_rate):
+    audio = np.random.default_rng(0).standard_normal((2, source_rate)).astype(np.float32) * 0.1
+    resampler = Resampler(source_rate, target_rate, channels=2)
+    
+    cuts = [0, 1000, 1001, 9000, source_rate]
+    out = np.concatenate([
+        resampler.process(audio[:, a:b], final=(b == source_rate)) for a, b in zip(cuts, cuts[1:])
+    ], axis=-1)
+    
+    expected = resample_poly(audio, resampler.up, resampler.down, axis=-1)
+    np.testing.assert_allclose(out, expected, atol=1e-6)
+    assert _filter_bank(resampler.up, resampler.down)[0] is resampler._bank
+
+
+def test_loudness_converges_to_target_under_peak_ceiling():
+    normalizer = LoudnessNormalizer(44100, channels=1, target_lufs=-14.0)
+    audio = _tone(8, 44100, amplitude=0.05)
+    
+    out = [normalizer.process(chunk) for chunk in np.split(audio[0], 8)]
+    
+    settled = LoudnessNormalizer(44100, channels=1)
+    settled.process(np.concatenate(out[2:]))
+    assert settled.loudness() == pytest.approx(-14.0, abs=0.1)
+    assert max(np.abs(chunk).max() for chunk in out) <= 0.99
+
+
+def test_equal_power_crossfade_keeps_uncorrelated_level():
+    rng = np.random.default_rng(0)
+    tail, head = rng.standard_normal((2, 48000)).astype(np.float32)
+    
+    faded = equal_power_crossfade(tail, head)
+    
+    middle = faded[20000:28000]
+    assert np.sqrt(np.mean(middle ** 2)) == pytest.approx(1.0, abs=0.05)
+
+
+def test_seams_overlap_and_final_chunk_releases_the_tail():
+    crossfader = SeamCrossfader(length=10)
+    chunks = [np.ones(100, dtype=np.float32), np.ones(100, dtype=np.float32)]
+    
+    first = crossfader.process(chunks[0])
+    last = crossfader.process(chunks[1], final=True)
+    
+    assert len(first) == 90
+    assert len(last) == 100  # 10 faded, then the rest of the second chunk
+
+
+def test_stream_processor_flushes_held_audio():
+    post = StreamProcessor(44100, seam_fade_ms=10)
+    audio = _tone(1, 24000, amplitude=0.1)
+    
+    emitted = post.process(audio, 24000)
+    tail = post.flush()
+    
+    assert emitted.shape[0] == 1
+    assert emitted.shape[-1] + tail.shape[-1] == 44100
+    assert post.flush() is None
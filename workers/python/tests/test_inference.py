@@ -0,0 +1,69 @@
+"""Tests for the inference execution layer."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.inference import InferenceExecutor
+
+
+@pytest.fixture
+def executor():
+    executor = InferenceExecutor(max_workers=1)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_executes_off_event_loop(executor):
+    """Blocking calls run on a named per-model worker thread."""
+    name = await executor.run("demucs", lambda: threading.current_thread().name)
+    
+    assert name.startswith("demucs-inference")
+    assert name != threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_iterate_preserves_order(executor):
+    """Sync generators are bridged into async iterators in order."""
+    def gen(n):
+        for i in range(n):
+            yield i
+    
+    items = [i async for i in executor.iterate("bark", gen, 5)]
+    
+    assert items == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_event_loop_stays_responsive_during_inference(executor):
+    """Other coroutines keep running while a blocking model call is in flight."""
+    ticks = []
+    
+    async def heartbeat():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+    
+    started = time.monotonic()
+    await asyncio.gather(
+        executor.run("musicgen", time.sleep, 0.2),
+        heartbeat(),
+    )
+    
+    assert len(ticks) == 5
+    assert ticks[-1] - started < 0.2
+
+
+@pytest.mark.asyncio
+async def test_models_use_separate_pools(executor):
+    """A busy model pool does not block another model's work."""
+    release = threading.Event()
+    busy = asyncio.ensure_future(executor.run("demucs", release.wait, 5))
+    
+    result = await asyncio.wait_for(executor.run("musicgen", lambda: "done"), timeout=1)
+    release.set()
+    await busy
+    
+    assert result == "done"
@@ -0,0 +1,110 @@
+"""Tests for durable jobs."""
+import grpc
+import pytest
+
+from benchmarks.stubs import StubBarkWrapper, StubDemucsWrapper, StubMusicGenWrapper
+from src.grpc_generated import worker_pb2
+from src.jobs import JobState, JobStore
+from src.server import MusicWorkerServicer
+
+
+def _servicer(job_dir, musicgen_cost=0.0):
+    servicer = MusicWorkerServicer(
+        musicgen=StubMusicGenWrapper(musicgen_cost), bark=StubBarkWrapper(0.0), demucs=StubDemucsWrapper(0.0)
+    )
+    servicer._jobs = servicer._job_manager(JobStore(str(job_dir)))
+    return servicer
+
+
+def _audio_job(job_id="", duration=4):
+    return worker_pb2.SubmitJobRequest(
+        job_id=job_id, audio=worker_pb2.AudioRequest(prompt="lofi beat", duration_seconds=duration)
+    )
+
+
+async def _results(servicer, job_id, offset=0):
+    request = worker_pb2.StreamJobRequest(job_id=job_id, offset=offset)
+    return [chunk async for chunk in servicer.StreamJobResult(request, None)]
+
+
+@pytest.mark.asyncio
+async def test_job_results_stream_and_resume_from_offset(tmp_path):
+    servicer = _servicer(tmp_path)
+    
+    status = await servicer.SubmitJob(_audio_job("song-1"), None)
+    assert status.job_id == "song-1"
+    assert status.kind == "audio"
+    
+    chunks = await _results(servicer, "song-1")
+    assert [c.index for c in chunks] == list(range(len(chunks)))
+    assert chunks[-1].audio.is_final
+    
+    resumed = await _results(servicer, "song-1", offset=2)
+    assert [c.index for c in resumed] == [c.index for c in chunks[2:]]
+    assert [c.audio.audio_data for c in resumed] == [c.audio.audio_data for c in chunks[2:]]
+    
+    status = await servicer.GetJobStatus(worker_pb2.JobRequest(job_id="song-1"), None)
+    assert status.state == worker_pb2.JOB_SUCCEEDED
+    assert status.chunks_available == len(chunks)
+    assert status.progress == pytest.approx(1.0)
+    
+    # Resubmitting the same id returns the finished job instead of rerunning it
+    again = await servicer.SubmitJob(_audio_job("song-1"), None)
+    assert again.state == worker_pb2.JOB_SUCCEEDED
+    assert again.created_at == status.created_at
+    servicer.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_job_keeps_its_results(tmp_path):
+    servicer = _servicer(tmp_path, musicgen_cost=0.5)
+    status = await servicer.SubmitJob(_audio_job(duration=60), None)
+    
+    stream = servicer.StreamJobResult(worker_pb2.StreamJobRequest(job_id=status.job_id), None)
+    first = await stream.__anext__()
+    assert first.index == 0
+    
+    cancelled = await servicer.CancelJob(worker_pb2.JobRequest(job_id=status.job_id), None)
+    assert cancelled.state == worker_pb2.JOB_CANCELLED
+    assert cancelled.chunks_available >= 1
+    
+    with pytest.raises(grpc.aio.AbortError, match="CANCELLED"):
+        async for _ in stream:
+            pass
+    servicer.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_running_jobs_are_requeued_after_a_restart(tmp_path):
+    store = JobStore(str(tmp_path))
+    request = _audio_job().audio.SerializeToString()
+    store.create("interrupted", "audio", request)
+    store.set_state("interrupted", JobState.RUNNING)
+    store.append("interrupted", b"partial", 0.1)
+    store.create("waiting", "audio", request)
+    store.close()
+    
+    servicer = _servicer(tmp_path)
+    await servicer.resume_jobs()
+    
+    for job_id, attempt in (("interrupted", 1), ("waiting", 0)):
+        chunks = await _results(servicer, job_id)
+        assert chunks[-1].audio.is_final
+        assert all(c.audio.audio_data != b"partial" for c in chunks)
+        
+        status = await servicer.GetJobStatus(worker_pb2.JobRequest(job_id=job_id), None)
+        assert status.state == worker_pb2.JOB_SUCCEEDED
+        assert status.attempt == attempt
+    servicer.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_job_rpcs_report_unknown_and_disabled_jobs(tmp_path):
+    servicer = _servicer(tmp_path)
+    with pytest.raises(grpc.aio.AbortError, match="NOT_FOUND"):
+        await servicer.GetJobStatus(worker_pb2.JobRequest(job_id="missing"), None)
+    servicer.shutdown()
+    
+    servicer._jobs = None
+    with pytest.raises(grpc.aio.AbortError, match="FAILED_PRECONDITION"):
+        await servicer.SubmitJob(_audio_job(), None)
@@ -0,0 +1,87 @@
+"""Tests for worker metrics."""
+import asyncio
+
+import pytest
+
+from src.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    RPC_LATENCY,
+    TIME_TO_FIRST_CHUNK,
+    instrument_rpc,
+    start_http_server,
+)
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+def test_counter_and_gauge_render(registry):
+    requests = registry.register(Counter("test_requests_total", "Requests"))
+    depth = registry.register(Gauge("test_depth", "Depth"))
+    
+    requests.inc(rpc="A")
+    requests.inc(2, rpc="A")
+    depth.inc(model="bark")
+    depth.dec(model="bark")
+    
+    text = registry.render()
+    assert "# TYPE test_requests_total counter" in text
+    assert 'test_requests_total{rpc="A"} 3' in text
+    assert 'test_depth{model="bark"} 0' in text
+
+
+def test_histogram_buckets_are_cumulative(registry):
+    latency = registry.register(Histogram("test_latency_seconds", "Latency", (0.1, 1)))
+    
+    for value in (0.05, 0.5, 5):
+        latency.observe(value, stage="inference")
+    
+    text = registry.render()
+    assert 'test_latency_seconds_bucket{stage="inference",le="0.1"} 1' in text
+    assert 'test_latency_seconds_bucket{stage="inference",le="1"} 2' in text
+    assert 'test_latency_seconds_bucket{stage="inference",le="+Inf"} 3' in text
+    assert 'test_latency_seconds_count{stage="inference"} 3' in text
+
+
+@pytest.mark.asyncio
+async def test_instrument_rpc_records_stream_timings():
+    class Servicer:
+        @instrument_rpc
+        async def StreamThing(self, request, context):
+            for i in range(3):
+                await asyncio.sleep(0)
+                yield i
+        
+        @instrument_rpc
+        async def UnaryThing(self, request, context):
+            return "ok"
+    
+    servicer = Servicer()
+    
+    assert [i async for i in servicer.StreamThing(None, None)] == [0, 1, 2]
+    assert await servicer.UnaryThing(None, None) == "ok"
+    
+    assert TIME_TO_FIRST_CHUNK.count(rpc="StreamThing") == 1
+    assert RPC_LATENCY.count(rpc="StreamThing") == 1
+    assert RPC_LATENCY.count(rpc="UnaryThing") == 1
+
+
+@pytest.mark.asyncio
+async def test_http_endpoint_serves_metrics(registry):
+    registry.register(Counter("test_http_total", "Hits")).inc()
+    server = await start_http_server(0, registry)
+    port = server.sockets[0].getsockname()[1]
+    
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n")
+    response = await reader.read()
+    writer.close()
+    server.close()
+    
+    assert response.startswith(b"HTTP/1.1 200 OK")
+    assert b"test_http_total 1" in response
@@ -0,0 +1,54 @@
+"""Tests for the Standard MIDI File writer."""
+import pytest
+from music21 import midi
+
+from src.components.midi_writer import chord_pitches, render_progression
+
+SECTIONS = [
+    {"name": "intro", "duration_bars": 2, "energy_level": 0.3},
+    {"name": "chorus", "duration_bars": 2, "energy_level": 0.9},
+]
+
+
+def _note_ons(data: bytes) -> list:
+    mf = midi.MidiFile()
+    mf.readstr(data)
+    assert mf.format == 0 and len(mf.tracks) == 1
+    return [e for e in mf.tracks[0].events if e.type == midi.ChannelVoiceMessages.NOTE_ON and e.velocity]
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("C", (36, (48, 52, 55))),
+    ("Am", (45, (57, 60, 64))),
+    ("F#m7", (42, (54, 57, 61, 64))),
+    ("B-maj7", (46, (58, 62, 65, 69))),
+    ("Eb", (39, (51, 55, 58))),
+])
+def test_chord_pitches(name, expected):
+    assert chord_pitches(name) == expected
+
+
+def test_render_progression_maps_energy_to_density_and_velocity():
+    """Quiet sections sustain each chord; loud ones strike it every beat."""
+    data = render_progression(["C", "Am"], SECTIONS, tempo_bpm=90)
+    
+    notes = _note_ons(data)
+    quiet = [n for n in notes if n.velocity == 64]
+    loud = [n for n in notes if n.velocity == 112]
+    
+    assert len(quiet) == 2 * 4      # 2 bars x 1 hit x (bass + triad)
+    assert len(loud) == 2 * 4 * 4   # 2 bars x 4 hits x (bass + triad)
+    assert data[:4] == b"MThd"
+    assert b"\xff\x51\x03" + (60_000_000 // 90).to_bytes(3, "big") in data
+
+
+def test_render_progression_cycles_chords_per_bar():
+    data = render_progression(["C", "G"], [{"duration_bars": 3, "energy_level": 0.1}])
+    
+    bass = [n.pitch for n in _note_ons(data) if n.channel == 2]
+    
+    assert bass == [36, 43, 36]
+
+
+def test_render_progression_empty():
+    assert render_progression([], SECTIONS) == b""
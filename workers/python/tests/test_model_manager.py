@@ -0,0 +1,158 @@
+"""Tests for the model memory manager."""
+import threading
+
+import pytest
+
+from src.model_manager import ModelManager
+
+
+class FakeModel:
+    """CPU stand-in for a model wrapper with a known resident size."""
+    
+    def __init__(self, size: int):
+        self.size = size
+        self.loaded = False
+        self.loads = 0
+    
+    def load(self):
+        self.loaded = True
+        self.loads += 1
+    
+    def unload(self):
+        self.loaded = False
+    
+    def resident_bytes(self):
+        return self.size
+    
+    def generate(self, n):
+        for i in range(n):
+            yield i
+
+
+@pytest.fixture
+def models():
+    return {"musicgen": FakeModel(600), "bark": FakeModel(500), "demucs": FakeModel(100)}
+
+
+@pytest.fixture
+def manager(models):
+    manager = ModelManager(budget_bytes=1000)
+    for name, model in models.items():
+        manager.register(name, model, estimated_bytes=model.size)
+    return manager
+
+
+def test_loads_on_demand(manager, models):
+    """Models are loaded the first time they are acquired."""
+    assert manager.resident() == []
+    
+    with manager.acquire("demucs") as wrapper:
+        assert wrapper is models["demucs"]
+        assert wrapper.loaded
+    
+    assert manager.resident() == ["demucs"]
+    assert manager.resident_bytes() == 100
+
+
+def test_evicts_least_recently_used(manager, models):
+    """Loading past the budget unloads the least recently used idle model."""
+    manager.load("demucs")
+    manager.load("musicgen")
+    manager.load("demucs")  # demucs becomes most recently used
+    
+    manager.load("bark")  # 600 + 100 + 500 > 1000
+    
+    assert not models["musicgen"].loaded
+    assert sorted(manager.resident()) == ["bark", "demucs"]
+
+
+def test_reloads_after_eviction(manager, models):
+    """Evicted models are transparently reloaded when needed again."""
+    manager.load("musicgen")
+    manager.load("bark")
+    
+    assert list(manager.stream("musicgen", "generate", 3)) == [0, 1, 2]
+    assert models["musicgen"].loads == 2
+    assert not models["bark"].loaded
+
+
+def test_in_use_models_are_not_evicted(manager, models):
+    """A pinned model survives; the loader waits until it is released."""
+    acquired = threading.Event()
+    release = threading.Event()
+    
+    def hold_musicgen():
+        with manager.acquire("musicgen"):
+            acquired.set()
+            release.wait(5)
+    
+    holder = threading.Thread(target=hold_musicgen)
+    holder.start()
+    acquired.wait(5)
+    
+    loader = threading.Thread(target=manager.load, args=("bark",))
+    loader.start()
+    loader.join(0.1)
+    
+    assert loader.is_alive()
+    assert models["musicgen"].loaded
+    
+    release.set()
+    holder.join(5)
+    loader.join(5)
+    
+    assert manager.resident() == ["bark"]
+
+
+def test_concurrent_loads_reserve_their_estimate(manager, models):
+    """A load in progress counts against the budget before it finishes."""
+    loading = threading.Event()
+    release = threading.Event()
+    load_musicgen = models["musicgen"].load
+    
+    def slow_load():
+        loading.set()
+        release.wait(5)
+        load_musicgen()
+    
+    models["musicgen"].load = slow_load
+    holder = threading.Thread(target=manager.call, args=("musicgen", "resident_bytes"))
+    holder.start()
+    loading.wait(5)
+    
+    loader = threading.Thread(target=manager.load, args=("bark",))
+    loader.start()
+    loader.join(0.1)
+    
+    # 600 reserved + 500 would exceed the budget, so bark waits
+    assert loader.is_alive()
+    assert not models["bark"].loaded
+    
+    release.set()
+    holder.join(5)
+    loader.join(5)
+    
+    assert manager.resident() == ["bark"]
+
+
+def test_failed_load_releases_its_reservation(manager, models):
+    def broken_load():
+        raise RuntimeError("weights missing")
+    
+    models["musicgen"].load = broken_load
+    with pytest.raises(RuntimeError):
+        manager.load("musicgen")
+    
+    manager.load("bark")
+    manager.load("demucs")
+    
+    assert sorted(manager.resident()) == ["bark", "demucs"]
+
+
+def test_unlimited_budget_never_evicts(models):
+    manager = ModelManager(budget_bytes=0)
+    for name, model in models.items():
+        manager.register(name, model, model.size)
+        manager.load(name)
+    
+    assert sorted(manager.resident()) == ["bark", "demucs", "musicgen"]
@@ -0,0 +1,188 @@
+"""Tests for MusicGenWrapper streaming generation."""
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import torch
+from torch import nn
+
+from src.components.conditioning_cache import CachedTextConditioner
+from src.components.musicgen import MusicGenWrapper
+
+
+class FakeMusicGen:
+    """Stub model producing a continuous ramp so windows can be stitched exactly."""
+    
+    sample_rate = 100
+    
+    def __init__(self):
+        self.duration = 0
+        self.calls = []
+    
+    def set_generation_params(self, duration, **kwargs):
+        self.duration = duration
+    
+    def generate(self, descriptions, progress=False):
+        self.calls.append(("generate", self.duration))
+        n = int(self.duration * self.sample_rate)
+        return torch.arange(n, dtype=torch.float32).reshape(1, 1, n)
+    
+    def generate_continuation(self, prompt, prompt_sample_rate, descriptions, progress=False):
+        self.calls.append(("continuation", self.duration))
+        n = int(self.duration * self.sample_rate) - prompt.shape[-1]
+        start = prompt[..., -1].item() + 1
+        new = torch.arange(start, start + n, dtype=torch.float32).reshape(1, 1, n)
+        return torch.cat([prompt, new], dim=-1)
+
+
+@pytest.fixture
+def wrapper():
+    wrapper = MusicGenWrapper()
+    wrapper._model = FakeMusicGen()
+    wrapper._loaded = True
+    return wrapper
+
+
+def test_generate_streams_non_overlapping_windows(wrapper):
+    """Each window only generates new audio and chunks stitch back seamlessly."""
+    chunks = list(wrapper.generate("ambient pad", duration_seconds=35))
+    
+    audio = np.concatenate([c[0] for c in chunks], axis=-1)
+    np.testing.assert_allclose(audio[0], np.arange(35 * 100, dtype=np.float32))
+    
+    assert wrapper._model.calls == [
+        ("generate", 10),
+        ("continuation", 12),
+        ("continuation", 12),
+        ("continuation", 7),
+    ]
+
+
+def test_generate_progress_tracks_work_done(wrapper):
+    """Progress advances with produced audio and ends at 1.0."""
+    progress = [p for _, _, p in wrapper.generate("lofi beat", duration_seconds=25)]
+    
+    assert progress == pytest.approx([0.4, 0.8, 1.0])
+
+
+def test_generate_short_duration_single_window(wrapper):
+    """Durations within one window use a single generate call."""
+    chunks = list(wrapper.generate("drums", duration_seconds=5))
+    
+    assert len(chunks) == 1
+    assert chunks[0][0].shape[-1] == 500
+    assert wrapper._model.calls == [("generate", 5)]
+
+
+class RacyMusicGen(FakeMusicGen):
+    """Reads its generation params late, as a long forward pass would."""
+    
+    def generate(self, descriptions, progress=False):
+        time.sleep(0.02)
+        return super().generate(descriptions, progress)
+    
+    def generate_continuation(self, prompt, prompt_sample_rate, descriptions, progress=False):
+        time.sleep(0.02)
+        return super().generate_continuation(prompt, prompt_sample_rate, descriptions, progress)
+
+
+def test_concurrent_batches_keep_their_own_window_lengths(wrapper):
+    """Batches of different durations on two threads don't share generation params."""
+    wrapper._model = RacyMusicGen()
+    results = {}
+    
+    def run(duration):
+        chunks = list(wrapper.generate("ambient pad", duration_seconds=duration))
+        results[duration] = np.concatenate([c[0] for c in chunks], axis=-1)
+    
+    threads = [threading.Thread(target=run, args=(d,)) for d in (35, 15)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    
+    for duration, audio in results.items():
+        np.testing.assert_allclose(audio[0], np.arange(duration * 100, dtype=np.float32))
+
+
+class FakeT5Conditioner(nn.Module):
+    """Mimics audiocraft's T5Conditioner: padded batches, masked attention, empty rows masked."""
+    
+    def __init__(self):
+        super().__init__()
+        torch.manual_seed(0)
+        self.embed = nn.Embedding(64, 8)
+        self.proj = nn.Linear(8, 8)
+        self.encoded = 0
+    
+    def tokenize(self, texts):
+        entries = [t or "" for t in texts]
+        ids = [[sum(map(ord, w)) % 62 + 2 for w in t.split()] + [1] for t in entries]
+        longest = max(map(len, ids))
+        input_ids = torch.tensor([row + [0] * (longest - len(row)) for row in ids])
+        mask = (input_ids != 0).long()
+        mask[[i for i, t in enumerate(entries) if not t], :] = 0
+        return {"input_ids": input_ids, "attention_mask": mask}
+    
+    def forward(self, inputs):
+        self.encoded += inputs["input_ids"].shape[0]
+        mask = inputs["attention_mask"]
+        x = self.embed(inputs["input_ids"])
+        bias = (1 - mask[:, None, :].float()) * -1e9
+        embeds = self.proj(torch.softmax(x @ x.transpose(1, 2) + bias, dim=-1) @ x)
+        return embeds * mask.unsqueeze(-1), mask
+
+
+@pytest.fixture
+def conditioned():
+    t5 = FakeT5Conditioner()
+    wrapper = MusicGenWrapper()
+    wrapper._model = SimpleNamespace(lm=SimpleNamespace(
+        condition_provider=SimpleNamespace(conditioners=nn.ModuleDict({"description": t5}))
+    ))
+    wrapper._cache_conditioning()
+    return wrapper, t5, wrapper._model.lm.condition_provider.conditioners["description"]
+
+
+@torch.no_grad()
+def test_conditioning_cache_matches_uncached_encoder(conditioned):
+    wrapper, t5, cached = conditioned
+    assert isinstance(cached, CachedTextConditioner)
+    
+    batches = [
+        ["lofi beat, jazz style", "ambient pad, calm, soft, ambient", None, None],
+        ["ambient pad, calm, soft, ambient", "lofi beat, jazz style", None, None],
+        ["lofi beat, jazz style", "lofi beat, jazz style", "new prompt", None],
+    ]
+    encoded = []
+    for texts in batches:
+        before = t5.encoded
+        got = cached(cached.tokenize(texts))
+        encoded.append(t5.encoded - before)
+        want = t5(t5.tokenize(texts))
+        
+        for g, w in zip(got, want):
+            assert g.shape == w.shape and g.dtype == w.dtype
+            torch.testing.assert_close(g, w)
+    
+    # Each distinct description (including the empty CFG one) is encoded once
+    assert encoded == [3, 0, 1]
+    stats = wrapper.cache_stats()["musicgen_conditioning"]
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (5, 4, 4)
+    assert stats["bytes"] > 0
+
+
+def test_conditioning_cache_is_bounded_by_bytes(conditioned, monkeypatch):
+    wrapper, t5, cached = conditioned
+    cache = wrapper._conditioning_cache
+    entry = (torch.zeros(4, 8), torch.ones(4, dtype=torch.long))
+    monkeypatch.setattr(cache, "_max_bytes", 3 * (4 * 8 * 4 + 4 * 8))
+    
+    for i in range(5):
+        cache.put(("model", str(i)), entry)
+    
+    assert len(cache) == 3
+    assert cache.get(("model", "0")) is None
+    assert cache.get(("model", "4")) is entry
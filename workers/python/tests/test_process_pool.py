@@ -0,0 +1,132 @@
+"""Tests for the multi-process worker pool."""
+import asyncio
+import os
+import time
+
+import numpy as np
+import pytest
+
+from benchmarks.stubs import stub_models
+from src.cancellation import CancelToken, RequestCancelledError
+from src.components.musicgen import GenerationRequest
+from src.process_pool import WorkerCrashedError, WorkerPool, from_shared, to_shared
+
+
+def crashing_models() -> dict:
+    """Stub models plus one whose method kills the worker process."""
+    class Crasher:
+        estimated_bytes = 0
+        
+        def load(self):
+            pass
+        
+        def crash(self):
+            os._exit(3)
+    
+    return {**stub_models(0.0), "slow": stub_models(0.1)["musicgen"], "crasher": Crasher()}
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = WorkerPool(2, crashing_models)
+    pool.start()
+    yield pool
+    pool.shutdown()
+
+
+def test_shared_round_trip_preserves_structure():
+    stems = {"drums": np.arange(6, dtype=np.float32).reshape(2, 3), "bass": np.zeros(0, np.float32)}
+    value = (stems, 44100, [GenerationRequest("a")], iter([np.ones(2)]))
+    
+    restored = from_shared(to_shared(value))
+    
+    np.testing.assert_array_equal(restored[0]["drums"], stems["drums"])
+    assert restored[0]["bass"].shape == (0,)
+    assert restored[2] == [GenerationRequest("a")]
+    np.testing.assert_array_equal(restored[3][0], np.ones(2))
+
+
+@pytest.mark.asyncio
+async def test_stream_runs_in_worker_and_matches_local(pool):
+    requests = [GenerationRequest("ambient pad"), GenerationRequest("drum loop")]
+    local = list(stub_models(0.0)["musicgen"].generate_batch(requests, 3))
+    
+    remote = [chunk async for chunk in pool.stream("musicgen", "generate_batch", requests, 3)]
+    
+    assert len(remote) == len(local)
+    np.testing.assert_array_equal(remote[0][0], local[0][0])
+    assert {w["completed_requests"] for w in pool.stats()} >= {1}
+
+
+@pytest.mark.asyncio
+async def test_call_passes_audio_through_shared_memory(pool):
+    audio = np.random.default_rng(0).standard_normal((2, 44100)).astype(np.float32)
+    
+    stems = await pool.call("demucs", "separate", audio, 44100)
+    
+    np.testing.assert_allclose(stems["other"], audio, rtol=1e-6)
+
+
+@pytest.mark.asyncio
+async def test_iterator_arguments_are_pulled_as_the_worker_needs_them(pool):
+    sample_rate = 44100
+    audio = np.random.default_rng(1).standard_normal(60 * sample_rate).astype(np.float32)
+    pulled = []
+    
+    def blocks():
+        for start in range(0, len(audio), sample_rate):
+            pulled.append(start)
+            yield audio[start:start + sample_rate]
+    
+    stream = pool.stream("demucs", "separate_stream", blocks(), sample_rate, 1, total_samples=len(audio))
+    first = await stream.__anext__()
+    pulled_at_first = len(pulled)
+    rest = [item async for item in stream]
+    
+    # Only about one segment had been read when the first stems came back.
+    assert pulled_at_first < 20
+    assert len(pulled) == 60
+    drums = np.concatenate([item[0]["drums"] for item in [first, *rest]], axis=-1)
+    np.testing.assert_allclose(drums[0], audio * 0.25, rtol=1e-5, atol=1e-6)
+
+
+@pytest.mark.asyncio
+async def test_health_reports_per_process_load(pool):
+    from src.server import MusicWorkerServicer
+    
+    response = await MusicWorkerServicer(pool=pool).HealthCheck(None, None)
+    
+    assert [w.index for w in response.workers] == [0, 1]
+    assert all(w.alive and w.pid > 0 for w in response.workers)
+    assert "demucs" in response.models_loaded
+
+
+@pytest.mark.asyncio
+async def test_cancel_stops_the_job_inside_the_worker(pool):
+    cancel = CancelToken()
+    stream = pool.stream("slow", "generate_batch", [GenerationRequest("a")], 30, cancel=cancel)
+    consumer = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0.3)
+    
+    cancel.cancel()
+    with pytest.raises(RequestCancelledError):
+        await consumer
+    
+    # Both workers are free again long before the first 1s window would end.
+    started = time.monotonic()
+    audio = np.ones((2, 100), np.float32)
+    await asyncio.gather(*[pool.call("demucs", "separate", audio, 44100) for _ in range(2)])
+    assert time.monotonic() - started < 0.4
+    assert all(w["active_requests"] == 0 for w in pool.stats())
+
+
+@pytest.mark.asyncio
+async def test_crashed_worker_fails_its_job_and_restarts(pool):
+    with pytest.raises(WorkerCrashedError):
+        await pool.call("crasher", "crash")
+    
+    # The pool keeps serving on the surviving and restarted workers.
+    for _ in range(3):
+        stems = await pool.call("demucs", "separate", np.ones((2, 100), np.float32), 44100)
+        assert "drums" in stems
+    assert sum(w["restarts"] for w in pool.stats()) == 1
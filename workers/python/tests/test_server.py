@@ -34,6 +34,7 @@ async def test_generate_theory(servicer):
     servicer._theory.generate_sections.return_value = [
         {"name": "intro", "start_bar": 1, "duration_bars": 8, "energy_level": 0.3, "elements": ["pad"]}
     ]
+    servicer._theory.render_midi.return_value = b"MThd"
     
     # Call endpoint
     response = await servicer.GenerateTheory(request, None)
@@ -47,14 +48,244 @@ async def test_generate_theory(servicer):
     assert response.chord_progression[0] == "Cm"
     assert len(response.sections) == 1
     assert response.sections[0].name == "intro"
+    assert response.midi_data == b"MThd"
+
+@pytest.mark.asyncio
+async def test_generate_progressions_batches_keys_and_genres():
+    """Every requested key is paired with every genre, keys outermost."""
+    from src.components.theory_engine import TheoryEngine
+    from src.grpc_generated import worker_pb2
+    
+    servicer = MusicWorkerServicer(theory=TheoryEngine())
+    request = worker_pb2.ProgressionsRequest(keys=["C major", "A minor"], genres=["pop", "electronic"])
+    
+    response = await servicer.GenerateProgressions(request, None)
+    
+    assert [(p.key, p.genre) for p in response.progressions] == [
+        ("C major", "pop"), ("C major", "electronic"), ("A minor", "pop"), ("A minor", "electronic"),
+    ]
+    assert list(response.progressions[0].chords) == ["C", "G", "Am", "F"]
+    servicer.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_generate_progressions_rejects_unknown_keys():
+    """A key music21 can't parse is an INVALID_ARGUMENT, even without a context."""
+    import grpc
+    from src.components.theory_engine import TheoryEngine
+    from src.grpc_generated import worker_pb2
+    
+    servicer = MusicWorkerServicer(theory=TheoryEngine())
+    request = worker_pb2.ProgressionsRequest(keys=["H# lydian-ish"], genres=["pop"])
+    
+    with pytest.raises(grpc.aio.AbortError, match="INVALID_ARGUMENT"):
+        await servicer.GenerateProgressions(request, None)
+    servicer.shutdown()
 
 @pytest.mark.asyncio
 async def test_health_check(servicer):
     """Test health check endpoint."""
     request = MagicMock()
+    servicer._frameworks_imported = True
     
     # Mock torch
     with patch("torch.cuda.is_available", return_value=True):
         response = await servicer.HealthCheck(request, None)
         assert response.status == "healthy"
         assert response.gpu_available is True
+
+@pytest.mark.asyncio
+async def test_health_reports_warming_until_warm_up_completes(servicer, monkeypatch):
+    """Health is served before warmup and flips to ready once it finishes."""
+    monkeypatch.setattr("src.server._WARM_IMPORTS", ("json",))
+    
+    before = await servicer.HealthCheck(MagicMock(), None)
+    await servicer.warm_up(["bark"])
+    after = await servicer.HealthCheck(MagicMock(), None)
+    
+    assert before.readiness == "warming" and not before.gpu_available
+    assert after.readiness == "ready"
+    servicer._bark.load.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_synthesize_audio_streams_chunks(servicer):
+    """Test audio chunks are streamed from the MusicGen batcher."""
+    import numpy as np
+    
+    request = MagicMock()
+    request.prompt = "ambient pad"
+    request.duration_seconds = 20
+    request.genre = "ambient"
+    request.energy_level = 0.2
+    request.encoding = 0
+    request.priority = 0
+    request.artifact_format = 0
+    
+    servicer._musicgen.generate_batch.return_value = iter([
+        (np.zeros((1, 1, 100), dtype=np.float32), 32000, 0.5),
+        (np.zeros((1, 1, 100), dtype=np.float32), 32000, 1.0),
+    ])
+    
+    chunks = [c async for c in servicer.SynthesizeAudio(request, None)]
+    
+    # 200 samples at 32kHz arrive resampled to 44.1kHz
+    assert len(chunks) == 2
+    assert [c.sample_rate for c in chunks] == [44100, 44100]
+    assert sum(len(c.audio_data) for c in chunks) == 4 * 276
+    assert chunks[-1].is_final
+
+@pytest.mark.asyncio
+async def test_synthesize_vocals_replays_from_cache(servicer, tmp_path):
+    """Test identical vocal requests are served from the result cache."""
+    import numpy as np
+    from src.cache import ResultCache
+    
+    servicer._cache = ResultCache(str(tmp_path))
+    servicer._bark.model_id = "suno/bark"
+    servicer._bark.synthesize.side_effect = lambda **kwargs: iter([
+        (np.ones(50, dtype=np.float32), 24000, 1.0),
+    ])
+    
+    request = MagicMock()
+    request.lyrics = "Hello there."
+    request.voice_type = "female"
+    request.style = ""
+    request.encoding = 0
+    request.priority = 0
+    request.artifact_format = 0
+    
+    first = [c async for c in servicer.SynthesizeVocals(request, None)]
+    second = [c async for c in servicer.SynthesizeVocals(request, None)]
+    
+    assert servicer._bark.synthesize.call_count == 1
+    assert second == first
+    assert servicer._cache.stats()["hits"] == 1
+
+@pytest.mark.asyncio
+async def test_queued_vocals_stream_status_before_audio(servicer, tmp_path):
+    """Requests waiting for a model slot get queue status chunks, which are not cached."""
+    import numpy as np
+    from src.admission import AdmissionController
+    from src.cache import ResultCache
+    
+    servicer._cache = ResultCache(str(tmp_path))
+    servicer._admission = AdmissionController({"bark": 1})
+    servicer._bark.model_id = "suno/bark"
+    servicer._bark.synthesize.side_effect = lambda **kwargs: iter([
+        (np.ones(50, dtype=np.float32), 24000, 1.0),
+    ])
+    
+    request = MagicMock()
+    request.lyrics = "Hold the line."
+    request.voice_type = "female"
+    request.style = ""
+    request.encoding = 0
+    request.priority = 0
+    request.artifact_format = 0
+    
+    holder = servicer._admission.admit("bark")
+    stream = servicer.SynthesizeVocals(request, None)
+    status = await stream.__anext__()
+    holder.release()
+    rest = [c async for c in stream]
+    replay = [c async for c in servicer.SynthesizeVocals(request, None)]
+    
+    assert status.queue_position == 1 and not status.audio_data
+    assert [c.is_final for c in rest] == [True]
+    assert replay == rest
+
+
+@pytest.mark.asyncio
+async def test_client_disconnect_cancels_vocals_and_frees_slot(servicer):
+    """Ending the RPC cancels the running synthesis and releases its model slot."""
+    import numpy as np
+    from src.admission import AdmissionController
+    
+    servicer._admission = AdmissionController({"bark": 1})
+    tokens = []
+    
+    def synthesize(cancel=None, **kwargs):
+        tokens.append(cancel)
+        yield np.ones(50, dtype=np.float32), 24000, 0.5
+        yield np.ones(50, dtype=np.float32), 24000, 1.0
+    servicer._bark.synthesize.side_effect = synthesize
+    
+    request = MagicMock()
+    request.lyrics = "Hold the line. Never let go."
+    request.voice_type = "female"
+    request.style = ""
+    request.encoding = 0
+    request.priority = 0
+    request.artifact_format = 0
+    context = MagicMock()
+    context.time_remaining.return_value = None
+    done_callbacks = []
+    context.add_done_callback.side_effect = done_callbacks.append
+    
+    stream = servicer.SynthesizeVocals(request, context)
+    await stream.__anext__()
+    for callback in done_callbacks:
+        callback(context)
+    
+    assert tokens[0].cancelled
+    assert servicer._admission.stats()["bark"]["running"] == 0
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_separate_stems_upload_assembles_chunks(servicer):
+    """Test chunked uploads are reassembled before streaming separation."""
+    import numpy as np
+    from src.grpc_generated import worker_pb2
+    
+    audio = np.arange(1000, dtype=np.float32)
+    data = audio.tobytes()
+    received = []
+    
+    def fake_stream(blocks, sample_rate, channels, total_samples=None, cancel=None):
+        received.append(np.concatenate(list(blocks)))
+        yield {"drums": np.zeros((2, 10), dtype=np.float32)}, 44100, 1.0
+    
+    servicer._demucs.separate_stream.side_effect = fake_stream
+    
+    async def upload():
+        # Size hint deliberately short to exercise buffer growth
+        for i, start in enumerate(range(0, len(data), 1500)):
+            yield worker_pb2.StemUploadChunk(
+                audio_data=data[start:start + 1500],
+                sample_rate=100 if i == 0 else 0,
+                total_bytes=2000 if i == 0 else 0,
+            )
+    
+    chunks = [c async for c in servicer.SeparateStemsUpload(upload(), None)]
+    
+    np.testing.assert_array_equal(received[0], audio)
+    assert len(chunks) == 1
+    assert chunks[0].is_final
+    assert len(chunks[0].drums) == 80
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("declared", [0, 8 * 1024 * 1024])
+async def test_separate_stems_upload_rejects_uploads_over_the_limit(servicer, monkeypatch, declared):
+    """Test both the declared size and the bytes received are capped."""
+    import grpc
+    from src.config import get_settings
+    from src.grpc_generated import worker_pb2
+    
+    monkeypatch.setattr(get_settings(), "max_upload_mb", 1)
+    sent = []
+    
+    async def upload():
+        for i in range(4):
+            sent.append(i)
+            yield worker_pb2.StemUploadChunk(
+                audio_data=bytes(512 * 1024),
+                sample_rate=100 if i == 0 else 0,
+                total_bytes=declared if i == 0 else 0,
+            )
+    
+    with pytest.raises(grpc.aio.AbortError, match="RESOURCE_EXHAUSTED"):
+        [c async for c in servicer.SeparateStemsUpload(upload(), None)]
+    assert len(sent) == (1 if declared else 3)
+    servicer._demucs.separate_stream.assert_not_called()
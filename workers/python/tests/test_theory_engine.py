@@ -41,3 +41,21 @@ def test_generate_sections(engine):
     assert "duration_bars" in s
     assert "energy_level" in s
     assert "elements" in s
+
+def test_progressions_are_memoized(engine, monkeypatch):
+    """Each (root, mode, genre) is built with music21 only once."""
+    first = engine.generate_progression("D", "minor", "jazz")
+    first.append("mutated")
+    
+    monkeypatch.setattr(engine, "_build_progression", lambda *a: pytest.fail("rebuilt"))
+    again = engine.generate_progression("D", "Minor", "JAZZ")
+    
+    assert "mutated" not in again
+    assert len(again) == 4
+
+def test_generate_progressions_covers_every_combination(engine):
+    """Batch generation pairs every key with every genre."""
+    results = engine.generate_progressions([("C", "major"), ("A", "minor")], ["pop", "rock"])
+    
+    assert [(r[0], r[2]) for r in results] == [("C", "pop"), ("C", "rock"), ("A", "pop"), ("A", "rock")]
+    assert results[0][3] == engine.generate_progression("C", "major", "pop")